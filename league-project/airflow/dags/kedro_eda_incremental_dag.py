@@ -0,0 +1,45 @@
+"""
+DAG de Airflow para la EDA incremental semanal
+(Data Cleaning + Data Exploration solo de las partidas nuevas)
+"""
+
+from datetime import datetime, timedelta
+from airflow import DAG
+from airflow.operators.bash import BashOperator
+
+# Configuración por defecto
+default_args = {
+    'owner': 'league-ml-team',
+    'depends_on_past': False,
+    'email_on_failure': False,
+    'retries': 1,
+    'retry_delay': timedelta(minutes=2),
+    'start_date': datetime(2024, 1, 1),
+}
+
+# Runner para los pipelines con nodos independientes (ver kedro_eda_only_dag.py)
+PARALLEL_RUNNER = (
+    ' $([ "${KEDRO_PARALLEL_RUNNER:-1}" = 0 ]'
+    ' || echo --runner league_project.runners.BoundedParallelRunner)'
+)
+
+# DAG de EDA incremental: el estado (data/02_intermediate/eda_state.pkl)
+# guarda los agregados de las partidas ya procesadas
+dag = DAG(
+    'kedro_eda_incremental_pipeline',
+    default_args=default_args,
+    description='Pipeline de EDA incremental - Limpieza y Exploración de partidas nuevas',
+    schedule_interval='@weekly',  # Ejecutar semanalmente
+    catchup=False,
+    max_active_runs=1,  # Un solo run a la vez sobre el mismo estado
+    tags=['kedro', 'eda', 'exploration', 'incremental'],
+)
+
+# Task 1: Ejecutar pipeline de EDA incremental
+eda_incremental_task = BashOperator(
+    task_id='run_eda_incremental_pipeline',
+    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline eda_incremental' + PARALLEL_RUNNER,
+    dag=dag,
+)
+
+eda_incremental_task
@@ -17,6 +17,16 @@ default_args = {
     'start_date': datetime(2024, 1, 1),
 }
 
+# Runner para los pipelines con nodos independientes (limpieza y EDA).
+# KEDRO_PARALLEL_RUNNER=0 en el worker vuelve al runner secuencial (la shell
+# de la tarea lo lee al ejecutarse, no al parsear el DAG); la memoria
+# se acota con LEAGUE_MEMORY_BUDGET_MB / LEAGUE_WORKER_MEMORY_MB (ver
+# league_project/runners.py).
+PARALLEL_RUNNER = (
+    ' $([ "${KEDRO_PARALLEL_RUNNER:-1}" = 0 ]'
+    ' || echo --runner league_project.runners.BoundedParallelRunner)'
+)
+
 # DAG de EDA
 dag = DAG(
     'kedro_eda_pipeline',
@@ -30,7 +40,7 @@ dag = DAG(
 # Task 1: Ejecutar pipeline completo de EDA
 eda_task = BashOperator(
     task_id='run_eda_pipeline',
-    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline eda',
+    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline eda' + PARALLEL_RUNNER,
     dag=dag,
 )
 
@@ -20,6 +20,16 @@ default_args = {
     'start_date': datetime(2024, 1, 1),
 }
 
+# Runner para los pipelines con nodos independientes (limpieza y EDA).
+# KEDRO_PARALLEL_RUNNER=0 en el worker vuelve al runner secuencial (la shell
+# de la tarea lo lee al ejecutarse, no al parsear el DAG); la memoria
+# se acota con LEAGUE_MEMORY_BUDGET_MB / LEAGUE_WORKER_MEMORY_MB (ver
+# league_project/runners.py).
+PARALLEL_RUNNER = (
+    ' $([ "${KEDRO_PARALLEL_RUNNER:-1}" = 0 ]'
+    ' || echo --runner league_project.runners.BoundedParallelRunner)'
+)
+
 # Definir el DAG
 dag = DAG(
     'kedro_league_ml_pipeline',
@@ -37,18 +47,25 @@ dag = DAG(
 # Task 1: Data Cleaning
 data_cleaning_task = BashOperator(
     task_id='data_cleaning',
-    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline data_cleaning',
+    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline data_cleaning' + PARALLEL_RUNNER,
     dag=dag,
 )
 
 # Task 2: Data Exploration
 data_exploration_task = BashOperator(
     task_id='data_exploration',
-    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline data_exploration',
+    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline data_exploration' + PARALLEL_RUNNER,
+    dag=dag,
+)
+
+# Task 3: Event Parsing (listas serializadas → tablas de eventos)
+event_parsing_task = BashOperator(
+    task_id='event_parsing',
+    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline event_parsing',
     dag=dag,
 )
 
-# Task 3: Data Processing (Feature Engineering)
+# Task 3b: Data Processing (Feature Engineering)
 data_processing_task = BashOperator(
     task_id='data_processing',
     bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline data_processing',
@@ -97,7 +114,8 @@ final_report_task = PythonOperator(
 
 # Flujo lineal del pipeline
 data_cleaning_task >> data_exploration_task
-data_exploration_task >> data_processing_task
+data_exploration_task >> event_parsing_task
+event_parsing_task >> data_processing_task
 data_processing_task >> model_training_task
 model_training_task >> model_evaluation_task
 model_evaluation_task >> final_report_task
@@ -49,7 +49,10 @@ check_data_task = BranchPythonOperator(
 # Task: Procesar datos (si es necesario)
 process_data_task = BashOperator(
     task_id='process_data',
-    bash_command='cd /opt/airflow/kedro_project && python -m kedro run --pipeline data_processing',
+    bash_command=(
+        'cd /opt/airflow/kedro_project && python -m kedro run --pipeline event_parsing '
+        '&& python -m kedro run --pipeline data_processing'
+    ),
     dag=dag,
 )
 
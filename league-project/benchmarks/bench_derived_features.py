@@ -0,0 +1,84 @@
+"""
+Benchmark del Motor de Features Derivadas
+
+Compara el cálculo de KDA fila por fila (``df.apply(..., axis=1)``, la
+implementación anterior de ``clean_main_dataset``) contra el motor vectorizado
+``compute_derived_features`` sobre un DataFrame sintético.
+
+Uso:
+    python benchmarks/bench_derived_features.py [--rows 1000000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from league_project.pipelines.data_cleaning.derived_features import (
+    compute_derived_features,
+)
+
+KDA_SPEC = [
+    {
+        'name': 'kda',
+        'op': 'ratio',
+        'numerator': ['kills', 'assists'],
+        'denominator': ['deaths'],
+        'zero_division': 'numerator',
+    },
+]
+
+
+def generar_datos(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """Genera un DataFrame sintético con columnas kills/deaths/assists."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'kills': rng.integers(0, 20, n_rows),
+        'deaths': rng.integers(0, 15, n_rows),
+        'assists': rng.integers(0, 30, n_rows),
+    })
+
+
+def kda_por_fila(df: pd.DataFrame) -> pd.Series:
+    """Implementación anterior: lambda de Python por cada fila."""
+    return df.apply(
+        lambda row: (row['kills'] + row['assists']) if row['deaths'] == 0
+        else (row['kills'] + row['assists']) / row['deaths'],
+        axis=1
+    )
+
+
+def medir(func, df: pd.DataFrame) -> float:
+    inicio = time.perf_counter()
+    func(df)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = generar_datos(args.rows)
+
+    print("=" * 70)
+    print(f"BENCHMARK KDA: {args.rows:,} filas")
+    print("=" * 70)
+
+    t_vectorizado = medir(lambda d: compute_derived_features(d.copy(), KDA_SPEC), df)
+    t_por_fila = medir(kda_por_fila, df)
+
+    esperado = kda_por_fila(df.head(10_000)).to_numpy()
+    obtenido = compute_derived_features(df.head(10_000).copy(), KDA_SPEC)['kda'].to_numpy()
+    assert np.allclose(esperado, obtenido), "Los resultados no coinciden"
+
+    for nombre, segundos in [('apply (fila por fila)', t_por_fila),
+                             ('vectorizado (NumPy)', t_vectorizado)]:
+        print(f"{nombre:25s} {segundos:8.3f} s  {args.rows / segundos:>15,.0f} filas/s")
+
+    print(f"\nAceleración: {t_por_fila / t_vectorizado:,.0f}x")
+
+
+if __name__ == '__main__':
+    main()
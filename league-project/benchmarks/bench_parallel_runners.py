@@ -0,0 +1,76 @@
+"""
+Benchmark de Runners Paralelos
+
+Ejecuta los pipelines con nodos independientes (``data_cleaning`` y
+``data_exploration``) con el runner secuencial de Kedro y con los runners de
+memoria acotada de ``league_project.runners``, y reporta el tiempo total y la
+aceleración respecto del secuencial.
+
+Cada ejecución es un ``kedro run`` en un proceso nuevo, así que el tiempo
+incluye el arranque de Kedro (igual para todos los runners). Con ``--cold``
+se borra la caché de parseo de los CSV antes de cada ejecución.
+
+Uso (desde la raíz del proyecto, con los datos raw en data/01_raw):
+    python benchmarks/bench_parallel_runners.py [--pipelines data_cleaning data_exploration]
+        [--workers 4] [--repeat 1] [--cold]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+RUNNERS = [
+    ('SequentialRunner', 'secuencial'),
+    ('league_project.runners.BoundedThreadRunner', 'hilos'),
+    ('league_project.runners.BoundedParallelRunner', 'procesos'),
+]
+
+PARSE_CACHE = os.path.join('data', '02_intermediate', '.parse_cache')
+
+
+def ejecutar(pipeline: str, runner: str, workers: int, cold: bool) -> float:
+    """Ejecuta ``kedro run`` y devuelve el tiempo total en segundos."""
+    if cold:
+        shutil.rmtree(PARSE_CACHE, ignore_errors=True)
+
+    env = {**os.environ, 'LEAGUE_MAX_WORKERS': str(workers), 'KEDRO_DISABLE_TELEMETRY': '1'}
+    comando = [sys.executable, '-m', 'kedro', 'run', '--pipeline', pipeline, '--runner', runner]
+
+    inicio = time.perf_counter()
+    try:
+        subprocess.run(comando, env=env, capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError as error:
+        # Una ejecución fallida no tiene un tiempo válido: se aborta el benchmark
+        print(error.stdout[-2000:], error.stderr[-2000:], sep='\n')
+        raise SystemExit(f"Falló '{' '.join(comando)}' (código {error.returncode})") from error
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pipelines', nargs='+', default=['data_cleaning', 'data_exploration'])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--cold', action='store_true')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"BENCHMARK RUNNERS: {args.workers} workers, {os.cpu_count()} núcleos disponibles")
+    print("=" * 70)
+
+    for pipeline in args.pipelines:
+        print(f"\n{pipeline}")
+        tiempos = {}
+        for runner, nombre in RUNNERS:
+            tiempos[nombre] = min(
+                ejecutar(pipeline, runner, args.workers, args.cold) for _ in range(args.repeat)
+            )
+            aceleracion = tiempos['secuencial'] / tiempos[nombre]
+            print(f"  {nombre:12s} {tiempos[nombre]:8.2f} s  {aceleracion:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -20,10 +20,15 @@ print(f"\nColumnas: {list(df_clean.columns)}")
 print(f"\nEstadísticas descriptivas:")
 print(df_clean.describe())
 
+# División train/test: índices de fila de model_input_table
+with open('../data/04_feature/split_indices.pkl', 'rb') as f:
+    split_indices = pickle.load(f)
+feature_cols = [c for c in df_clean.columns if c not in ('gamelength', 'bResult', 'Year', 'Season')]
+
 # 2. DATOS DE ENTRENAMIENTO
 print("\n\n📊 2. DATOS DE ENTRENAMIENTO (X_train)")
 print("-"*80)
-X_train = pd.read_parquet('../data/04_feature/X_train.parquet')
+X_train = df_clean.iloc[split_indices['train']][feature_cols]
 print(f"Shape: {X_train.shape}")
 print(f"\nPrimeras 5 filas:")
 print(X_train.head())
@@ -31,7 +36,7 @@ print(X_train.head())
 # 3. DATOS DE TEST
 print("\n\n📊 3. DATOS DE TEST (X_test)")
 print("-"*80)
-X_test = pd.read_parquet('../data/04_feature/X_test.parquet')
+X_test = df_clean.iloc[split_indices['test']][feature_cols]
 print(f"Shape: {X_test.shape}")
 print(f"\nPrimeras 5 filas:")
 print(X_test.head())
@@ -39,8 +44,7 @@ print(X_test.head())
 # 4. TARGETS DE REGRESIÓN
 print("\n\n🎯 4. TARGETS DE REGRESIÓN (gamelength)")
 print("-"*80)
-with open('../data/04_feature/y_reg_train.pkl', 'rb') as f:
-    y_reg_train = pickle.load(f)
+y_reg_train = df_clean['gamelength'].iloc[split_indices['train']]
 print(f"Train - Shape: {y_reg_train.shape}")
 print(f"Train - Primeros 10 valores: {y_reg_train.head(10).values}")
 print(f"Train - Estadísticas: Min={y_reg_train.min():.1f}, Max={y_reg_train.max():.1f}, Media={y_reg_train.mean():.1f}")
@@ -48,8 +52,7 @@ print(f"Train - Estadísticas: Min={y_reg_train.min():.1f}, Max={y_reg_train.max
 # 5. TARGETS DE CLASIFICACIÓN
 print("\n\n🎯 5. TARGETS DE CLASIFICACIÓN (bResult)")
 print("-"*80)
-with open('../data/04_feature/y_cls_train.pkl', 'rb') as f:
-    y_cls_train = pickle.load(f)
+y_cls_train = df_clean['bResult'].iloc[split_indices['train']]
 print(f"Train - Shape: {y_cls_train.shape}")
 print(f"Train - Distribución:")
 print(y_cls_train.value_counts())
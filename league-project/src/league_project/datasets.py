@@ -0,0 +1,639 @@
+"""
+Datasets personalizados del proyecto.
+
+Se referencian desde el catálogo con su ruta completa, por ejemplo::
+
+    intermediate_bans:
+      type: league_project.datasets.ChunkedParquetDataset
+      filepath: data/02_intermediate/bans_clean.parquet
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from contextlib import contextmanager
+from copy import deepcopy
+from pathlib import PurePosixPath
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+
+try:  # no disponible en Windows: ahí la caché de parseo no usa lock
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+import fsspec
+import numpy as np
+import pandas as pd
+from kedro.io.core import (
+    AbstractDataset,
+    DatasetError,
+    get_filepath_str,
+    get_protocol_and_path,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedParquetDataset(AbstractDataset[pd.DataFrame, Union[pd.DataFrame, Iterable[pd.DataFrame]]]):
+    """
+    Dataset Parquet tipado que acepta un DataFrame completo o un iterable de chunks.
+
+    Cuando recibe chunks, cada uno se escribe como un row group nuevo con un
+    ``ParquetWriter`` abierto durante toda la escritura, así la memoria usada
+    al guardar queda acotada por el tamaño del chunk y no por el dataset.
+    El esquema del archivo se toma del primer chunk no vacío.
+
+    ``schema`` declara el tipo pandas de columnas conocidas (``int32``,
+    ``float32``, ``category``, ``datetime64[ns]``...). Se aplica a cada
+    DataFrame o chunk antes de escribir, de modo que el archivo conserva los
+    mismos tipos entre ejecuciones y entre chunks.
+
+    ``load_args`` se pasan a ``pandas.read_parquet``:
+
+    - ``columns``: proyección; solo se leen esas columnas del archivo (las que
+      no existen se omiten con una advertencia)
+    - ``filters``: predicados que pyarrow evalúa por row group antes de
+      decodificar, p. ej. ``[[year, '==', 2017], [league, '==', NALCS]]``
+    """
+
+    DEFAULT_LOAD_ARGS: Dict[str, Any] = {}
+    DEFAULT_SAVE_ARGS: Dict[str, Any] = {}
+
+    def __init__(
+        self,
+        filepath: str,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+        credentials: Optional[Dict[str, Any]] = None,
+        fs_args: Optional[Dict[str, Any]] = None,
+        schema: Optional[Dict[str, str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        _fs_args = deepcopy(fs_args or {})
+        protocol, path = get_protocol_and_path(filepath)
+        if protocol == "file":
+            _fs_args.setdefault("auto_mkdir", True)
+
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs = fsspec.filesystem(protocol, **{**(credentials or {}), **_fs_args})
+        self._load_args = {**self.DEFAULT_LOAD_ARGS, **(load_args or {})}
+        self._save_args = {**self.DEFAULT_SAVE_ARGS, **(save_args or {})}
+        self._schema = dict(schema or {})
+        self.metadata = metadata
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            "filepath": self._filepath,
+            "protocol": self._protocol,
+            "load_args": self._load_args,
+            "save_args": self._save_args,
+            "schema": self._schema,
+        }
+
+    def load(self) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        load_args = dict(self._load_args)
+
+        with self._fs.open(load_path, mode="rb") as fs_file:
+            if load_args.get("columns") is not None:
+                available = set(pq.read_schema(fs_file).names)
+                missing = [col for col in load_args["columns"] if col not in available]
+                if missing:
+                    logger.warning(f"Columnas no encontradas en {self._filepath}: {missing}")
+                load_args["columns"] = [col for col in load_args["columns"] if col in available]
+                fs_file.seek(0)
+
+            if load_args.get("filters") is not None:
+                # YAML entrega listas; pyarrow espera tuplas (columna, operador, valor)
+                load_args["filters"] = _as_filter_tuples(load_args["filters"])
+
+            return pd.read_parquet(fs_file, **load_args)
+
+    def save(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
+        save_path = get_filepath_str(self._filepath, self._protocol)
+
+        with self._fs.open(save_path, mode="wb") as fs_file:
+            if isinstance(data, pd.DataFrame):
+                self._apply_schema(data).to_parquet(fs_file, index=False, **self._save_args)
+            else:
+                self._write_chunks(fs_file, data)
+
+        self._fs.invalidate_cache(save_path)
+
+    def _write_chunks(self, fs_file: Any, chunks: Iterable[pd.DataFrame]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        empty_template = None
+        total_rows = 0
+        try:
+            for chunk in chunks:
+                chunk = self._apply_schema(chunk)
+                if chunk.empty:
+                    if empty_template is None:
+                        empty_template = chunk
+                    continue
+                if writer is None:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    schema = _writer_schema(table.schema)
+                    writer = pq.ParquetWriter(fs_file, schema, **self._save_args)
+                try:
+                    table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+                    raise DatasetError(
+                        f"El chunk no es compatible con el esquema de {self._filepath}: {exc}"
+                    ) from exc
+                writer.write_table(table)
+                total_rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            # Stream sin filas: se escribe un archivo vacío con las columnas conocidas
+            empty = empty_template if empty_template is not None else pd.DataFrame()
+            empty.to_parquet(fs_file, index=False, **self._save_args)
+
+        logger.info(f"Escritas {total_rows} filas en {self._filepath} por chunks")
+
+    def _apply_schema(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convierte las columnas declaradas en ``schema`` a su tipo."""
+        if not self._schema or len(df.columns) == 0:
+            return df
+
+        missing = [col for col in self._schema if col not in df.columns]
+        if missing:
+            raise DatasetError(f"Columnas del esquema ausentes al guardar {self._filepath}: {missing}")
+
+        # Una columna de texto sin valores llega como float (NaN); se pasa a
+        # object para que su categoría sea de texto como en los demás chunks
+        all_null = [
+            col for col, dtype in self._schema.items()
+            if dtype == "category" and df[col].dtype != object and df[col].isna().all()
+        ]
+        if all_null:
+            df = df.astype({col: object for col in all_null})
+
+        try:
+            return df.astype(self._schema, copy=False)
+        except (TypeError, ValueError) as exc:
+            raise DatasetError(f"Los datos no cumplen el esquema de {self._filepath}: {exc}") from exc
+
+    def _exists(self) -> bool:
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+
+class SharedCSVDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """
+    Dataset CSV de solo lectura que parsea cada archivo una vez.
+
+    Varias entradas del catálogo apuntan al mismo archivo (``raw_matchinfo`` y
+    ``matchinfo``) y un mismo dataset alimenta a varios nodos
+    (``raw_main_data``). Con este dataset el archivo se parsea una vez y todos
+    los consumidores reciben una copia superficial del mismo DataFrame: pueden
+    agregar o quitar columnas, pero no deben modificar valores en el lugar.
+
+    Hay dos niveles de caché, ambos con la clave (ruta, tamaño, mtime,
+    ``load_args``), así que se invalidan solos cuando el archivo cambia:
+
+    - En memoria, compartida entre entradas del catálogo. El DataFrame se
+      libera cuando el runner libera todas las entradas que lo cargaron.
+    - En disco (``cache_dir``), un pickle del DataFrame parseado que
+      sobrevive entre ejecuciones; las versiones viejas se borran. También
+      sirve entre procesos (``ParallelRunner``): el parseo y la escritura del
+      pickle se hacen bajo un lock de archivo y la escritura es atómica.
+
+    Con ``chunksize`` en ``load_args`` el archivo se lee por chunks sin caché.
+    """
+
+    _frames: Dict[Tuple[Any, ...], pd.DataFrame] = {}
+    _holders: Dict[Tuple[Any, ...], Set[int]] = {}
+
+    def __init__(
+        self,
+        filepath: str,
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[str] = None,
+        credentials: Optional[Dict[str, Any]] = None,
+        fs_args: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        _fs_args = deepcopy(fs_args or {})
+        protocol, path = get_protocol_and_path(filepath)
+        if protocol == "file":
+            _fs_args.setdefault("auto_mkdir", True)
+
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs = fsspec.filesystem(protocol, **{**(credentials or {}), **_fs_args})
+        self._load_args = dict(load_args or {})
+        self._save_args = {"index": False, **(save_args or {})}
+        self._cache_dir = PurePosixPath(cache_dir) if cache_dir else None
+        self._cache_fs = fsspec.filesystem("file", auto_mkdir=True)
+        self._key: Optional[Tuple[Any, ...]] = None
+        self.metadata = metadata
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            "filepath": self._filepath,
+            "protocol": self._protocol,
+            "load_args": self._load_args,
+            "cache_dir": self._cache_dir,
+        }
+
+    def load(self) -> pd.DataFrame:
+        load_path = get_filepath_str(self._filepath, self._protocol)
+
+        if self._load_args.get("chunksize"):
+            return self._read_chunks(load_path)
+
+        key = self._cache_key(load_path)
+        frame = self._frames.get(key)
+
+        if frame is None:
+            # Con ParallelRunner cada proceso tiene su propia caché en memoria;
+            # el lock hace que solo un proceso parsee y los demás lean el pickle
+            with self._disk_cache_lock():
+                frame = self._load_from_disk_cache(key)
+                if frame is None:
+                    with self._fs.open(load_path, mode="rb") as fs_file:
+                        frame = pd.read_csv(fs_file, **self._load_args)
+                    logger.info(f"Parseado {self._filepath}: {frame.shape[0]} filas")
+                    self._save_to_disk_cache(key, frame)
+            self._frames[key] = frame
+
+        if self._key != key:
+            self._release()
+            self._key = key
+            self._holders.setdefault(key, set()).add(id(self))
+
+        return frame.copy(deep=False)
+
+    def _read_chunks(self, load_path: str) -> Iterator[pd.DataFrame]:
+        """Chunks del CSV; el archivo se cierra al agotar o descartar el iterador."""
+        with self._fs.open(load_path, mode="rb") as fs_file:
+            with pd.read_csv(fs_file, **self._load_args) as reader:
+                yield from reader
+
+    def save(self, data: pd.DataFrame) -> None:
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(save_path, mode="wb") as fs_file:
+            data.to_csv(fs_file, **self._save_args)
+        self._fs.invalidate_cache(save_path)
+
+    def _exists(self) -> bool:
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+    def _release(self) -> None:
+        if self._key is None:
+            return
+        holders = self._holders.get(self._key, set())
+        holders.discard(id(self))
+        if not holders:
+            self._holders.pop(self._key, None)
+            self._frames.pop(self._key, None)
+        self._key = None
+
+    def _cache_key(self, load_path: str) -> Tuple[Any, ...]:
+        info = self._fs.info(load_path)
+        return (self._protocol, load_path, info.get("size"), info.get("mtime"), self._cache_key_args())
+
+    def _cache_prefix(self) -> str:
+        """Prefijo por archivo y ``load_args``; la versión va en el sufijo."""
+        source = repr((self._protocol, str(self._filepath), self._cache_key_args()))
+        return f"{self._filepath.stem}-{hashlib.sha1(source.encode()).hexdigest()[:8]}"
+
+    def _cache_key_args(self) -> str:
+        return json.dumps(self._load_args, sort_keys=True, default=str)
+
+    def _cache_file(self, key: Tuple[Any, ...]) -> Optional[str]:
+        if self._cache_dir is None:
+            return None
+        version = hashlib.sha1(repr(key).encode()).hexdigest()[:12]
+        return str(self._cache_dir / f"{self._cache_prefix()}-{version}.pkl")
+
+    @contextmanager
+    def _disk_cache_lock(self) -> Iterator[None]:
+        """Lock exclusivo entre procesos por archivo y ``load_args``."""
+        if self._cache_dir is None or fcntl is None:
+            yield
+            return
+        lock_file = str(self._cache_dir / f"{self._cache_prefix()}.lock")
+        with self._cache_fs.open(lock_file, mode="ab") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _load_from_disk_cache(self, key: Tuple[Any, ...]) -> Optional[pd.DataFrame]:
+        cache_file = self._cache_file(key)
+        if cache_file is None or not self._cache_fs.exists(cache_file):
+            return None
+        try:
+            with self._cache_fs.open(cache_file, mode="rb") as f:
+                frame = pickle.load(f)
+        except Exception as exc:  # caché corrupta o de otra versión de pandas
+            logger.warning(f"No se pudo leer la caché {cache_file}: {exc}")
+            return None
+        logger.info(f"Cargado {self._filepath} desde la caché de parseo")
+        return frame
+
+    def _save_to_disk_cache(self, key: Tuple[Any, ...], frame: pd.DataFrame) -> None:
+        cache_file = self._cache_file(key)
+        if cache_file is None:
+            return
+        # Se borran las versiones anteriores del mismo archivo
+        for old in self._cache_fs.glob(str(self._cache_dir / f"{self._cache_prefix()}-*.pkl")):
+            self._cache_fs.rm(old)
+        # Escritura atómica: un lector nunca ve un pickle a medio escribir
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with self._cache_fs.open(tmp_file, mode="wb") as f:
+            pickle.dump(frame, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._cache_fs.mv(tmp_file, cache_file)
+
+
+class PickleStateDataset(AbstractDataset[Any, Any]):
+    """
+    Estado de un nodo incremental que se conserva entre ejecuciones.
+
+    Kedro no permite que un nodo lea y escriba el mismo dataset, así que el
+    catálogo declara dos entradas con el mismo ``filepath``: una de entrada
+    (estado de la ejecución anterior) y otra de salida (estado nuevo)::
+
+        data_quality_profiles_previous:
+          type: league_project.datasets.PickleStateDataset
+          filepath: data/02_intermediate/data_quality_profiles.pkl
+
+        data_quality_profiles:
+          type: league_project.datasets.PickleStateDataset
+          filepath: data/02_intermediate/data_quality_profiles.pkl
+
+    Si el archivo no existe (primera ejecución) o no se puede leer, ``load``
+    devuelve una copia de ``default`` (por defecto un diccionario vacío), de
+    modo que el nodo simplemente recalcula todo.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        default: Any = None,
+        credentials: Optional[Dict[str, Any]] = None,
+        fs_args: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        _fs_args = deepcopy(fs_args or {})
+        protocol, path = get_protocol_and_path(filepath)
+        if protocol == "file":
+            _fs_args.setdefault("auto_mkdir", True)
+
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs = fsspec.filesystem(protocol, **{**(credentials or {}), **_fs_args})
+        self._default = {} if default is None else default
+        self.metadata = metadata
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"filepath": self._filepath, "protocol": self._protocol}
+
+    def load(self) -> Any:
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        if not self._fs.exists(load_path):
+            return deepcopy(self._default)
+        try:
+            with self._fs.open(load_path, mode="rb") as fs_file:
+                return pickle.load(fs_file)
+        except Exception as exc:  # estado corrupto o de otra versión de pandas
+            logger.warning(f"No se pudo leer el estado {self._filepath}: {exc}")
+            return deepcopy(self._default)
+
+    def save(self, data: Any) -> None:
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        # Escritura atómica: si el proceso muere a mitad de la escritura queda
+        # el estado anterior completo, no un pickle truncado (en disco local el
+        # ``mv`` es un ``rename`` que reemplaza el archivo)
+        tmp_path = f"{save_path}.{os.getpid()}.tmp"
+        try:
+            with self._fs.open(tmp_path, mode="wb") as fs_file:
+                pickle.dump(data, fs_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            if self._fs.exists(tmp_path):
+                self._fs.rm(tmp_path)
+            raise
+        self._fs.mv(tmp_path, save_path)
+        self._fs.invalidate_cache(save_path)
+
+    def _exists(self) -> bool:
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+
+class FeatureStoreDataset(AbstractDataset[pd.DataFrame, Dict[str, Any]]):
+    """
+    Feature store por partida: Parquet particionado con un manifiesto.
+
+    Cada ``save`` agrega una partición (``part-<n>.parquet``) con las filas de
+    las partidas recién calculadas y reescribe ``manifest.json``, que lista las
+    particiones vigentes con la definición de features con que se calcularon.
+    ``load`` lee solo las particiones del manifiesto, así que un archivo
+    escrito por una ejecución que falló antes de actualizarlo se ignora (y se
+    sobrescribe en la siguiente).
+
+    ``save`` recibe ``{'definition': str, 'features': DataFrame, 'evict':
+    claves}``. Las filas se guardan con la columna ``feature_definition``; las
+    particiones de otra definición se descartan (y se borran) al guardar: el
+    nodo que planifica la actualización las trata como faltantes y las
+    recalcula en la misma ejecución. Las filas viejas de las claves
+    recalculadas y las de ``evict`` se quitan: cada partición afectada se
+    reescribe como una partición nueva sin esas filas, así que cada clave
+    aparece una sola vez en el store. Igual que ``PickleStateDataset``, el
+    catálogo declara dos entradas con el mismo ``path``::
+
+        feature_store_previous:
+          type: league_project.datasets.FeatureStoreDataset
+          path: data/04_feature/feature_store
+          load_args:
+            columns: [game_key, feature_definition, input_hash]
+
+        feature_store:
+          type: league_project.datasets.FeatureStoreDataset
+          path: data/04_feature/feature_store
+
+    ``load_args`` se pasan a ``pandas.read_parquet`` de cada partición
+    (``columns`` lee solo esas columnas; las que una partición no tiene quedan
+    vacías). Sin manifiesto (primera ejecución) ``load`` devuelve un DataFrame
+    vacío con ``columns`` o, sin ellas, ``key`` y ``feature_definition``.
+    """
+
+    MANIFEST = "manifest.json"
+    DEFINITION_COLUMN = "feature_definition"
+
+    def __init__(
+        self,
+        path: str,
+        key: str = "game_key",
+        load_args: Optional[Dict[str, Any]] = None,
+        save_args: Optional[Dict[str, Any]] = None,
+        credentials: Optional[Dict[str, Any]] = None,
+        fs_args: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        _fs_args = deepcopy(fs_args or {})
+        protocol, _path = get_protocol_and_path(path)
+        if protocol == "file":
+            _fs_args.setdefault("auto_mkdir", True)
+
+        self._protocol = protocol
+        self._path = PurePosixPath(_path)
+        self._fs = fsspec.filesystem(protocol, **{**(credentials or {}), **_fs_args})
+        self._key = key
+        self._load_args = dict(load_args or {})
+        self._save_args = dict(save_args or {})
+        self.metadata = metadata
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            "path": self._path,
+            "protocol": self._protocol,
+            "key": self._key,
+            "load_args": self._load_args,
+            "save_args": self._save_args,
+        }
+
+    def _file(self, name: str) -> str:
+        return get_filepath_str(self._path / name, self._protocol)
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        manifest_path = self._file(self.MANIFEST)
+        if not self._fs.exists(manifest_path):
+            return {"definition": None, "next_partition": 0, "partitions": []}
+        with self._fs.open(manifest_path, mode="r") as f:
+            return json.load(f)
+
+    def _read_partition(self, partition: Dict[str, Any], **load_args: Any) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+
+        with self._fs.open(self._file(partition["file"]), mode="rb") as fs_file:
+            columns = load_args.pop("columns", None)
+            if columns is None:
+                return pd.read_parquet(fs_file, **load_args)
+            available = set(pq.read_schema(fs_file).names)
+            fs_file.seek(0)
+            frame = pd.read_parquet(fs_file, columns=[c for c in columns if c in available], **load_args)
+            return frame.reindex(columns=columns)
+
+    def _write_partition(self, frame: pd.DataFrame, definition: str, number: int) -> Dict[str, Any]:
+        name = f"part-{number:06d}.parquet"
+        with self._fs.open(self._file(name), mode="wb") as fs_file:
+            frame.assign(**{self.DEFINITION_COLUMN: definition}).to_parquet(
+                fs_file, index=False, **self._save_args
+            )
+        return {
+            "file": name,
+            "definition": definition,
+            "rows": len(frame),
+            "min_key": int(frame[self._key].min()),
+            "max_key": int(frame[self._key].max()),
+            "created_at": pd.Timestamp.now(tz="UTC").isoformat(),
+        }
+
+    def load(self) -> pd.DataFrame:
+        partitions = self._read_manifest()["partitions"]
+        if not partitions:
+            columns = self._load_args.get("columns") or [self._key, self.DEFINITION_COLUMN]
+            return pd.DataFrame(columns=columns)
+
+        frames = [self._read_partition(partition, **self._load_args) for partition in partitions]
+        return pd.concat(frames, ignore_index=True)
+
+    def save(self, data: Dict[str, Any]) -> None:
+        definition = data["definition"]
+        features = data["features"]
+        if self._key not in features.columns:
+            raise DatasetError(f"Las features para {self._path} no tienen la columna '{self._key}'")
+        replaced = np.union1d(features[self._key].to_numpy(), np.asarray(data.get("evict", []), dtype=np.int64))
+
+        manifest = self._read_manifest()
+        kept = [p for p in manifest["partitions"] if p["definition"] == definition]
+        removed = [p for p in manifest["partitions"] if p["definition"] != definition]
+        stale = len(removed)
+        next_partition = manifest["next_partition"]
+
+        # Particiones con filas de claves recalculadas o eliminadas: se
+        # reescriben sin esas filas
+        dropped_rows = 0
+        for partition in list(kept):
+            keys = self._read_partition(partition, columns=[self._key])[self._key].to_numpy()
+            affected = np.isin(keys, replaced)
+            if not affected.any():
+                continue
+            kept.remove(partition)
+            removed.append(partition)
+            dropped_rows += int(affected.sum())
+            remaining = self._read_partition(partition)[~affected]
+            if not remaining.empty:
+                kept.append(self._write_partition(remaining, definition, next_partition))
+                next_partition += 1
+
+        if not features.empty:
+            kept.append(self._write_partition(features, definition, next_partition))
+            next_partition += 1
+
+        # Escritura atómica del manifiesto: un lector ve el estado anterior o
+        # el nuevo completo, nunca una partición a medio escribir
+        manifest_path = self._file(self.MANIFEST)
+        tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with self._fs.open(tmp_path, mode="w") as f:
+            json.dump({"definition": definition, "next_partition": next_partition, "partitions": kept}, f, indent=2)
+        self._fs.mv(tmp_path, manifest_path)
+        self._fs.invalidate_cache(str(self._path))
+
+        for partition in removed:
+            removed_path = self._file(partition["file"])
+            if self._fs.exists(removed_path):
+                self._fs.rm(removed_path)
+
+        logger.info(
+            f"Feature store {self._path}: +{len(features)} partidas, -{dropped_rows} filas reemplazadas "
+            f"o eliminadas, {sum(p['rows'] for p in kept)} en {len(kept)} particiones"
+            + (f" ({stale} particiones de otra definición descartadas)" if stale else "")
+        )
+
+    def _exists(self) -> bool:
+        return self._fs.exists(self._file(self.MANIFEST))
+
+
+def _writer_schema(schema: Any) -> Any:
+    """
+    Esquema del ``ParquetWriter`` a partir del primer chunk.
+
+    Las columnas sin valores en el primer chunk se guardan como texto y los
+    índices de las categorías se amplían a int32, porque un chunk posterior
+    puede tener más categorías que las que caben en el índice del primero.
+    """
+    import pyarrow as pa
+
+    fields = []
+    for field in schema:
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        elif pa.types.is_dictionary(field.type):
+            value_type = field.type.value_type
+            if pa.types.is_null(value_type):
+                value_type = pa.string()
+            field = field.with_type(pa.dictionary(pa.int32(), value_type, field.type.ordered))
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _as_filter_tuples(filters: Any) -> Any:
+    """Convierte filtros anidados en listas (YAML) al formato de tuplas de pyarrow."""
+    if isinstance(filters, (list, tuple)) and len(filters) == 3 and isinstance(filters[0], str):
+        return tuple(filters)
+    return [_as_filter_tuples(item) for item in filters]
@@ -0,0 +1,182 @@
+"""
+Claves enteras de partida (game keys).
+
+Cada partida se identifica en los datos raw por ``Address``, la URL del
+historial de partida (~100 caracteres). Los joins y agrupaciones sobre esa
+columna comparan textos largos, por lo que durante la limpieza se construye
+una sola vez un diccionario ``address → game_key`` y todos los datasets
+intermedios guardan solo la clave entera. La URL queda únicamente en la tabla
+de búsqueda ``game_keys``.
+
+La clave es un hash de 63 bits de la URL (``blake2b``), no una posición: una
+partida tiene la misma clave en todas las ejecuciones aunque los archivos raw
+se reordenen o reciban partidas al principio, así que se puede persistir entre
+ejecuciones (estado de la EDA incremental, feature store). Dos URLs con la
+misma clave detienen la construcción del diccionario.
+"""
+
+import hashlib
+import logging
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+GAME_KEY = 'game_key'
+ADDRESS = 'address'
+# Clave de las filas sin URL (no identifican ninguna partida)
+UNKNOWN_GAME_KEY = -1
+
+
+def address_keys(addresses: Iterable[str]) -> np.ndarray:
+    """Clave estable (int64 no negativo) de cada URL."""
+    return np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(address.encode(), digest_size=8).digest(), 'big') >> 1
+            for address in addresses
+        ),
+        dtype=np.int64,
+    )
+
+
+def build_game_key_index(*address_columns: pd.Series) -> pd.DataFrame:
+    """
+    Construye la tabla de búsqueda de claves de partida.
+
+    Las filas quedan en orden de primera aparición; la clave de cada URL no
+    depende de ese orden (``address_keys``).
+
+    Args:
+        *address_columns: Columnas con las URLs de partida
+
+    Returns:
+        DataFrame con ``game_key`` (int64) y ``address``
+
+    Raises:
+        ValueError: Si dos URLs distintas tienen la misma clave
+    """
+    addresses = pd.concat([col.dropna().astype(str) for col in address_columns], ignore_index=True)
+    uniques = pd.unique(addresses)
+    keys = address_keys(uniques)
+
+    if len(np.unique(keys)) < len(keys):
+        raise ValueError("Colisión de claves de partida: dos URLs distintas tienen el mismo hash")
+
+    return pd.DataFrame({
+        GAME_KEY: keys,
+        ADDRESS: uniques,
+    })
+
+
+def encode_game_keys(
+    df: pd.DataFrame,
+    game_keys: pd.DataFrame,
+    column: str = ADDRESS,
+    dataset_name: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Reemplaza la columna de URLs por la clave entera de partida.
+
+    La columna se factoriza primero, así que la clave se calcula una vez por
+    partida y no una vez por fila (p. ej. por kill). Una URL que no está en
+    ``game_keys`` recibe igual su propia clave (con una advertencia: su URL no
+    se podrá decodificar); las filas sin URL reciben ``-1``.
+
+    Args:
+        df: DataFrame con la columna de URLs
+        game_keys: Tabla de búsqueda (``build_game_key_index``)
+        column: Nombre de la columna de URLs (``address`` o ``Address``)
+        dataset_name: Nombre del dataset (solo para el log)
+
+    Returns:
+        DataFrame con ``game_key`` como primera columna y sin ``column``
+    """
+    if column not in df.columns:
+        return df
+
+    codes, uniques = pd.factorize(df[column], use_na_sentinel=True)
+    unique_keys = address_keys(uniques.astype(str))
+
+    desconocidas = int((~np.isin(unique_keys, game_keys[GAME_KEY].to_numpy())).sum())
+    if desconocidas > 0:
+        logger.warning(
+            f"[{dataset_name or 'dataset'}] {desconocidas} partidas no están en game_keys "
+            f"(reciben su propia clave, sin URL en el diccionario)"
+        )
+    sin_url = int((codes < 0).sum())
+    if sin_url > 0:
+        logger.warning(f"[{dataset_name or 'dataset'}] {sin_url} filas sin URL (se asigna {UNKNOWN_GAME_KEY})")
+
+    keys = np.append(unique_keys, np.int64(UNKNOWN_GAME_KEY))[codes]
+
+    result = df.drop(columns=column)
+    result.insert(0, GAME_KEY, keys)
+    return result
+
+
+def _row_content_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Hash de cada fila que no depende del ancho ni de los tipos del DataFrame.
+
+    Cada celda no nula aporta el hash de su valor combinado con el de su
+    columna; las celdas nulas no aportan nada, así que una columna nueva toda
+    NaN (p. ej. ``min_N`` de una partida más larga que todas las guardadas) no
+    cambia el hash de las filas existentes. Los números se hashean como
+    float64 y el resto como texto: ``int32`` / ``int64`` / ``float32`` o
+    ``category`` / ``object`` dan el mismo hash. La suma por fila se mezcla
+    otra vez para que los valores queden atados a su fila.
+    """
+    totals = np.zeros(len(df), dtype=np.uint64)
+    for col in df.columns:
+        values = df[col]
+        present = values.notna().to_numpy()
+        if pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+            cells = values[present].to_numpy(dtype=np.float64)
+        else:
+            cells = values[present].astype(str).to_numpy(dtype=object)
+        column_hash = pd.util.hash_array(np.array([str(col)], dtype=object))[0]
+        totals[present] += pd.util.hash_array(pd.util.hash_array(cells) ^ column_hash)
+    return pd.util.hash_array(totals)
+
+
+def game_content_hashes(game_keys: np.ndarray, *tables: pd.DataFrame) -> np.ndarray:
+    """
+    Hash de 64 bits del contenido de cada partida en todas las tablas.
+
+    Por tabla se suman (módulo 2**64) los hashes de las filas de cada partida
+    (``_row_content_hashes``), así que el resultado no depende del orden de
+    las filas ni de columnas nulas agregadas por otras partidas; luego se
+    combinan las sumas de todas las tablas. Una partida sin filas en una
+    tabla aporta 0.
+
+    Args:
+        game_keys: Claves de partida (sin repetir)
+        *tables: DataFrames con ``game_key``
+
+    Returns:
+        Arreglo uint64 alineado con ``game_keys``
+    """
+    index = pd.Index(game_keys)
+    sums = {}
+    for i, df in enumerate(tables):
+        row_hashes = _row_content_hashes(df)
+        positions = index.get_indexer(df[GAME_KEY].to_numpy())
+        found = positions >= 0
+        totals = np.zeros(len(game_keys), dtype=np.uint64)
+        np.add.at(totals, positions[found], row_hashes[found])
+        sums[f'table_{i}'] = totals
+    return pd.util.hash_pandas_object(pd.DataFrame(sums), index=False).to_numpy()
+
+
+def decode_game_keys(
+    df: pd.DataFrame,
+    game_keys: pd.DataFrame,
+    column: str = ADDRESS
+) -> pd.DataFrame:
+    """Agrega la URL de partida a un DataFrame indexado por ``game_key``."""
+    addresses = game_keys.set_index(GAME_KEY)[ADDRESS]
+    result = df.copy(deep=False)
+    result[column] = df[GAME_KEY].map(addresses)
+    return result
@@ -0,0 +1,242 @@
+"""
+Estadísticas descriptivas combinables en una sola pasada.
+
+``DescriptiveMoments`` resume las columnas numéricas de un DataFrame (o de
+sus chunks) con estado acotado por columna:
+
+    - conteo, nulos, mínimo y máximo
+    - media y momentos centrales M2, M3 y M4 (varianza, asimetría y curtosis)
+    - cuantiles con un ``QuantileSketch`` por columna
+    - moda exacta mientras la columna tenga hasta ``max_mode_values`` valores
+      distintos (después se reporta NaN)
+
+Los resúmenes parciales se combinan con ``merge`` usando las fórmulas de
+Pébay (2008) para momentos centrales, así que el resultado no depende de cómo
+se partieron los datos (chunks del modo streaming, particiones o la semana
+nueva de partidos sobre el resumen guardado)::
+
+    summary = DescriptiveMoments()
+    for chunk in chunks:
+        summary.update(chunk)
+    summary.merge(otra_particion)
+    stats = summary.to_frame()
+
+``to_frame`` usa las mismas definiciones que pandas: ``std`` con ``ddof=1``,
+``skew`` y ``kurt`` con corrección de sesgo (curtosis en exceso). Los cuantiles
+salen del sketch sin interpolar (``method='lower'``) y son exactos mientras
+los datos caben en su primer nivel; los sketches usan una semilla fija
+(``seed``), así que los mismos datos dan los mismos cuantiles en cada
+ejecución. Si el DataFrame resumido está en memoria, ``to_frame(data=df)``
+reporta los cuantiles y la mediana exactos de pandas.
+"""
+
+import warnings
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from league_project.sketches import DEFAULT_SKETCH_SIZE, QuantileSketch
+
+DEFAULT_MAX_MODE_VALUES = 10_000
+DEFAULT_MOMENTS_SEED = 42
+
+_STATE = ('count', 'missing', 'mean', 'm2', 'm3', 'm4', 'min', 'max')
+
+
+class DescriptiveMoments:
+    """Resumen combinable de las columnas numéricas de un dataset."""
+
+    def __init__(
+        self,
+        sketch_size: int = DEFAULT_SKETCH_SIZE,
+        max_mode_values: int = DEFAULT_MAX_MODE_VALUES,
+        seed: Optional[int] = DEFAULT_MOMENTS_SEED
+    ):
+        self.sketch_size = sketch_size
+        self.max_mode_values = max_mode_values
+        self.seed = seed
+        self.columns: List[str] = []
+        for name in _STATE:
+            setattr(self, name, np.empty(0))
+        self._sketches: List[QuantileSketch] = []
+        self._value_counts: List[Optional[pd.Series]] = []
+
+    def __len__(self) -> int:
+        """Filas resumidas (incluye las que tienen nulos)."""
+        return int(self.count[0] + self.missing[0]) if self.columns else 0
+
+    def _add_columns(self, columns: List[str]) -> None:
+        new = [col for col in columns if col not in self.columns]
+        if not new:
+            return
+        # Una columna que aparece tarde cuenta como nula en las filas anteriores
+        rows = len(self)
+        self.columns += new
+        for name in _STATE:
+            fill = {'missing': rows, 'min': np.nan, 'max': np.nan}.get(name, 0.0)
+            setattr(self, name, np.concatenate([getattr(self, name), np.full(len(new), float(fill))]))
+        self._sketches += [QuantileSketch(self.sketch_size, seed=self.seed) for _ in new]
+        self._value_counts += [pd.Series(dtype=np.float64) for _ in new]
+
+    def _merge_moments(self, other: 'DescriptiveMoments') -> None:
+        """Combina momentos centrales (Pébay, 2008), vectorizado por columna."""
+        na, nb = self.count, other.count
+        n = na + nb
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta = np.where(nb > 0, other.mean - self.mean, 0.0)
+            delta_n = np.where(n > 0, delta / n, 0.0)
+            mean = self.mean + delta_n * nb
+            m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+            m3 = (
+                self.m3 + other.m3
+                + delta * delta_n ** 2 * na * nb * (na - nb)
+                + 3 * delta_n * (na * other.m2 - nb * self.m2)
+            )
+            m4 = (
+                self.m4 + other.m4
+                + delta * delta_n ** 3 * na * nb * (na ** 2 - na * nb + nb ** 2)
+                + 6 * delta_n ** 2 * (na ** 2 * other.m2 + nb ** 2 * self.m2)
+                + 4 * delta_n * (na * other.m3 - nb * self.m3)
+            )
+
+        self.count, self.mean, self.m2, self.m3, self.m4 = n, mean, m2, m3, m4
+        self.missing = self.missing + other.missing
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+
+    def _merge_value_counts(self, other: 'DescriptiveMoments') -> None:
+        for i, counts in enumerate(other._value_counts):
+            mine = self._value_counts[i]
+            if mine is None or counts is None:
+                self._value_counts[i] = None
+                continue
+            merged = mine.add(counts, fill_value=0)
+            self._value_counts[i] = merged if len(merged) <= self.max_mode_values else None
+
+    def merge(self, other: 'DescriptiveMoments') -> 'DescriptiveMoments':
+        """Combina otro resumen en este (otro chunk, partición o semana)."""
+        if not other.columns:
+            return self
+        self._add_columns(other.columns)
+        other = other._aligned(self.columns)
+
+        self._merge_moments(other)
+        for sketch, other_sketch in zip(self._sketches, other._sketches):
+            sketch.merge(other_sketch)
+        self._merge_value_counts(other)
+        return self
+
+    def _aligned(self, columns: List[str]) -> 'DescriptiveMoments':
+        """Copia con las columnas en el orden de ``columns`` (las que faltan, nulas)."""
+        if self.columns == columns:
+            return self
+        aligned = DescriptiveMoments(self.sketch_size, self.max_mode_values, self.seed)
+        aligned._add_columns(columns)
+        rows = len(self)
+        aligned.missing[:] = rows
+        for i, col in enumerate(self.columns):
+            j = columns.index(col)
+            for name in _STATE:
+                getattr(aligned, name)[j] = getattr(self, name)[i]
+            aligned._sketches[j] = self._sketches[i]
+            aligned._value_counts[j] = self._value_counts[i]
+        return aligned
+
+    def _count_values(self, col: str, column: np.ndarray) -> Optional[pd.Series]:
+        """Conteos para la moda, o ``None`` si la columna ya tiene demasiados valores."""
+        if col in self.columns and self._value_counts[self.columns.index(col)] is None:
+            return None
+        # Columnas continuas: el prefijo ya supera el límite y se evita contar todo
+        if len(pd.unique(column[:2 * self.max_mode_values])) > self.max_mode_values:
+            return None
+        counts = pd.Series(column).value_counts(sort=False)
+        return counts if len(counts) <= self.max_mode_values else None
+
+    def update(self, df: pd.DataFrame) -> 'DescriptiveMoments':
+        """Agrega un DataFrame (o chunk); solo se usan sus columnas numéricas."""
+        numeric = df.select_dtypes(include=[np.number])
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+
+        chunk = DescriptiveMoments(self.sketch_size, self.max_mode_values, self.seed)
+        chunk._add_columns(list(numeric.columns))
+        chunk.count = valid.sum(axis=0).astype(np.float64)
+        chunk.missing = len(values) - chunk.count
+
+        if len(values):
+            with warnings.catch_warnings():
+                # Columnas completamente nulas en el chunk
+                warnings.simplefilter('ignore', RuntimeWarning)
+                chunk.mean = np.nan_to_num(np.nanmean(values, axis=0))
+                chunk.min = np.nanmin(values, axis=0)
+                chunk.max = np.nanmax(values, axis=0)
+            centered = np.where(valid, values - chunk.mean, 0.0)
+            squared = centered * centered
+            chunk.m2 = squared.sum(axis=0)
+            chunk.m3 = (squared * centered).sum(axis=0)
+            chunk.m4 = (squared * squared).sum(axis=0)
+
+        for i, col in enumerate(numeric.columns):
+            column = values[valid[:, i], i]
+            chunk._sketches[i].update(column)
+            chunk._value_counts[i] = self._count_values(col, column)
+
+        return self.merge(chunk)
+
+    def to_frame(self, data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Estadísticas descriptivas, una fila por columna.
+
+        Args:
+            data: DataFrame resumido, si está en memoria: los cuantiles y la
+                mediana se calculan exactos (``DataFrame.quantile``) en lugar
+                de salir de los sketches
+
+        Returns:
+            DataFrame con count, mean, std, min, 25%, 50%, 75%, max, median,
+            mode, skewness, kurtosis, missing_count y missing_percentage
+        """
+        n = self.count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = np.where(n > 1, self.m2 / (n - 1), np.nan)
+            # Mismas correcciones de sesgo que ``DataFrame.skew`` / ``kurt``
+            m2 = self.m2 / n
+            g1 = (self.m3 / n) / m2 ** 1.5
+            g2 = (self.m4 / n) / m2 ** 2 - 3
+            skewness = np.sqrt(n * (n - 1)) / (n - 2) * g1
+            kurtosis = (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * g2 + 6)
+        constant = self.m2 <= 1e-14 * np.maximum(n, 1) * np.maximum(self.mean ** 2, 1)
+        skewness = np.where(n < 3, np.nan, np.where(constant, 0.0, skewness))
+        kurtosis = np.where(n < 4, np.nan, np.where(constant, 0.0, kurtosis))
+
+        if data is not None:
+            numeric = data[self.columns].astype(np.float64)
+            quantiles = numeric.quantile([0.25, 0.5, 0.75]).T.to_numpy()
+        else:
+            quantiles = np.array([
+                sketch.quantiles([0.25, 0.5, 0.75]) for sketch in self._sketches
+            ]).reshape(len(self.columns), 3)
+        modes = [
+            counts.index[counts.to_numpy() == counts.max()].min()
+            if counts is not None and len(counts) else np.nan
+            for counts in self._value_counts
+        ]
+        rows = len(self)
+
+        return pd.DataFrame({
+            'count': n,
+            'mean': np.where(n > 0, self.mean, np.nan),
+            'std': np.sqrt(variance),
+            'min': self.min,
+            '25%': quantiles[:, 0],
+            '50%': quantiles[:, 1],
+            '75%': quantiles[:, 2],
+            'max': self.max,
+            'median': quantiles[:, 1],
+            'mode': modes,
+            'skewness': skewness,
+            'kurtosis': kurtosis,
+            'missing_count': self.missing,
+            'missing_percentage': self.missing / rows * 100 if rows else 0.0,
+        }, index=pd.Index(self.columns, name='variable'))
@@ -4,6 +4,7 @@ from kedro.pipeline import Pipeline
 
 from league_project.pipelines import data_cleaning
 from league_project.pipelines import data_exploration
+from league_project.pipelines import event_parsing
 from league_project.pipelines import data_processing
 from league_project.pipelines import data_science
 from league_project.pipelines import evaluation
@@ -12,12 +13,13 @@ from league_project.pipelines import evaluation
 def register_pipelines() -> dict[str, Pipeline]:
     """Register the project's pipelines.
     
-    Este proyecto sigue la metodología CRISP-DM con cinco pipelines principales:
+    Este proyecto sigue la metodología CRISP-DM con seis pipelines principales:
     1. data_cleaning: Limpieza y preparación inicial de datos raw
     2. data_exploration: Análisis exploratorio de datos (EDA)
-    3. data_processing: Feature engineering y preparación avanzada
-    4. data_science: Entrenamiento de modelos de regresión y clasificación
-    5. evaluation: Evaluación de modelos y generación de reportes
+    3. event_parsing: Parseo de eventos y series de oro del dataset principal
+    4. data_processing: Feature engineering y preparación avanzada
+    5. data_science: Entrenamiento de modelos de regresión y clasificación
+    6. evaluation: Evaluación de modelos y generación de reportes
 
     Returns:
         A mapping from pipeline names to ``Pipeline`` objects.
@@ -26,26 +28,37 @@ def register_pipelines() -> dict[str, Pipeline]:
     # Registrar pipelines individuales
     dc_pipeline = data_cleaning.create_pipeline()
     de_pipeline = data_exploration.create_pipeline()
+    de_incremental_pipeline = data_exploration.create_incremental_pipeline()
+    ep_pipeline = event_parsing.create_pipeline()
     dp_pipeline = data_processing.create_pipeline()
     ds_pipeline = data_science.create_pipeline()
     eval_pipeline = evaluation.create_pipeline()
     
     # Pipeline completo por defecto (ejecuta todos en orden)
-    default_pipeline = dc_pipeline + de_pipeline + dp_pipeline + ds_pipeline + eval_pipeline
+    default_pipeline = (
+        dc_pipeline + de_pipeline + ep_pipeline + dp_pipeline + ds_pipeline + eval_pipeline
+    )
     
     # Pipeline de limpieza y exploración (solo análisis inicial)
     eda_pipeline = dc_pipeline + de_pipeline
     
+    # EDA semanal: limpieza completa y exploración solo de las partidas nuevas
+    eda_incremental_pipeline = dc_pipeline + de_incremental_pipeline
+    
     return {
         "__default__": default_pipeline,
         "data_cleaning": dc_pipeline,
         "data_exploration": de_pipeline,
+        "event_parsing": ep_pipeline,
         "data_processing": dp_pipeline,
         "data_science": ds_pipeline,
         "evaluation": eval_pipeline,
         "eda": eda_pipeline,  # Pipeline combinado de limpieza + exploración
+        "data_exploration_incremental": de_incremental_pipeline,
+        "eda_incremental": eda_incremental_pipeline,  # Limpieza + exploración incremental
         "dc": dc_pipeline,  # Alias corto
         "de": de_pipeline,  # Alias corto
+        "ep": ep_pipeline,  # Alias corto
         "dp": dp_pipeline,  # Alias corto
         "ds": ds_pipeline,  # Alias corto
         "eval": eval_pipeline,  # Alias corto
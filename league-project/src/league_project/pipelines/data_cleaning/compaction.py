@@ -0,0 +1,109 @@
+"""
+Compactación de Tipos de los Datasets Limpios
+
+Después de la limpieza, los textos repetidos (equipos, ligas, temporadas,
+campeones, marcadores como ``bKills``) siguen guardados como objetos de
+Python y los conteos quedan en float64. Este módulo reduce cada columna al
+tipo más angosto que conserva sus valores:
+
+    - Textos con pocos valores distintos → ``category``
+    - Números enteros (aunque vengan como float sin nulos) → el entero más
+      angosto que los contiene (int8, int16, ...)
+    - Resto de números con decimales → ``float32`` (configurable)
+
+Ejemplo de configuración (``data_cleaning.compaction``)::
+
+    max_category_ratio: 0.5
+    float_dtype: float32
+    exclude: [game_key]
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_COMPACTION = {
+    'max_category_ratio': 0.5,
+    'float_dtype': 'float32',
+    'exclude': ['game_key'],
+}
+
+
+def memory_mb(df: pd.DataFrame) -> float:
+    """Memoria total del DataFrame en MB (incluye el contenido de los textos)."""
+    return df.memory_usage(deep=True).sum() / (1024 ** 2)
+
+
+def _is_integral(values: np.ndarray) -> bool:
+    """Indica si un arreglo float no tiene nulos y solo contiene enteros."""
+    return bool(np.isfinite(values).all() and (np.mod(values, 1) == 0).all())
+
+
+def _compact_column(
+    series: pd.Series,
+    max_category_ratio: float,
+    float_dtype: str
+) -> pd.Series:
+    if pd.api.types.is_bool_dtype(series):
+        return series
+
+    if pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast='integer')
+
+    if pd.api.types.is_float_dtype(series):
+        values = series.to_numpy()
+        if len(values) and _is_integral(values):
+            return pd.to_numeric(series, downcast='integer')
+        return series.astype(float_dtype)
+
+    if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+        if len(series) and series.nunique(dropna=True) <= max_category_ratio * len(series):
+            return series.astype('category')
+
+    return series
+
+
+def compact_dataframe(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """
+    Convierte cada columna al tipo más compacto que conserva sus valores.
+
+    Args:
+        df: DataFrame limpio
+        config: Configuración de compactación (``DEFAULT_COMPACTION``)
+
+    Returns:
+        DataFrame con los mismos valores y tipos más angostos
+    """
+    config = {**DEFAULT_COMPACTION, **(config or {})}
+    exclude = set(config['exclude'] or [])
+
+    compacted = {
+        col: df[col] if col in exclude else _compact_column(
+            df[col], config['max_category_ratio'], config['float_dtype']
+        )
+        for col in df.columns
+    }
+    return pd.DataFrame(compacted, index=df.index)
+
+
+def compact_with_stats(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, Dict[str, float]]:
+    """
+    Compacta un DataFrame y mide la memoria antes y después.
+
+    Returns:
+        Tupla con (DataFrame compactado, ``memory_before_mb``/``memory_after_mb``)
+    """
+    compacted = compact_dataframe(df, config)
+    stats = {
+        'memory_before_mb': memory_mb(df),
+        'memory_after_mb': memory_mb(compacted),
+    }
+    return compacted, stats
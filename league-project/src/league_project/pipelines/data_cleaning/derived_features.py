@@ -0,0 +1,134 @@
+"""
+Motor de Features Derivadas
+
+Calcula features derivadas (KDA, tasas por minuto, ratios, diferencias) con
+operaciones de NumPy sobre columnas completas. Las features se declaran en
+``parameters.yml`` (``data_cleaning.derived_features``), de modo que agregar
+una nueva feature nunca requiere un ``apply`` fila por fila.
+
+Ejemplo de especificación::
+
+    - name: kda
+      op: ratio
+      numerator: [kills, assists]
+      denominator: [deaths]
+      zero_division: numerator
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _sum_columns(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Suma un conjunto de columnas como un único arreglo float64."""
+    values = df[columns[0]].to_numpy(dtype=np.float64, na_value=np.nan)
+    for col in columns[1:]:
+        values = values + df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return values
+
+
+def _safe_divide(
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    zero_division: Any = 0.0
+) -> np.ndarray:
+    """
+    Divide elemento a elemento evitando divisiones por cero.
+
+    Args:
+        numerator: Arreglo numerador
+        denominator: Arreglo denominador
+        zero_division: Valor cuando el denominador es 0. Acepta un número,
+            ``'nan'`` o ``'numerator'`` (devuelve el numerador sin dividir)
+
+    Returns:
+        Arreglo con el resultado de la división
+    """
+    if zero_division == 'numerator':
+        fallback = numerator.copy()
+    elif zero_division == 'nan' or zero_division is None:
+        fallback = np.full_like(numerator, np.nan)
+    else:
+        fallback = np.full_like(numerator, float(zero_division))
+
+    return np.divide(numerator, denominator, out=fallback, where=denominator != 0)
+
+
+def _as_list(value: Any) -> List[str]:
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _required_columns(spec: Dict[str, Any], minutes_column: str) -> List[str]:
+    op = spec['op']
+    if op == 'ratio':
+        return _as_list(spec['numerator']) + _as_list(spec['denominator'])
+    if op == 'per_minute':
+        return _as_list(spec['columns']) + [spec.get('minutes_column', minutes_column)]
+    if op == 'difference':
+        return [spec['left'], spec['right']]
+    raise ValueError(f"Operación de feature derivada no soportada: '{op}'")
+
+
+def _compute_feature(
+    df: pd.DataFrame,
+    spec: Dict[str, Any],
+    minutes_column: str
+) -> np.ndarray:
+    op = spec['op']
+    zero_division = spec.get('zero_division', 0.0)
+
+    if op == 'ratio':
+        numerator = _sum_columns(df, _as_list(spec['numerator']))
+        denominator = _sum_columns(df, _as_list(spec['denominator']))
+        return _safe_divide(numerator, denominator, zero_division)
+
+    if op == 'per_minute':
+        values = _sum_columns(df, _as_list(spec['columns']))
+        minutes = _sum_columns(df, [spec.get('minutes_column', minutes_column)])
+        return _safe_divide(values, minutes, zero_division)
+
+    # op == 'difference'
+    return _sum_columns(df, [spec['left']]) - _sum_columns(df, [spec['right']])
+
+
+def compute_derived_features(
+    df: pd.DataFrame,
+    specs: Optional[List[Dict[str, Any]]],
+    minutes_column: str = 'gamelength_minutes'
+) -> pd.DataFrame:
+    """
+    Agrega al DataFrame las features derivadas declaradas en ``specs``.
+
+    Operaciones soportadas:
+        - ``ratio``: suma(numerator) / suma(denominator)
+        - ``per_minute``: suma(columns) / minutes_column
+        - ``difference``: left - right
+
+    Las features cuyas columnas de origen no existen se omiten con un aviso
+    en el log, igual que el comportamiento anterior de ``clean_main_dataset``.
+
+    Args:
+        df: DataFrame limpio
+        specs: Lista de especificaciones de features derivadas
+        minutes_column: Columna de duración usada por ``per_minute``
+
+    Returns:
+        DataFrame con las nuevas columnas (se modifica y retorna ``df``)
+    """
+    for spec in specs or []:
+        name = spec['name']
+        required = _required_columns(spec, minutes_column)
+        missing = [col for col in required if col not in df.columns]
+        if missing:
+            logger.debug(f"Feature '{name}' omitida: faltan columnas {missing}")
+            continue
+
+        df[name] = _compute_feature(df, spec, minutes_column)
+        logger.info(f"Creada feature '{name}' ({spec['op']})")
+
+    return df
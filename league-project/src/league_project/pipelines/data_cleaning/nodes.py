@@ -8,21 +8,78 @@ Cada función transforma un dataset específico.
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from league_project.game_keys import build_game_key_index, encode_game_keys
+
+from .compaction import compact_with_stats
+from .derived_features import compute_derived_features
+from .outliers import filter_outliers
+from .profiling import profile_dataset
+from .schema import apply_cleaning_schema
+from .streaming import is_chunked, stream_clean
 
 logger = logging.getLogger(__name__)
 
 
+# Features derivadas por defecto cuando no se pasan parámetros
+DEFAULT_DERIVED_FEATURES = [
+    {
+        'name': 'kda',
+        'op': 'ratio',
+        'numerator': ['kills', 'assists'],
+        'denominator': ['deaths'],
+        'zero_division': 'numerator',
+    },
+]
+
+
+# ============================================================================
+# NODO 0: Diccionario de claves de partida
+# ============================================================================
+
+def build_game_keys(main_df: pd.DataFrame, matchinfo_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Construye la tabla ``address → game_key`` usada por todos los datasets.
+
+    Los nodos de limpieza y de parseo reemplazan la URL de partida por esta
+    clave entera (hash estable de la URL), así que los joins posteriores
+    comparan enteros en lugar de textos de ~100 caracteres. La URL solo queda
+    en esta tabla.
+
+    Args:
+        main_df: DataFrame raw de LeagueofLegends.csv
+        matchinfo_df: DataFrame raw de matchinfo.csv
+
+    Returns:
+        DataFrame con ``game_key`` (int64) y ``address``
+    """
+    columns = [df[col] for df in (main_df, matchinfo_df) for col in df.columns if col.lower() == 'address']
+    game_keys = build_game_key_index(*columns)
+
+    logger.info(f"Diccionario de claves de partida: {len(game_keys)} partidas")
+
+    return game_keys
+
+
 # ============================================================================
 # NODO 1: Limpieza de LeagueofLegends.csv (Dataset Principal)
 # ============================================================================
 
-def clean_main_dataset(df: pd.DataFrame) -> pd.DataFrame:
+def clean_main_dataset(
+    df: pd.DataFrame,
+    parameters: Optional[Dict[str, Any]] = None,
+    game_keys: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     Limpia el dataset principal de League of Legends.
     
     Args:
         df: DataFrame raw de LeagueofLegends.csv
+        parameters: Configuración de limpieza (``params:data_cleaning``).
+            ``derived_features`` declara las features derivadas a calcular y
+            ``outliers`` las reglas de filtrado de outliers.
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
         
     Returns:
         DataFrame limpio y procesado
@@ -33,7 +90,10 @@ def clean_main_dataset(df: pd.DataFrame) -> pd.DataFrame:
         - Convierte tipos de datos
         - Estandariza nombres de columnas
         - Elimina outliers extremos
+        - Calcula features derivadas (KDA, tasas por minuto, ratios)
     """
+    parameters = parameters or {}
+
     logger.info(f"Iniciando limpieza del dataset principal: {len(df)} filas")
     
     # Crear copia para no modificar el original
@@ -41,6 +101,8 @@ def clean_main_dataset(df: pd.DataFrame) -> pd.DataFrame:
     
     # 1. Estandarizar nombres de columnas (minúsculas y sin espacios)
     df_clean.columns = df_clean.columns.str.lower().str.strip().str.replace(' ', '_')
+    if game_keys is not None:
+        df_clean = encode_game_keys(df_clean, game_keys, dataset_name='main')
     
     # 2. Eliminar duplicados completos
     duplicados_antes = len(df_clean)
@@ -87,37 +149,16 @@ def clean_main_dataset(df: pd.DataFrame) -> pd.DataFrame:
     if 'gamelength' in df_clean.columns:
         df_clean['gamelength_minutes'] = df_clean['gamelength'] / 60
     
-    # 5. Eliminar outliers extremos usando IQR para columnas numéricas clave
-    outliers_eliminados = 0
-    columnas_para_outliers = ['kills', 'deaths', 'assists', 'gold'] if all(
-        col in df_clean.columns for col in ['kills', 'deaths', 'assists', 'gold']
-    ) else []
-    
-    for col in columnas_para_outliers:
-        Q1 = df_clean[col].quantile(0.25)
-        Q3 = df_clean[col].quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 3 * IQR  # 3 IQR para outliers extremos
-        upper_bound = Q3 + 3 * IQR
-        
-        antes = len(df_clean)
-        df_clean = df_clean[(df_clean[col] >= lower_bound) & (df_clean[col] <= upper_bound)]
-        despues = len(df_clean)
-        outliers_col = antes - despues
-        
-        if outliers_col > 0:
-            outliers_eliminados += outliers_col
-            logger.info(f"Columna '{col}': eliminados {outliers_col} outliers extremos")
-    
-    # 6. Crear features derivadas básicas
-    if all(col in df_clean.columns for col in ['kills', 'deaths', 'assists']):
-        # KDA (Kill-Death-Assist ratio)
-        df_clean['kda'] = df_clean.apply(
-            lambda row: (row['kills'] + row['assists']) if row['deaths'] == 0 
-            else (row['kills'] + row['assists']) / row['deaths'],
-            axis=1
-        )
-        logger.info("Creada feature 'kda'")
+    # 5. Eliminar outliers: límites de todas las reglas en una pasada (sketches
+    #    de cuantiles) y una sola máscara combinada (ver outliers.py)
+    filas_antes = len(df_clean)
+    df_clean, _ = filter_outliers(df_clean, parameters.get('outliers'))
+    outliers_eliminados = filas_antes - len(df_clean)
+    
+    # 6. Crear features derivadas (vectorizadas, declaradas en parameters.yml)
+    df_clean = compute_derived_features(
+        df_clean, parameters.get('derived_features', DEFAULT_DERIVED_FEATURES)
+    )
     
     logger.info(f"Limpieza completada: {len(df_clean)} filas finales")
     logger.info(f"Resumen: {duplicados_eliminados} duplicados, "
@@ -131,46 +172,25 @@ def clean_main_dataset(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 2: Limpieza de matchinfo.csv
 # ============================================================================
 
-def clean_matchinfo(df: pd.DataFrame) -> pd.DataFrame:
+def clean_matchinfo(
+    df: pd.DataFrame,
+    schema: Dict[str, Any],
+    game_keys: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     Limpia el dataset de información de partidos.
     
     Args:
         df: DataFrame raw de matchinfo.csv
+        schema: Esquema de limpieza (``params:data_cleaning.schemas.matchinfo``)
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
         
     Returns:
         DataFrame limpio con información de partidos
     """
     logger.info(f"Iniciando limpieza de matchinfo: {len(df)} filas")
     
-    df_clean = df.copy()
-    
-    # Estandarizar nombres de columnas
-    df_clean.columns = df_clean.columns.str.lower().str.strip().str.replace(' ', '_')
-    
-    # Eliminar duplicados
-    df_clean = df_clean.drop_duplicates()
-    
-    # Convertir gameid a string
-    if 'gameid' in df_clean.columns:
-        df_clean['gameid'] = df_clean['gameid'].astype(str)
-    
-    # Convertir fecha a datetime si existe
-    if 'date' in df_clean.columns:
-        df_clean['date'] = pd.to_datetime(df_clean['date'], errors='coerce')
-        # Extraer año, mes, día de la semana
-        df_clean['year'] = df_clean['date'].dt.year
-        df_clean['month'] = df_clean['date'].dt.month
-        df_clean['day_of_week'] = df_clean['date'].dt.dayofweek
-        logger.info("Convertida columna 'date' a datetime y extraídas features temporales")
-    
-    # Limpiar nombres de ligas
-    if 'league' in df_clean.columns:
-        df_clean['league'] = df_clean['league'].str.strip().str.upper()
-    
-    # Limpiar split/season
-    if 'split' in df_clean.columns:
-        df_clean['split'] = df_clean['split'].str.strip()
+    df_clean = apply_cleaning_schema(df, schema, dataset_name='matchinfo', game_keys=game_keys)
     
     logger.info(f"Limpieza de matchinfo completada: {len(df_clean)} filas")
     
@@ -181,46 +201,30 @@ def clean_matchinfo(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 3: Limpieza de bans.csv
 # ============================================================================
 
-def clean_bans(df: pd.DataFrame) -> pd.DataFrame:
+def clean_bans(
+    df: pd.DataFrame,
+    schema: Dict[str, Any],
+    game_keys: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     Limpia el dataset de bans de campeones.
     
     Args:
-        df: DataFrame raw de bans.csv
+        df: DataFrame raw de bans.csv, o un iterable de chunks si el catálogo
+            lo carga con ``chunksize`` (modo streaming)
+        schema: Esquema de limpieza (``params:data_cleaning.schemas.bans``)
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
         
     Returns:
         DataFrame limpio con información de bans
     """
-    logger.info(f"Iniciando limpieza de bans: {len(df)} filas")
-    
-    df_clean = df.copy()
-    
-    # Estandarizar nombres de columnas
-    df_clean.columns = df_clean.columns.str.lower().str.strip().str.replace(' ', '_')
-    
-    # Eliminar duplicados
-    df_clean = df_clean.drop_duplicates()
+    if is_chunked(df):
+        logger.info("Iniciando limpieza de bans por chunks (modo streaming)")
+        return stream_clean(df, schema, dataset_name='bans', game_keys=game_keys)
     
-    # Convertir gameid a string
-    if 'gameid' in df_clean.columns:
-        df_clean['gameid'] = df_clean['gameid'].astype(str)
-    
-    # Limpiar nombres de campeones
-    if 'champion' in df_clean.columns:
-        df_clean['champion'] = df_clean['champion'].str.strip().str.title()
-        # Eliminar filas donde el campeón es nulo o vacío
-        df_clean = df_clean[df_clean['champion'].notna()]
-        df_clean = df_clean[df_clean['champion'] != '']
-        logger.info("Limpiados nombres de campeones")
-    
-    # Estandarizar nombres de equipos
-    if 'team' in df_clean.columns:
-        df_clean['team'] = df_clean['team'].str.strip().str.title()
+    logger.info(f"Iniciando limpieza de bans: {len(df)} filas")
     
-    # Validar orden de ban (debe ser 1-5)
-    if 'ban' in df_clean.columns:
-        df_clean['ban'] = pd.to_numeric(df_clean['ban'], errors='coerce')
-        df_clean = df_clean[(df_clean['ban'] >= 1) & (df_clean['ban'] <= 5)]
+    df_clean = apply_cleaning_schema(df, schema, dataset_name='bans', game_keys=game_keys)
     
     logger.info(f"Limpieza de bans completada: {len(df_clean)} filas")
     
@@ -231,41 +235,30 @@ def clean_bans(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 4: Limpieza de gold.csv
 # ============================================================================
 
-def clean_gold(df: pd.DataFrame) -> pd.DataFrame:
+def clean_gold(
+    df: pd.DataFrame,
+    schema: Dict[str, Any],
+    game_keys: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     Limpia el dataset de estadísticas de oro.
     
     Args:
-        df: DataFrame raw de gold.csv
+        df: DataFrame raw de gold.csv, o un iterable de chunks si el catálogo
+            lo carga con ``chunksize`` (modo streaming)
+        schema: Esquema de limpieza (``params:data_cleaning.schemas.gold``)
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
         
     Returns:
         DataFrame limpio con estadísticas de oro
     """
-    logger.info(f"Iniciando limpieza de gold: {len(df)} filas")
-    
-    df_clean = df.copy()
-    
-    # Estandarizar nombres de columnas
-    df_clean.columns = df_clean.columns.str.lower().str.strip().str.replace(' ', '_')
-    
-    # Eliminar duplicados
-    df_clean = df_clean.drop_duplicates()
-    
-    # Convertir gameid a string
-    if 'gameid' in df_clean.columns:
-        df_clean['gameid'] = df_clean['gameid'].astype(str)
+    if is_chunked(df):
+        logger.info("Iniciando limpieza de gold por chunks (modo streaming)")
+        return stream_clean(df, schema, dataset_name='gold', game_keys=game_keys)
     
-    # Validar que valores de oro sean positivos
-    gold_columns = [col for col in df_clean.columns if 'gold' in col.lower()]
-    for col in gold_columns:
-        if df_clean[col].dtype in [np.int64, np.float64]:
-            # Reemplazar valores negativos con 0
-            df_clean[col] = df_clean[col].clip(lower=0)
+    logger.info(f"Iniciando limpieza de gold: {len(df)} filas")
     
-    # Calcular diferencia de oro entre equipos si existen columnas apropiadas
-    if 'goldblue' in df_clean.columns and 'goldred' in df_clean.columns:
-        df_clean['gold_diff'] = df_clean['goldblue'] - df_clean['goldred']
-        logger.info("Calculada diferencia de oro entre equipos")
+    df_clean = apply_cleaning_schema(df, schema, dataset_name='gold', game_keys=game_keys)
     
     logger.info(f"Limpieza de gold completada: {len(df_clean)} filas")
     
@@ -276,39 +269,30 @@ def clean_gold(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 5: Limpieza de kills.csv
 # ============================================================================
 
-def clean_kills(df: pd.DataFrame) -> pd.DataFrame:
+def clean_kills(
+    df: pd.DataFrame,
+    schema: Dict[str, Any],
+    game_keys: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     Limpia el dataset de kills.
     
     Args:
-        df: DataFrame raw de kills.csv
+        df: DataFrame raw de kills.csv, o un iterable de chunks si el catálogo
+            lo carga con ``chunksize`` (modo streaming)
+        schema: Esquema de limpieza (``params:data_cleaning.schemas.kills``)
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
         
     Returns:
         DataFrame limpio con información de kills
     """
-    logger.info(f"Iniciando limpieza de kills: {len(df)} filas")
-    
-    df_clean = df.copy()
+    if is_chunked(df):
+        logger.info("Iniciando limpieza de kills por chunks (modo streaming)")
+        return stream_clean(df, schema, dataset_name='kills', game_keys=game_keys)
     
-    # Estandarizar nombres de columnas
-    df_clean.columns = df_clean.columns.str.lower().str.strip().str.replace(' ', '_')
-    
-    # Eliminar duplicados
-    df_clean = df_clean.drop_duplicates()
-    
-    # Convertir gameid a string
-    if 'gameid' in df_clean.columns:
-        df_clean['gameid'] = df_clean['gameid'].astype(str)
-    
-    # Validar que time sea positivo
-    if 'time' in df_clean.columns:
-        df_clean['time'] = pd.to_numeric(df_clean['time'], errors='coerce')
-        df_clean = df_clean[df_clean['time'] >= 0]
+    logger.info(f"Iniciando limpieza de kills: {len(df)} filas")
     
-    # Limpiar nombres de jugadores
-    for col in ['killer', 'victim']:
-        if col in df_clean.columns:
-            df_clean[col] = df_clean[col].str.strip()
+    df_clean = apply_cleaning_schema(df, schema, dataset_name='kills', game_keys=game_keys)
     
     logger.info(f"Limpieza de kills completada: {len(df_clean)} filas")
     
@@ -319,42 +303,30 @@ def clean_kills(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 6: Limpieza de monsters.csv
 # ============================================================================
 
-def clean_monsters(df: pd.DataFrame) -> pd.DataFrame:
+def clean_monsters(
+    df: pd.DataFrame,
+    schema: Dict[str, Any],
+    game_keys: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     Limpia el dataset de objetivos neutrales (dragones, baron, herald).
     
     Args:
-        df: DataFrame raw de monsters.csv
+        df: DataFrame raw de monsters.csv, o un iterable de chunks si el catálogo
+            lo carga con ``chunksize`` (modo streaming)
+        schema: Esquema de limpieza (``params:data_cleaning.schemas.monsters``)
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
         
     Returns:
         DataFrame limpio con información de objetivos
     """
-    logger.info(f"Iniciando limpieza de monsters: {len(df)} filas")
-    
-    df_clean = df.copy()
-    
-    # Estandarizar nombres de columnas
-    df_clean.columns = df_clean.columns.str.lower().str.strip().str.replace(' ', '_')
-    
-    # Eliminar duplicados
-    df_clean = df_clean.drop_duplicates()
-    
-    # Convertir gameid a string
-    if 'gameid' in df_clean.columns:
-        df_clean['gameid'] = df_clean['gameid'].astype(str)
+    if is_chunked(df):
+        logger.info("Iniciando limpieza de monsters por chunks (modo streaming)")
+        return stream_clean(df, schema, dataset_name='monsters', game_keys=game_keys)
     
-    # Validar que time sea positivo
-    if 'time' in df_clean.columns:
-        df_clean['time'] = pd.to_numeric(df_clean['time'], errors='coerce')
-        df_clean = df_clean[df_clean['time'] >= 0]
-    
-    # Estandarizar tipo de monstruo
-    if 'type' in df_clean.columns:
-        df_clean['type'] = df_clean['type'].str.strip().str.lower()
+    logger.info(f"Iniciando limpieza de monsters: {len(df)} filas")
     
-    # Estandarizar nombre de equipo
-    if 'team' in df_clean.columns:
-        df_clean['team'] = df_clean['team'].str.strip().str.title()
+    df_clean = apply_cleaning_schema(df, schema, dataset_name='monsters', game_keys=game_keys)
     
     logger.info(f"Limpieza de monsters completada: {len(df_clean)} filas")
     
@@ -365,54 +337,73 @@ def clean_monsters(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 7: Limpieza de structures.csv
 # ============================================================================
 
-def clean_structures(df: pd.DataFrame) -> pd.DataFrame:
+def clean_structures(
+    df: pd.DataFrame,
+    schema: Dict[str, Any],
+    game_keys: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     Limpia el dataset de estructuras destruidas (torres, inhibidores).
     
     Args:
-        df: DataFrame raw de structures.csv
+        df: DataFrame raw de structures.csv, o un iterable de chunks si el catálogo
+            lo carga con ``chunksize`` (modo streaming)
+        schema: Esquema de limpieza (``params:data_cleaning.schemas.structures``)
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
         
     Returns:
         DataFrame limpio con información de estructuras
     """
-    logger.info(f"Iniciando limpieza de structures: {len(df)} filas")
-    
-    df_clean = df.copy()
+    if is_chunked(df):
+        logger.info("Iniciando limpieza de structures por chunks (modo streaming)")
+        return stream_clean(df, schema, dataset_name='structures', game_keys=game_keys)
     
-    # Estandarizar nombres de columnas
-    df_clean.columns = df_clean.columns.str.lower().str.strip().str.replace(' ', '_')
-    
-    # Eliminar duplicados
-    df_clean = df_clean.drop_duplicates()
+    logger.info(f"Iniciando limpieza de structures: {len(df)} filas")
     
-    # Convertir gameid a string
-    if 'gameid' in df_clean.columns:
-        df_clean['gameid'] = df_clean['gameid'].astype(str)
+    df_clean = apply_cleaning_schema(df, schema, dataset_name='structures', game_keys=game_keys)
     
-    # Validar que time sea positivo
-    if 'time' in df_clean.columns:
-        df_clean['time'] = pd.to_numeric(df_clean['time'], errors='coerce')
-        df_clean = df_clean[df_clean['time'] >= 0]
+    logger.info(f"Limpieza de structures completada: {len(df_clean)} filas")
     
-    # Estandarizar tipo de estructura
-    if 'type' in df_clean.columns:
-        df_clean['type'] = df_clean['type'].str.strip().str.lower()
+    return df_clean
+
+
+# ============================================================================
+# NODO 8: Compactación de tipos
+# ============================================================================
+
+def compact_dataset(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Convierte un dataset limpio a tipos compactos (categorías, enteros
+    angostos, float32) antes de guardarlo en intermediate.
     
-    # Estandarizar lane
-    if 'lane' in df_clean.columns:
-        df_clean['lane'] = df_clean['lane'].str.strip().str.lower()
+    Args:
+        df: DataFrame limpio, o un stream de chunks (modo streaming)
+        config: Configuración (``params:data_cleaning.compaction``)
+        
+    Returns:
+        Tupla con (DataFrame compactado, memoria antes/después en MB)
+        
+    Nota:
+        Los streams se devuelven sin cambios: los tipos por chunk podrían
+        diferir entre chunks y romper el esquema del Parquet de salida.
+    """
+    if is_chunked(df):
+        logger.info("Dataset por chunks: se omite la compactación")
+        return df, {'memory_before_mb': np.nan, 'memory_after_mb': np.nan}
     
-    # Estandarizar nombre de equipo
-    if 'team' in df_clean.columns:
-        df_clean['team'] = df_clean['team'].str.strip().str.title()
+    df_compact, stats = compact_with_stats(df, config)
     
-    logger.info(f"Limpieza de structures completada: {len(df_clean)} filas")
+    logger.info(f"Compactación de tipos: {stats['memory_before_mb']:.2f} MB → "
+                f"{stats['memory_after_mb']:.2f} MB")
     
-    return df_clean
+    return df_compact, stats
 
 
 # ============================================================================
-# NODO 8: Generar Reporte de Calidad de Datos
+# NODO 9: Generar Reporte de Calidad de Datos
 # ============================================================================
 
 def generate_data_quality_report(
@@ -422,16 +413,27 @@ def generate_data_quality_report(
     gold_df: pd.DataFrame,
     kills_df: pd.DataFrame,
     monsters_df: pd.DataFrame,
-    structures_df: pd.DataFrame
-) -> pd.DataFrame:
+    structures_df: pd.DataFrame,
+    previous_profiles: Optional[Dict[str, Any]] = None,
+    profiling: Optional[Dict[str, Any]] = None,
+    *compaction_stats: Dict[str, Any]
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
     Genera un reporte de calidad de datos después de la limpieza.
     
+    Los perfiles se calculan con una sola pasada por las filas nuevas y se
+    reutilizan entre ejecuciones (ver profiling.py).
+    
     Args:
         *_df: DataFrames limpios
+        previous_profiles: Perfiles guardados en la ejecución anterior
+        profiling: Configuración de perfilado (``params:data_cleaning.profiling``)
+        *compaction_stats: Memoria antes/después de la compactación de cada
+            dataset, en el mismo orden que los DataFrames (opcional)
         
     Returns:
-        DataFrame con métricas de calidad por dataset
+        Tupla con (DataFrame con métricas de calidad por dataset, perfiles
+        actualizados)
     """
     logger.info("Generando reporte de calidad de datos")
     
@@ -444,24 +446,25 @@ def generate_data_quality_report(
         'monsters': monsters_df,
         'structures': structures_df
     }
+    previous_profiles = previous_profiles or {}
     
     report_data = []
+    profiles = {}
     
-    for name, df in datasets.items():
-        report = {
-            'dataset': name,
-            'total_rows': len(df),
-            'total_columns': len(df.columns),
-            'numeric_columns': len(df.select_dtypes(include=[np.number]).columns),
-            'categorical_columns': len(df.select_dtypes(include=['object']).columns),
-            'missing_values': int(df.isnull().sum().sum()),
-            'missing_percentage': round(df.isnull().sum().sum() / (len(df) * len(df.columns)) * 100, 2),
-            'duplicate_rows': int(df.duplicated().sum()),
-            'memory_usage_mb': round(df.memory_usage(deep=True).sum() / (1024 ** 2), 2)
-        }
+    for i, (name, df) in enumerate(datasets.items()):
+        metrics, profiles[name] = profile_dataset(df, previous_profiles.get(name), profiling)
+        report = {'dataset': name, **metrics}
+        
+        # Memoria antes y después de la compactación de tipos
+        if i < len(compaction_stats):
+            report.update({k: round(v, 2) for k, v in compaction_stats[i].items()})
+            if compaction_stats[i]['memory_before_mb'] > 0:
+                report['memory_saving_pct'] = round(
+                    (1 - compaction_stats[i]['memory_after_mb'] / compaction_stats[i]['memory_before_mb']) * 100, 2
+                )
         
         report_data.append(report)
-        logger.info(f"Dataset '{name}': {report['total_rows']} filas, "
+        logger.info(f"Dataset '{name}' ({report['profile_mode']}): {report['total_rows']} filas, "
                    f"{report['missing_values']} valores faltantes, "
                    f"{report['duplicate_rows']} duplicados")
     
@@ -469,5 +472,4 @@ def generate_data_quality_report(
     
     logger.info("Reporte de calidad generado exitosamente")
     
-    return report_df
-
+    return report_df, profiles
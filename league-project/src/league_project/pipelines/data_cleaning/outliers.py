@@ -0,0 +1,244 @@
+"""
+Motor de Filtrado de Outliers
+
+Antes, ``clean_main_dataset`` recorría las columnas una por una: calculaba
+cuantiles exactos sobre el DataFrame ya filtrado y lo reconstruía después de
+cada columna. Este motor separa el trabajo en tres pasos:
+
+    1. Los cuantiles de cada columna salen de la columna en memoria
+       (exactos) o, para datos en chunks, de un sketch por columna
+       actualizado en una pasada (``outlier_bounds`` con un iterable;
+       ``league_project.sketches.QuantileSketch`` con semilla ``seed``)
+    2. Los límites de todas las reglas salen de esos cuantiles
+    3. Se evalúan todas las reglas a la vez y se aplica una sola máscara
+
+Cada regla se declara en ``parameters.yml`` (``data_cleaning.outliers``)::
+
+    sketch_size: 200     # solo para datos en chunks
+    seed: 42
+    rules:
+      - column: kills
+        method: iqr          # [Q1 - factor·IQR, Q3 + factor·IQR]
+        factor: 3
+      - column: gamelength
+        method: quantile     # [cuantil lower, cuantil upper]
+        lower: 0.001
+        upper: 0.999
+      - column: gold
+        method: range        # límites absolutos min / max
+        min: 0
+
+Los límites se calculan sobre los datos completos (no sobre lo que dejaron las
+reglas anteriores), así que el orden de las reglas no cambia el resultado.
+Los valores nulos nunca se consideran outliers. Con la semilla fija el
+resultado es el mismo en cada ejecución también en el modo con sketches.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from league_project.sketches import DEFAULT_SKETCH_SIZE, QuantileSketch
+
+logger = logging.getLogger(__name__)
+
+
+# Reglas por defecto: 3 IQR (outliers extremos) sobre las estadísticas de jugador
+DEFAULT_OUTLIER_RULES = [
+    {'column': col, 'method': 'iqr', 'factor': 3}
+    for col in ['kills', 'deaths', 'assists', 'gold']
+]
+
+_METHODS = ('iqr', 'quantile', 'range')
+
+# Semilla de los sketches: la limpieza debe dar el mismo resultado en cada ejecución
+DEFAULT_OUTLIER_SEED = 42
+
+
+def _rule_name(rule: Dict[str, Any]) -> str:
+    return rule.get('name') or f"{rule['column']}:{rule['method']}"
+
+
+def _rule_quantiles(rule: Dict[str, Any]) -> List[float]:
+    """Probabilidades que necesita la regla (vacío si no usa cuantiles)."""
+    if rule['method'] == 'iqr':
+        return [rule.get('q_low', 0.25), rule.get('q_high', 0.75)]
+    if rule['method'] == 'quantile':
+        return [rule.get('lower', 0.0), rule.get('upper', 1.0)]
+    return []
+
+
+def _active_rules(rules: List[Dict[str, Any]], columns: pd.Index) -> List[Dict[str, Any]]:
+    """Valida las reglas y descarta las de columnas que no existen."""
+    active = []
+    for rule in rules:
+        if rule.get('method') not in _METHODS:
+            raise ValueError(
+                f"Método de outliers no soportado: '{rule.get('method')}' "
+                f"(opciones: {', '.join(_METHODS)})"
+            )
+        if rule['column'] in columns:
+            active.append(rule)
+        else:
+            logger.debug(f"Regla de outliers '{_rule_name(rule)}' omitida: columna inexistente")
+    return active
+
+
+def build_column_sketches(
+    frames: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    columns: List[str],
+    sketch_size: int = DEFAULT_SKETCH_SIZE,
+    seed: Optional[int] = DEFAULT_OUTLIER_SEED
+) -> Dict[str, QuantileSketch]:
+    """
+    Construye un sketch de cuantiles por columna en una sola pasada.
+
+    Para datos que no caben en memoria; con el DataFrame completo
+    ``outlier_bounds`` usa cuantiles exactos.
+
+    Args:
+        frames: DataFrame completo o iterable de chunks
+        columns: Columnas a resumir
+        sketch_size: Parámetro ``k`` de los sketches
+        seed: Semilla de los sketches (mismos chunks → mismos límites)
+
+    Returns:
+        Diccionario ``columna → QuantileSketch``
+    """
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+
+    sketches = {col: QuantileSketch(sketch_size, seed=seed) for col in columns}
+    for frame in frames:
+        for col, sketch in sketches.items():
+            sketch.update(frame[col].to_numpy(dtype=np.float64, na_value=np.nan))
+    return sketches
+
+
+def _quantiles(source: Union[QuantileSketch, pd.Series], probs: List[float]) -> np.ndarray:
+    """Cuantiles de un sketch (aproximados) o de una columna (exactos)."""
+    if isinstance(source, QuantileSketch):
+        return source.quantiles(probs)
+    return source.quantile(probs).to_numpy(dtype=np.float64)
+
+
+def compute_outlier_bounds(
+    sources: Mapping[str, Union[QuantileSketch, pd.Series]],
+    rules: List[Dict[str, Any]]
+) -> Dict[str, Tuple[str, float, float]]:
+    """
+    Calcula los límites ``[low, high]`` de cada regla.
+
+    Args:
+        sources: ``columna → QuantileSketch`` (``build_column_sketches``) o
+            ``columna → Series`` para cuantiles exactos
+        rules: Reglas activas
+
+    Returns:
+        Diccionario ``nombre de regla → (columna, low, high)``
+    """
+    bounds = {}
+    for rule in rules:
+        low, high = -np.inf, np.inf
+        probs = _rule_quantiles(rule)
+
+        if rule['method'] == 'iqr':
+            q1, q3 = _quantiles(sources[rule['column']], probs)
+            factor = rule.get('factor', 1.5)
+            low, high = q1 - factor * (q3 - q1), q3 + factor * (q3 - q1)
+        elif rule['method'] == 'quantile':
+            low, high = _quantiles(sources[rule['column']], probs)
+        else:
+            low, high = rule.get('min', -np.inf), rule.get('max', np.inf)
+
+        bounds[_rule_name(rule)] = (rule['column'], float(low), float(high))
+    return bounds
+
+
+def outlier_bounds(
+    frames: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    rules: List[Dict[str, Any]],
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Tuple[str, float, float]]:
+    """
+    Límites de las reglas: cuantiles exactos si ``frames`` es un DataFrame
+    en memoria, sketches con ``sketch_size`` y ``seed`` si es un iterable de
+    chunks.
+    """
+    config = config or {}
+    quantile_columns = list(dict.fromkeys(r['column'] for r in rules if _rule_quantiles(r)))
+    if isinstance(frames, pd.DataFrame):
+        sources = {
+            col: pd.Series(frames[col].to_numpy(dtype=np.float64, na_value=np.nan))
+            for col in quantile_columns
+        }
+    else:
+        sources = build_column_sketches(
+            frames,
+            quantile_columns,
+            config.get('sketch_size', DEFAULT_SKETCH_SIZE),
+            config.get('seed', DEFAULT_OUTLIER_SEED),
+        )
+    return compute_outlier_bounds(sources, rules)
+
+
+def outlier_mask(
+    df: pd.DataFrame,
+    bounds: Dict[str, Tuple[str, float, float]]
+) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    Evalúa todas las reglas a la vez.
+
+    Las violaciones se guardan en una matriz (reglas × filas); de ella salen
+    la máscara final y las filas marcadas por cada regla, sin volver a
+    recorrer los datos.
+
+    Returns:
+        Tupla con (máscara de filas a conservar, filas marcadas por regla)
+    """
+    if not bounds:
+        return np.ones(len(df), dtype=bool), {}
+
+    violations = np.empty((len(bounds), len(df)), dtype=bool)
+    for i, (col, low, high) in enumerate(bounds.values()):
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        # Las comparaciones con NaN son False: los nulos no son outliers
+        np.logical_or(values < low, values > high, out=violations[i])
+
+    counts = dict(zip(bounds, violations.sum(axis=1).tolist()))
+    return ~violations.any(axis=0), counts
+
+
+def filter_outliers(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    Elimina outliers de un DataFrame según las reglas configuradas.
+
+    Args:
+        df: DataFrame a filtrar
+        config: Configuración ``data_cleaning.outliers`` (``rules``); sin
+            configuración se usan ``DEFAULT_OUTLIER_RULES``
+
+    Returns:
+        Tupla con (DataFrame filtrado, filas marcadas por cada regla).
+        Una fila marcada por varias reglas cuenta en cada una de ellas.
+    """
+    config = config or {}
+    rules = _active_rules(config.get('rules', DEFAULT_OUTLIER_RULES), df.columns)
+    if not rules:
+        return df, {}
+
+    # El DataFrame ya está en memoria: cuantiles exactos de cada columna
+    bounds = outlier_bounds(df, rules, config)
+
+    keep, counts = outlier_mask(df, bounds)
+    for name, count in counts.items():
+        if count > 0:
+            col, low, high = bounds[name]
+            logger.info(f"Regla '{name}': {count} filas fuera de [{low:.2f}, {high:.2f}]")
+
+    return df[keep], counts
@@ -7,6 +7,7 @@ Transforma los datos raw en datos limpios y listos para análisis.
 
 from kedro.pipeline import Pipeline, node, pipeline
 from .nodes import (
+    build_game_keys,
     clean_main_dataset,
     clean_matchinfo,
     clean_bans,
@@ -14,6 +15,7 @@ from .nodes import (
     clean_kills,
     clean_monsters,
     clean_structures,
+    compact_dataset,
     generate_data_quality_report
 )
 
@@ -23,22 +25,36 @@ def create_pipeline(**kwargs) -> Pipeline:
     Crea el pipeline de limpieza de datos.
     
     Este pipeline:
+    0. Construye el diccionario de claves enteras de partida
     1. Limpia cada dataset raw independientemente
-    2. Genera un reporte de calidad de datos
-    3. Guarda los datos limpios en intermediate
+    2. Compacta los tipos de cada dataset limpio
+    3. Genera un reporte de calidad de datos (incluye memoria antes/después;
+       los perfiles se reutilizan entre ejecuciones)
+    4. Guarda los datos limpios en intermediate
     
     Returns:
         Pipeline de Kedro con todos los nodos de limpieza
     """
     return pipeline(
         [
+            # ================================================================
+            # NODO 0: Diccionario de claves de partida (address → game_key)
+            # ================================================================
+            node(
+                func=build_game_keys,
+                inputs=["raw_main_data@match", "raw_matchinfo"],
+                outputs="game_keys",  # data/02_intermediate/game_keys.parquet
+                name="build_game_keys_node",
+                tags=["cleaning", "game_keys"],
+            ),
+            
             # ================================================================
             # NODO 1: Limpiar dataset principal
             # ================================================================
             node(
                 func=clean_main_dataset,
-                inputs="raw_main_data",  # data/01_raw/LeagueofLegends.csv
-                outputs="intermediate_main_data",  # data/02_intermediate/main_clean.csv
+                inputs=["raw_main_data@match", "params:data_cleaning", "game_keys"],  # data/01_raw/LeagueofLegends.csv
+                outputs="cleaned_main_data",
                 name="clean_main_dataset_node",
                 tags=["cleaning", "main"],
             ),
@@ -48,8 +64,8 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=clean_matchinfo,
-                inputs="raw_matchinfo",  # data/01_raw/matchinfo.csv
-                outputs="intermediate_matchinfo",  # data/02_intermediate/matchinfo_clean.csv
+                inputs=["raw_matchinfo", "params:data_cleaning.schemas.matchinfo", "game_keys"],  # data/01_raw/matchinfo.csv
+                outputs="cleaned_matchinfo",
                 name="clean_matchinfo_node",
                 tags=["cleaning", "matchinfo"],
             ),
@@ -59,8 +75,8 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=clean_bans,
-                inputs="raw_bans",  # data/01_raw/bans.csv
-                outputs="intermediate_bans",  # data/02_intermediate/bans_clean.csv
+                inputs=["raw_bans", "params:data_cleaning.schemas.bans", "game_keys"],  # data/01_raw/bans.csv
+                outputs="cleaned_bans",
                 name="clean_bans_node",
                 tags=["cleaning", "bans"],
             ),
@@ -70,8 +86,8 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=clean_gold,
-                inputs="raw_gold",  # data/01_raw/gold.csv
-                outputs="intermediate_gold",  # data/02_intermediate/gold_clean.csv
+                inputs=["raw_gold", "params:data_cleaning.schemas.gold", "game_keys"],  # data/01_raw/gold.csv
+                outputs="cleaned_gold",
                 name="clean_gold_node",
                 tags=["cleaning", "gold"],
             ),
@@ -81,8 +97,8 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=clean_kills,
-                inputs="raw_kills",  # data/01_raw/kills.csv
-                outputs="intermediate_kills",  # data/02_intermediate/kills_clean.csv
+                inputs=["raw_kills", "params:data_cleaning.schemas.kills", "game_keys"],  # data/01_raw/kills.csv
+                outputs="cleaned_kills",
                 name="clean_kills_node",
                 tags=["cleaning", "kills"],
             ),
@@ -92,8 +108,8 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=clean_monsters,
-                inputs="raw_monsters",  # data/01_raw/monsters.csv
-                outputs="intermediate_monsters",  # data/02_intermediate/monsters_clean.csv
+                inputs=["raw_monsters", "params:data_cleaning.schemas.monsters", "game_keys"],  # data/01_raw/monsters.csv
+                outputs="cleaned_monsters",
                 name="clean_monsters_node",
                 tags=["cleaning", "monsters"],
             ),
@@ -103,27 +119,92 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=clean_structures,
-                inputs="raw_structures",  # data/01_raw/structures.csv
-                outputs="intermediate_structures",  # data/02_intermediate/structures_clean.csv
+                inputs=["raw_structures", "params:data_cleaning.schemas.structures", "game_keys"],  # data/01_raw/structures.csv
+                outputs="cleaned_structures",
                 name="clean_structures_node",
                 tags=["cleaning", "structures"],
             ),
             
             # ================================================================
-            # NODO 8: Generar reporte de calidad
+            # NODO 8: Compactar tipos (categorías, enteros angostos, float32)
+            # ================================================================
+            node(
+                func=compact_dataset,
+                inputs=["cleaned_main_data", "params:data_cleaning.compaction"],
+                outputs=["intermediate_main_data@full", "compaction_stats_main"],
+                name="compact_main_node",
+                tags=["cleaning", "compaction", "main"],
+            ),
+            node(
+                func=compact_dataset,
+                inputs=["cleaned_matchinfo", "params:data_cleaning.compaction"],
+                outputs=["intermediate_matchinfo", "compaction_stats_matchinfo"],
+                name="compact_matchinfo_node",
+                tags=["cleaning", "compaction", "matchinfo"],
+            ),
+            node(
+                func=compact_dataset,
+                inputs=["cleaned_bans", "params:data_cleaning.compaction"],
+                outputs=["intermediate_bans@full", "compaction_stats_bans"],
+                name="compact_bans_node",
+                tags=["cleaning", "compaction", "bans"],
+            ),
+            node(
+                func=compact_dataset,
+                inputs=["cleaned_gold", "params:data_cleaning.compaction"],
+                outputs=["intermediate_gold", "compaction_stats_gold"],
+                name="compact_gold_node",
+                tags=["cleaning", "compaction", "gold"],
+            ),
+            node(
+                func=compact_dataset,
+                inputs=["cleaned_kills", "params:data_cleaning.compaction"],
+                outputs=["intermediate_kills", "compaction_stats_kills"],
+                name="compact_kills_node",
+                tags=["cleaning", "compaction", "kills"],
+            ),
+            node(
+                func=compact_dataset,
+                inputs=["cleaned_monsters", "params:data_cleaning.compaction"],
+                outputs=["intermediate_monsters@full", "compaction_stats_monsters"],
+                name="compact_monsters_node",
+                tags=["cleaning", "compaction", "monsters"],
+            ),
+            node(
+                func=compact_dataset,
+                inputs=["cleaned_structures", "params:data_cleaning.compaction"],
+                outputs=["intermediate_structures@full", "compaction_stats_structures"],
+                name="compact_structures_node",
+                tags=["cleaning", "compaction", "structures"],
+            ),
+            
+            # ================================================================
+            # NODO 9: Generar reporte de calidad
             # ================================================================
             node(
                 func=generate_data_quality_report,
                 inputs=[
-                    "intermediate_main_data",
+                    "intermediate_main_data@full",
                     "intermediate_matchinfo",
-                    "intermediate_bans",
+                    "intermediate_bans@full",
                     "intermediate_gold",
                     "intermediate_kills",
-                    "intermediate_monsters",
-                    "intermediate_structures",
+                    "intermediate_monsters@full",
+                    "intermediate_structures@full",
+                    "data_quality_profiles_previous",
+                    "params:data_cleaning.profiling",
+                    "compaction_stats_main",
+                    "compaction_stats_matchinfo",
+                    "compaction_stats_bans",
+                    "compaction_stats_gold",
+                    "compaction_stats_kills",
+                    "compaction_stats_monsters",
+                    "compaction_stats_structures",
+                ],
+                outputs=[
+                    "data_quality_report",  # data/08_reporting/data_quality_report_cleaning.csv
+                    "data_quality_profiles",  # perfiles reutilizados en la siguiente ejecución
                 ],
-                outputs="data_quality_report",  # data/08_reporting/data_quality_report_cleaning.csv
                 name="generate_quality_report_node",
                 tags=["reporting", "quality"],
             ),
@@ -0,0 +1,225 @@
+"""
+Motor de Perfilado de Calidad de Datos
+
+El reporte de calidad recorría cada dataset varias veces (``duplicated()``,
+``isnull().sum()`` dos veces y ``memory_usage(deep=True)``). Este motor hace
+una sola pasada por las filas nuevas y guarda un perfil por dataset que se
+reutiliza en la siguiente ejecución:
+
+    - Hash de 64 bits por fila (``hash_pandas_object``), calculado una vez:
+      los duplicados se cuentan con los hashes y el perfil guarda el arreglo
+    - Nulos por columna con un único ``isna().sum()``
+    - Memoria: solo las columnas ``object`` necesitan el recorrido profundo
+
+Modos de perfilado (columna ``profile_mode`` del reporte):
+
+    - ``cached``: el dataset no cambió respecto del perfil guardado
+    - ``incremental``: las filas del perfil guardado siguen siendo el prefijo
+      del dataset; solo se perfilan las filas nuevas y se combinan los conteos
+    - ``full``: perfil completo (primera ejecución o datos modificados)
+    - ``sampled``: datasets con más de ``sample_threshold`` filas se perfilan
+      sobre una muestra aleatoria; el porcentaje de nulos se reporta con su
+      cota de error de Hoeffding (``missing_percentage_error``) y los
+      duplicados no se estiman (NaN)
+
+Para decidir si el perfil guardado sigue valiendo se comparan el esquema y
+un digest del contenido completo del prefijo (``_content_digest``): cualquier
+celda editada invalida el perfil. El digest recorre los bytes de cada columna
+(códigos en las ``category``) con ``blake2b``, sin el hash por fila, así que
+en los datasets numéricos y categóricos el modo ``cached`` es un recorrido
+lineal de memoria, mucho más barato que perfilar. Las columnas ``object`` sí
+se hashean valor por valor, con un costo del orden del perfil completo. Solo
+el modo ``sampled`` trabaja sobre una muestra.
+
+Configuración (``data_cleaning.profiling``)::
+
+    sample_threshold: 5000000
+    sample_rows: 200000
+    confidence: 0.99
+    seed: 42
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PROFILING = {
+    'sample_threshold': 5_000_000,
+    'sample_rows': 200_000,
+    'confidence': 0.99,
+    'seed': 42,
+}
+
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _schema_signature(df: pd.DataFrame) -> List[Tuple[str, str]]:
+    return [(str(col), str(dtype)) for col, dtype in df.dtypes.items()]
+
+
+def _object_columns(df: pd.DataFrame) -> List[str]:
+    return [col for col, dtype in df.dtypes.items() if pd.api.types.is_object_dtype(dtype)]
+
+
+def _fixed_memory_bytes(df: pd.DataFrame) -> int:
+    """Memoria del índice y de las columnas que no son ``object`` (barata)."""
+    fixed = df.drop(columns=_object_columns(df))
+    return int(fixed.memory_usage(index=True, deep=True).sum())
+
+
+def _object_memory_bytes(df: pd.DataFrame) -> int:
+    """Memoria profunda de las columnas ``object`` (recorre cada valor)."""
+    columns = _object_columns(df)
+    if not columns:
+        return 0
+    return int(df[columns].memory_usage(index=False, deep=True).sum())
+
+
+def _content_digest(df: pd.DataFrame) -> str:
+    """
+    Digest del contenido completo de ``df`` (nombres, tipos y valores).
+
+    Las columnas numéricas se leen como bytes y las ``category`` por sus
+    códigos y categorías; solo las demás (``object``, extensiones) pasan por
+    ``hash_array``.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for col, values in df.items():
+        digest.update(f'{col}:{values.dtype}'.encode())
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            digest.update(pd.util.hash_array(values.cat.categories.to_numpy()).tobytes())
+            data = values.cat.codes.to_numpy()
+        elif isinstance(values.dtype, np.dtype) and values.dtype.kind in 'biufcmM':
+            data = values.to_numpy()
+        else:
+            data = pd.util.hash_array(values.to_numpy(dtype=object))
+        digest.update(np.ascontiguousarray(data).view(np.uint8))
+    return digest.hexdigest()
+
+
+def _prefix_matches(df: pd.DataFrame, cached: Dict[str, Any]) -> bool:
+    """Compara el digest de las primeras filas con el del perfil guardado."""
+    return _content_digest(df.iloc[:len(cached['row_hashes'])]) == cached.get('content_digest')
+
+
+def _base_report(df: pd.DataFrame) -> Dict[str, Any]:
+    return {
+        'total_rows': len(df),
+        'total_columns': len(df.columns),
+        'numeric_columns': len(df.select_dtypes(include=[np.number]).columns),
+        'categorical_columns': len(df.select_dtypes(include=['object', 'category']).columns),
+    }
+
+
+def _report_from_state(df: pd.DataFrame, state: Dict[str, Any], mode: str) -> Dict[str, Any]:
+    cells = len(df) * len(df.columns)
+    missing = int(state['missing'].sum())
+    return {
+        **_base_report(df),
+        'missing_values': missing,
+        'missing_percentage': round(missing / cells * 100, 2) if cells else 0.0,
+        'missing_percentage_error': 0.0,
+        'duplicate_rows': state['duplicates'],
+        'memory_usage_mb': round((_fixed_memory_bytes(df) + state['object_memory']) / (1024 ** 2), 2),
+        'profile_mode': mode,
+        'fingerprint': state['fingerprint'][:12],
+    }
+
+
+def _sampled_report(df: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Perfil sobre una muestra uniforme de filas.
+
+    Cada fila aporta su fracción de celdas nulas (un valor en [0, 1]), así que
+    la cota de Hoeffding ``sqrt(ln(2 / (1 - confianza)) / (2 n))`` acota el
+    error del porcentaje de nulos con la confianza indicada.
+    """
+    n = min(config['sample_rows'], len(df))
+    rng = np.random.default_rng(config['seed'])
+    sample = df.iloc[np.sort(rng.choice(len(df), size=n, replace=False))]
+
+    missing_fraction = sample.isna().mean(axis=1).mean() if len(df.columns) else 0.0
+    error = np.sqrt(np.log(2 / (1 - config['confidence'])) / (2 * n))
+    scale = len(df) / n
+
+    return {
+        **_base_report(df),
+        'missing_values': int(round(missing_fraction * len(df) * len(df.columns))),
+        'missing_percentage': round(missing_fraction * 100, 2),
+        'missing_percentage_error': round(error * 100, 2),
+        'duplicate_rows': np.nan,
+        'memory_usage_mb': round(
+            (_fixed_memory_bytes(df) + _object_memory_bytes(sample) * scale) / (1024 ** 2), 2
+        ),
+        'profile_mode': 'sampled',
+        'fingerprint': None,
+    }
+
+
+def profile_dataset(
+    df: pd.DataFrame,
+    cached: Optional[Dict[str, Any]] = None,
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Perfila un dataset reutilizando el perfil de la ejecución anterior.
+
+    Args:
+        df: Dataset limpio
+        cached: Estado guardado para este dataset (``None`` si no hay)
+        config: Configuración ``data_cleaning.profiling``
+
+    Returns:
+        Tupla con (métricas del reporte, estado a guardar). El estado es
+        ``None`` en modo muestreado.
+    """
+    config = {**DEFAULT_PROFILING, **(config or {})}
+
+    if len(df) > config['sample_threshold']:
+        return _sampled_report(df, config), None
+
+    start, mode = 0, 'full'
+    schema = _schema_signature(df)
+    if (
+        cached is not None
+        and cached['schema'] == schema
+        and len(df) >= len(cached['row_hashes'])
+        and _prefix_matches(df, cached)
+    ):
+        start = len(cached['row_hashes'])
+        if start == len(df):
+            return _report_from_state(df, cached, 'cached'), cached
+        mode = 'incremental'
+    else:
+        cached = None
+
+    new_rows = df.iloc[start:]
+    new_hashes = _row_hashes(new_rows)
+    seen = cached['unique_hashes'] if cached is not None else np.empty(0, dtype=np.uint64)
+
+    # Una fila nueva es duplicada si su hash ya estaba en el prefijo o se
+    # repite dentro de las filas nuevas
+    idx = np.minimum(np.searchsorted(seen, new_hashes), max(len(seen) - 1, 0))
+    in_prefix = seen[idx] == new_hashes if len(seen) else np.zeros(len(new_hashes), dtype=bool)
+    duplicated = in_prefix | pd.Series(new_hashes).duplicated().to_numpy()
+
+    state = {
+        'schema': schema,
+        'row_hashes': np.concatenate([cached['row_hashes'], new_hashes]) if cached else new_hashes,
+        'unique_hashes': np.union1d(seen, new_hashes),
+        'missing': new_rows.isna().sum().to_numpy() + (cached['missing'] if cached else 0),
+        'duplicates': int(duplicated.sum()) + (cached['duplicates'] if cached else 0),
+        'object_memory': _object_memory_bytes(new_rows) + (cached['object_memory'] if cached else 0),
+    }
+    state['fingerprint'] = hashlib.sha1(state['row_hashes'].tobytes()).hexdigest()
+    state['content_digest'] = _content_digest(df)
+
+    return _report_from_state(df, state, mode), state
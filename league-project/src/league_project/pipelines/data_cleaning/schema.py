@@ -0,0 +1,215 @@
+"""
+Motor de Limpieza Declarativo
+
+Aplica a un DataFrame el esquema de limpieza declarado en ``parameters.yml``
+(``data_cleaning.schemas.<dataset>``). Cada columna se transforma en una sola
+pasada (tipo + normalizaciones de texto + recorte), las validaciones de rango
+se combinan en una única máscara booleana y los duplicados se eliminan junto
+con las filas inválidas en un solo filtrado.
+
+No se hace una copia defensiva del DataFrame completo: el resultado comparte
+los datos de las columnas que el esquema no toca, por lo que el costo de cada
+nodo es proporcional a las columnas declaradas.
+
+Ejemplo de esquema::
+
+    columns:
+      gameid: {dtype: str}
+      time: {dtype: numeric, min: 0}
+      team: {normalize: [strip, title]}
+    column_patterns:
+      gold: {clip_lower: 0, numeric_only: true}
+    derived_features:
+      - {name: gold_diff, op: difference, left: goldblue, right: goldred}
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from league_project.game_keys import encode_game_keys
+
+from .derived_features import compute_derived_features
+
+logger = logging.getLogger(__name__)
+
+
+# Normalizaciones de texto soportadas (se aplican sobre los valores únicos)
+_STRING_OPS = {
+    'strip': str.strip,
+    'lower': str.lower,
+    'upper': str.upper,
+    'title': str.title,
+}
+
+# Componentes de fecha que se pueden extraer de columnas datetime
+_DATE_PARTS = {
+    'year': lambda s: s.dt.year,
+    'month': lambda s: s.dt.month,
+    'day': lambda s: s.dt.day,
+    'day_of_week': lambda s: s.dt.dayofweek,
+}
+
+
+def standardize_column_names(columns: pd.Index) -> pd.Index:
+    """Convierte nombres de columnas a minúsculas, sin espacios."""
+    return columns.str.lower().str.strip().str.replace(' ', '_')
+
+
+def _normalize_strings(series: pd.Series, operations: List[str]) -> pd.Series:
+    """
+    Aplica normalizaciones de texto en una sola pasada por la columna.
+
+    La columna se factoriza una vez; las operaciones se aplican solo a los
+    valores únicos y el resultado se reconstruye con los códigos.
+    """
+    funcs = [_STRING_OPS[op] for op in operations]
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+
+    normalized = np.empty(len(uniques) + 1, dtype=object)
+    for i, value in enumerate(uniques):
+        if isinstance(value, str):
+            for func in funcs:
+                value = func(value)
+        normalized[i] = value
+    normalized[-1] = np.nan  # código -1 (nulos) apunta a la última posición
+
+    return pd.Series(normalized[codes], index=series.index, name=series.name)
+
+
+def _convert_dtype(series: pd.Series, dtype: str) -> pd.Series:
+    if dtype == 'str':
+        return series.astype(str)
+    if dtype == 'numeric':
+        return pd.to_numeric(series, errors='coerce')
+    if dtype == 'datetime':
+        return pd.to_datetime(series, errors='coerce')
+    raise ValueError(f"Tipo de columna no soportado en el esquema: '{dtype}'")
+
+
+def _transform_column(series: pd.Series, spec: Dict[str, Any]) -> pd.Series:
+    """Aplica tipo, normalizaciones y recorte de una columna."""
+    if 'dtype' in spec:
+        series = _convert_dtype(series, spec['dtype'])
+
+    if spec.get('normalize'):
+        series = _normalize_strings(series, spec['normalize'])
+
+    if 'clip_lower' in spec or 'clip_upper' in spec:
+        series = series.clip(lower=spec.get('clip_lower'), upper=spec.get('clip_upper'))
+
+    return series
+
+
+def _validity_mask(series: pd.Series, spec: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Máscara de filas válidas según las reglas de la columna (None = todas)."""
+    mask = None
+
+    def _combine(current, new):
+        return new if current is None else current & new
+
+    if spec.get('required'):
+        mask = _combine(mask, (series.notna() & (series != '')).to_numpy())
+    if 'min' in spec:
+        mask = _combine(mask, (series >= spec['min']).to_numpy())
+    if 'max' in spec:
+        mask = _combine(mask, (series <= spec['max']).to_numpy())
+
+    return mask
+
+
+def _resolve_column_specs(
+    columns: pd.Index,
+    df: pd.DataFrame,
+    schema: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """Combina las reglas por nombre exacto y por patrón para cada columna."""
+    specs = {
+        col: dict(spec or {})
+        for col, spec in (schema.get('columns') or {}).items()
+        if col in columns
+    }
+
+    for pattern, pattern_spec in (schema.get('column_patterns') or {}).items():
+        regex = re.compile(pattern, re.IGNORECASE)
+        pattern_spec = dict(pattern_spec or {})
+        numeric_only = pattern_spec.pop('numeric_only', False)
+        for col in columns:
+            if not regex.search(col):
+                continue
+            if numeric_only and not pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            specs[col] = {**pattern_spec, **specs.get(col, {})}
+
+    return specs
+
+
+def apply_cleaning_schema(
+    df: pd.DataFrame,
+    schema: Dict[str, Any],
+    dataset_name: str = 'dataset',
+    deduplicate: bool = True,
+    game_keys: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """
+    Limpia un DataFrame según su esquema declarativo.
+
+    Pasos:
+        1. Estandariza nombres de columnas (sin copiar los datos) y
+           reemplaza ``address`` por la clave entera ``game_key``
+        2. Transforma cada columna declarada en una sola pasada
+        3. Extrae componentes de fecha y calcula features derivadas
+        4. Filtra filas inválidas y duplicadas con una única máscara
+
+    Args:
+        df: DataFrame raw
+        schema: Esquema del dataset (``data_cleaning.schemas.<dataset>``)
+        dataset_name: Nombre del dataset (solo para el log)
+        deduplicate: Si True, elimina filas duplicadas completas
+        game_keys: Tabla ``address → game_key``; si es None se conserva ``address``
+
+    Returns:
+        DataFrame limpio
+    """
+    schema = schema or {}
+
+    # Copia superficial: las columnas no tocadas comparten memoria con df
+    df_clean = df.copy(deep=False)
+    df_clean.columns = standardize_column_names(df_clean.columns)
+    if game_keys is not None:
+        df_clean = encode_game_keys(df_clean, game_keys, dataset_name=dataset_name)
+
+    specs = _resolve_column_specs(df_clean.columns, df_clean, schema)
+
+    valid = np.ones(len(df_clean), dtype=bool)
+    for col, spec in specs.items():
+        df_clean[col] = _transform_column(df_clean[col], spec)
+
+        col_mask = _validity_mask(df_clean[col], spec)
+        if col_mask is not None:
+            invalidas = int((valid & ~col_mask).sum())
+            if invalidas > 0:
+                logger.info(f"[{dataset_name}] Columna '{col}': {invalidas} filas inválidas")
+            valid &= col_mask
+
+        for part in spec.get('extract', []):
+            df_clean[part] = _DATE_PARTS[part](df_clean[col])
+
+    df_clean = compute_derived_features(df_clean, schema.get('derived_features'))
+
+    # Las filas duplicadas de una fila inválida también son inválidas, así que
+    # filtrar y deduplicar con la misma máscara equivale a hacerlo en orden.
+    keep = valid
+    if deduplicate:
+        duplicated = df_clean.duplicated().to_numpy()
+        if duplicated.any():
+            logger.info(f"[{dataset_name}] {int((duplicated & valid).sum())} duplicados eliminados")
+        keep = valid & ~duplicated
+
+    if not keep.all():
+        df_clean = df_clean[keep]
+
+    return df_clean
@@ -0,0 +1,127 @@
+"""
+Modo de Limpieza por Chunks (Streaming)
+
+Permite limpiar archivos raw que no caben en memoria. Cuando el catálogo carga
+un CSV con ``load_args: {chunksize: N}`` el nodo recibe un iterador de chunks
+en lugar de un DataFrame; cada chunk se limpia con el mismo esquema que el
+modo normal y se entrega al dataset de salida, que lo escribe como un row
+group Parquet nuevo (ver ``league_project.datasets.ChunkedParquetDataset``).
+
+La deduplicación entre chunks usa un conjunto de huellas (hash de 64 bits por
+fila), por lo que solo se guardan 8 bytes por fila única en lugar de la fila.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .schema import apply_cleaning_schema
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkStream:
+    """
+    Iterable de chunks limpios que se consume una sola vez.
+
+    No es un ``Iterator`` a propósito: Kedro guarda los iteradores chunk por
+    chunk llamando a ``save`` varias veces, mientras que un ``ChunkStream`` se
+    entrega completo en un único ``save`` para que el dataset mantenga un solo
+    escritor Parquet abierto.
+    """
+
+    def __init__(self, chunks: Iterator[pd.DataFrame]):
+        self._chunks = chunks
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return self._chunks
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ChunkStream":
+        # Un stream no se puede copiar; MemoryDataset recibe la misma instancia
+        return self
+
+
+class FingerprintSet:
+    """
+    Conjunto de huellas ``uint64`` guardado en arreglos ordenados.
+
+    Las huellas nuevas se agregan como un bloque ordenado y los bloques se
+    fusionan cuando el último es de tamaño comparable al anterior, de modo que
+    siempre hay O(log n) bloques para buscar con ``searchsorted``.
+    """
+
+    def __init__(self):
+        self._runs: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self._runs)
+
+    def contains(self, fingerprints: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(fingerprints), dtype=bool)
+        for run in self._runs:
+            idx = np.searchsorted(run, fingerprints)
+            idx[idx == len(run)] = 0
+            found |= run[idx] == fingerprints
+        return found
+
+    def add(self, fingerprints: np.ndarray) -> None:
+        if len(fingerprints) == 0:
+            return
+        self._runs.append(np.unique(fingerprints))
+        while len(self._runs) > 1 and len(self._runs[-2]) <= 2 * len(self._runs[-1]):
+            last = self._runs.pop()
+            self._runs[-1] = np.union1d(self._runs[-1], last)
+
+
+def is_chunked(data: Any) -> bool:
+    """Indica si un input es un iterable de chunks y no un DataFrame."""
+    return not isinstance(data, pd.DataFrame) and isinstance(data, Iterable)
+
+
+def stream_clean(
+    chunks: Iterable[pd.DataFrame],
+    schema: Dict[str, Any],
+    dataset_name: str,
+    game_keys: Optional[pd.DataFrame] = None
+) -> ChunkStream:
+    """
+    Limpia un dataset chunk por chunk con deduplicación entre chunks.
+
+    Args:
+        chunks: Iterable de DataFrames raw (p. ej. ``TextFileReader``)
+        schema: Esquema de limpieza del dataset
+        dataset_name: Nombre del dataset (solo para el log)
+        game_keys: Tabla ``address → game_key`` (opcional)
+
+    Returns:
+        ``ChunkStream`` con los chunks limpios
+    """
+    def _generate() -> Iterator[pd.DataFrame]:
+        seen = FingerprintSet()
+        filas_entrada = 0
+        filas_salida = 0
+
+        for n_chunk, chunk in enumerate(chunks, 1):
+            filas_entrada += len(chunk)
+            cleaned = apply_cleaning_schema(
+                chunk, schema, dataset_name=dataset_name, deduplicate=False,
+                game_keys=game_keys
+            )
+
+            fingerprints = pd.util.hash_pandas_object(cleaned, index=False).to_numpy()
+            first_in_chunk = ~pd.Series(fingerprints).duplicated().to_numpy()
+            keep = first_in_chunk & ~seen.contains(fingerprints)
+            seen.add(fingerprints[keep])
+
+            filas_salida += int(keep.sum())
+            logger.debug(f"[{dataset_name}] Chunk {n_chunk}: {len(chunk)} → {int(keep.sum())} filas")
+            yield cleaned[keep]
+
+        logger.info(
+            f"[{dataset_name}] Streaming completado: {filas_entrada} filas leídas, "
+            f"{filas_salida} filas escritas, {filas_entrada - filas_salida} eliminadas"
+        )
+
+    return ChunkStream(_generate())
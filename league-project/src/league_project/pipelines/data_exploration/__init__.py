@@ -5,7 +5,7 @@ Este pipeline se encarga del análisis exploratorio de datos (EDA).
 Sigue la metodología CRISP-DM en la fase de Comprensión de Datos.
 """
 
-from .pipeline import create_pipeline
+from .pipeline import create_incremental_pipeline, create_pipeline
 
-__all__ = ["create_pipeline"]
+__all__ = ["create_pipeline", "create_incremental_pipeline"]
 
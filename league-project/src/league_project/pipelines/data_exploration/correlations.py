@@ -0,0 +1,234 @@
+"""
+Motor de Correlaciones
+
+``analyze_correlations`` calculaba la matriz completa con ``DataFrame.corr()``
+y la pasaba a formato largo con dos bucles anidados y ``.iloc`` por par, un
+trabajo O(p²) interpretado. Este motor trabaja con NumPy:
+
+    - Las columnas se centran y escalan una vez (en float64, por bloques de
+      columnas), así que los productos no desbordan aunque la columna tenga
+      valores grandes (p. ej. ``game_key``). Se trabaja en ``float64`` y solo
+      los DataFrames con al menos ``float32_columns`` columnas pasan a
+      ``float32`` para reducir memoria y tiempo de los productos
+    - La matriz se calcula por bloques de ``block_size`` columnas con
+      productos de matrices, así que la memoria de trabajo es O(block_size²)
+    - Los pares del triángulo superior se extraen con índices
+      (``np.triu_indices``) y se filtran dentro de cada bloque, sin
+      materializar las p² filas cuando se pide ``top_k`` o ``threshold``
+    - ``spearman`` calcula los rangos de cada columna una sola vez y los
+      reutiliza en todos los bloques
+
+Con valores nulos se usan, como ``DataFrame.corr()``, las filas completas de
+cada par (las sumas por par salen de productos con la máscara de nulos). En
+``spearman`` los rangos se calculan por columna sobre sus valores no nulos, así
+que con nulos el resultado puede diferir levemente del de pandas (que vuelve a
+rankear cada par).
+
+Configuración (``data_exploration.correlations``)::
+
+    method: pearson      # pearson | spearman
+    top_k: null          # solo los k pares con mayor |correlación|
+    threshold: 0.0       # solo pares con |correlación| >= threshold
+    block_size: 512
+    float32_columns: 1000  # desde cuántas columnas se usa float32
+"""
+
+import logging
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CORRELATIONS = {
+    'method': 'pearson',
+    'top_k': None,
+    'threshold': 0.0,
+    'block_size': 512,
+    'float32_columns': 1000,
+}
+
+_METHODS = ('pearson', 'spearman')
+
+
+def _prepare_matrix(
+    numeric: pd.DataFrame,
+    method: str,
+    dtype: type = np.float64,
+    block_size: int = 512
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Matriz centrada y escalada (orden Fortran: cada columna contigua).
+
+    El centrado y el escalado se hacen en float64 por bloques de columnas y
+    recién después se pasa a ``dtype``: con desvío 1 las sumas de cuadrados
+    de los bloques no desbordan en float32.
+
+    Returns:
+        Tupla con (valores centrados con nulos en 0, máscara de no nulos o
+        ``None`` si no hay nulos)
+    """
+    if method == 'spearman':
+        # Rangos calculados una sola vez por columna (los nulos siguen nulos)
+        numeric = numeric.rank(method='average')
+
+    n_rows, n_cols = numeric.shape
+    values = np.empty((n_rows, n_cols), dtype=dtype, order='F')
+    missing = np.zeros((n_rows, n_cols), dtype=bool, order='F')
+    for start in range(0, n_cols, block_size):
+        block = slice(start, min(start + block_size, n_cols))
+        chunk = numeric.iloc[:, block].to_numpy(dtype=np.float64, na_value=np.nan)
+        missing[:, block] = np.isnan(chunk)
+        with warnings.catch_warnings():
+            # Columnas completamente nulas
+            warnings.simplefilter('ignore', RuntimeWarning)
+            chunk -= np.nanmean(chunk, axis=0)
+            scale = np.nanstd(chunk, axis=0)
+        # Las columnas constantes quedan en 0 (correlación indefinida)
+        chunk /= np.where(scale > 0, scale, 1.0)
+        values[:, block] = chunk
+
+    if not missing.any():
+        return values, None
+
+    values[missing] = 0.0
+    return values, np.asfortranarray(~missing, dtype=dtype)
+
+
+def _complete_block(values: np.ndarray, a: slice, b: slice) -> np.ndarray:
+    """Correlaciones de un bloque sin nulos: producto de columnas normalizadas."""
+    x, y = values[:, a], values[:, b]
+    norm_x = np.sqrt(np.einsum('ij,ij->j', x, x, dtype=np.float64))
+    norm_y = np.sqrt(np.einsum('ij,ij->j', y, y, dtype=np.float64))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (x.T @ y) / np.outer(norm_x, norm_y)
+
+
+def _pairwise_block(values: np.ndarray, mask: np.ndarray, a: slice, b: slice) -> np.ndarray:
+    """
+    Correlaciones de un bloque con nulos, sobre las filas completas de cada par.
+
+    Cada suma por par (n, Σx, Σy, Σx², Σy², Σxy) es un producto de matrices
+    entre los valores (nulos en 0) y la máscara de no nulos.
+    """
+    x, y = values[:, a], values[:, b]
+    mx, my = mask[:, a], mask[:, b]
+
+    n = (mx.T @ my).astype(np.float64)
+    sx = (x.T @ my).astype(np.float64)
+    sy = (mx.T @ y).astype(np.float64)
+    sxx = ((x * x).T @ my).astype(np.float64)
+    syy = (mx.T @ (y * y)).astype(np.float64)
+    sxy = (x.T @ y).astype(np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx ** 2 / n
+        var_y = syy - sy ** 2 / n
+        corr = cov / np.sqrt(var_x * var_y)
+
+    corr[(n < 2) | (var_x <= 0) | (var_y <= 0)] = np.nan
+    return corr
+
+
+def _block_pairs(
+    corr: np.ndarray,
+    a: slice,
+    b: slice,
+    threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pares (i < j) de un bloque que superan el umbral, con índices globales."""
+    if a == b:
+        rows, cols = np.triu_indices(corr.shape[0], k=1)
+    else:
+        rows, cols = np.indices(corr.shape).reshape(2, -1)
+
+    values = corr[rows, cols]
+    if threshold > 0:
+        # Las comparaciones con NaN son False: los pares indefinidos se descartan
+        keep = np.abs(values) >= threshold
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+    return rows + a.start, cols + b.start, values
+
+
+def _top_k(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    values: np.ndarray,
+    k: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Conserva los ``k`` pares con mayor |correlación| (NaN al final)."""
+    if len(values) <= k:
+        return rows, cols, values
+    strength = np.nan_to_num(np.abs(values), nan=-1.0)
+    keep = np.argpartition(-strength, k - 1)[:k]
+    return rows[keep], cols[keep], values[keep]
+
+
+def correlation_pairs(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """
+    Pares de variables numéricas ordenados por |correlación|.
+
+    Args:
+        df: DataFrame con las variables a correlacionar (solo se usan las
+            columnas numéricas)
+        config: Configuración ``data_exploration.correlations``
+
+    Returns:
+        DataFrame con columnas variable_1, variable_2, correlation y
+        abs_correlation, ordenado de mayor a menor |correlación| (los pares
+        indefinidos, NaN, van al final)
+    """
+    config = {**DEFAULT_CORRELATIONS, **(config or {})}
+    method, top_k = config['method'], config['top_k']
+    threshold = config['threshold'] or 0.0
+    block_size = max(1, int(config['block_size']))
+    if method not in _METHODS:
+        raise ValueError(
+            f"Método de correlación no soportado: '{method}' (opciones: {', '.join(_METHODS)})"
+        )
+
+    numeric = df.select_dtypes(include=[np.number])
+    names = numeric.columns.to_numpy()
+    # float32 solo en DataFrames anchos: en los angostos float64 es barato y
+    # conserva las correlaciones exactas (p. ej. 1.0 entre columnas colineales)
+    dtype = np.float32 if len(names) >= config['float32_columns'] else np.float64
+    values, mask = _prepare_matrix(numeric, method, dtype, block_size)
+
+    p = len(names)
+    blocks = [slice(start, min(start + block_size, p)) for start in range(0, p, block_size)]
+    found: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for i, a in enumerate(blocks):
+        for b in blocks[i:]:
+            if mask is None:
+                corr = _complete_block(values, a, b)
+            else:
+                corr = _pairwise_block(values, mask, a, b)
+            found.append(_block_pairs(np.clip(corr, -1.0, 1.0), a, b, threshold))
+            if top_k:
+                # Se acumulan solo los candidatos: nunca más de 2·top_k pares
+                found = [_top_k(*map(np.concatenate, zip(*found)), top_k)]
+
+    if found:
+        rows, cols, corr_values = map(np.concatenate, zip(*found))
+    else:
+        rows = cols = np.empty(0, dtype=np.int64)
+        corr_values = np.empty(0, dtype=np.float64)
+
+    corr_values = corr_values.astype(np.float64)
+    abs_values = np.abs(corr_values)
+    # Mayor |correlación| primero; empates en el orden de las columnas
+    order = np.lexsort((cols, rows, -np.nan_to_num(abs_values, nan=-1.0)))
+
+    return pd.DataFrame({
+        'variable_1': names[rows[order]],
+        'variable_2': names[cols[order]],
+        'correlation': corr_values[order],
+        'abs_correlation': abs_values[order],
+    })
@@ -0,0 +1,292 @@
+"""
+Cubo Analítico de EDA
+
+Los reportes de equipos, bans y objetivos se calculan sobre todo el dataset;
+cortarlos por liga, año o split obligaba a editar los nodos y volver a correr
+la EDA. ``build_analytics_cube`` materializa tres tablas de agregados aditivos
+al grano ``league × year × season × team``:
+
+    - ``analytics_cube_teams``: + ``side``; games, wins, length_sum,
+      length_count, ban_games (partidas con bans registrados)
+    - ``analytics_cube_bans``: + ``champion`` (``team`` = equipo que banea);
+      ban_count, games_banned, priority_sum
+    - ``analytics_cube_objectives``: + ``type`` (``team`` = equipo que captura);
+      count, time_sum, time_count
+
+Cada tabla se guarda ordenada por sus dimensiones y con un row group Parquet
+por liga (``ChunkStream``), así ``load_args.filters`` por liga lee solo esa
+partición. ``AnalyticsCube`` responde los rollups desde esas tablas, sin leer
+los datos limpios de eventos::
+
+    cube = AnalyticsCube(
+        catalog.load('analytics_cube_teams'),
+        catalog.load('analytics_cube_bans'),
+        catalog.load('analytics_cube_objectives'),
+    )
+    cube.team_performance(by=['team'], league='LCK', year=2017)
+    cube.champion_bans(by=['season'], league=['LCK', 'NALCS'])
+    cube.neutral_objectives(by=['year'])
+
+Los filtros aceptan un valor o una lista; se resuelven por búsqueda binaria
+sobre el índice ordenado de cada tabla.
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from league_project.pipelines.data_cleaning.streaming import ChunkStream
+
+from .nodes import BAN_COLUMNS, long_ban_table, side_from_team, stack_labels
+
+logger = logging.getLogger(__name__)
+
+
+# Dimensiones comunes del cubo, en el orden del índice
+CUBE_DIMENSIONS = ['league', 'year', 'season', 'team']
+
+# Dimensión propia y medidas (todas aditivas) de cada tabla del cubo
+CUBE_TABLES = {
+    'teams': ('side', ['games', 'wins', 'length_sum', 'length_count', 'ban_games']),
+    'bans': ('champion', ['ban_count', 'games_banned', 'priority_sum']),
+    'objectives': ('type', ['count', 'time_sum', 'time_count']),
+}
+
+
+def _game_dimensions(
+    main: pd.DataFrame,
+    game_keys: pd.Series,
+    side: pd.Series
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Liga, año, split y equipo (según el lado) de cada fila de eventos, y la
+    máscara de filas cuya partida está en ``main``.
+    """
+    games = main.drop_duplicates('game_key').set_index('game_key')
+    positions = games.index.get_indexer(game_keys)
+    found = positions >= 0
+    positions = positions[found]
+    side = side.to_numpy()[found]
+
+    dimensions = pd.DataFrame({
+        dim: games[dim].to_numpy()[positions] for dim in ['league', 'year', 'season']
+    })
+    dimensions['team'] = np.where(
+        side == 'blue',
+        games['blueteamtag'].astype(object).to_numpy()[positions],
+        games['redteamtag'].astype(object).to_numpy()[positions],
+    )
+    return dimensions, found
+
+
+def _cube_table(long: pd.DataFrame, item: str, aggregations: Dict[str, Tuple[str, str]]) -> pd.DataFrame:
+    """Agrega la tabla larga al grano del cubo y la ordena por sus dimensiones."""
+    keys = CUBE_DIMENSIONS + [item]
+    long = long.astype({dim: object for dim in keys if dim != 'year'})
+    long[['league', 'season', 'team', item]] = long[['league', 'season', 'team', item]].fillna('unknown')
+    cube = long.groupby(keys, sort=False).agg(**aggregations).reset_index()
+    return cube.sort_values(keys, ignore_index=True)
+
+
+def _league_partitions(cube: pd.DataFrame) -> ChunkStream:
+    """Un chunk (row group) por liga; ``cube`` ya está ordenado por liga."""
+    def _generate() -> Iterator[pd.DataFrame]:
+        bounds = np.flatnonzero(cube['league'].to_numpy()[1:] != cube['league'].to_numpy()[:-1]) + 1
+        for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(cube)]):
+            yield cube.iloc[start:end]
+
+    return ChunkStream(_generate() if len(cube) else iter([cube]))
+
+
+def cube_tables(
+    main: pd.DataFrame,
+    bans: pd.DataFrame,
+    monsters: pd.DataFrame
+) -> Dict[str, pd.DataFrame]:
+    """
+    Tablas del cubo (``teams``, ``bans``, ``objectives``) como DataFrames.
+
+    Args:
+        main: Dataset principal limpio (``game_key``, ``league``, ``year``,
+            ``season``, equipos, resultados y ``gamelength_minutes``)
+        bans: Dataset de bans limpio (``game_key``, ``team``, ``ban_1``..``ban_5``)
+        monsters: Dataset de monsters limpio (``game_key``, ``team``, ``type``, ``time``)
+    """
+    n_games = len(main)
+    game_length = main['gamelength_minutes'].to_numpy(dtype=np.float64)
+    long_bans = long_ban_table(bans, [col for col in BAN_COLUMNS if col in bans.columns])
+    has_bans = np.isin(main['game_key'].to_numpy(), long_bans['game_key'].to_numpy())
+
+    # Equipos: una fila por equipo y partida
+    teams = pd.DataFrame({
+        dim: np.tile(main[dim].astype(object).to_numpy(), 2) for dim in ['league', 'year', 'season']
+    })
+    teams['team'] = stack_labels(main['blueteamtag'], main['redteamtag']).astype(object).to_numpy()
+    teams['side'] = np.repeat(['blue', 'red'], n_games)
+    teams['win'] = np.concatenate([main['bresult'].to_numpy(), main['rresult'].to_numpy()]).astype(np.int64)
+    teams['game_length'] = np.tile(game_length, 2)
+    teams['has_length'] = ~np.isnan(teams['game_length'].to_numpy())
+    teams['has_bans'] = np.tile(has_bans, 2)
+    teams_cube = _cube_table(teams, 'side', {
+        'games': ('win', 'size'),
+        'wins': ('win', 'sum'),
+        'length_sum': ('game_length', 'sum'),
+        'length_count': ('has_length', 'sum'),
+        'ban_games': ('has_bans', 'sum'),
+    })
+
+    # Bans: una fila por ban, con el equipo que banea
+    long_bans['priority'] = long_bans['priority'].astype(np.int64)
+    dimensions, found = _game_dimensions(main, long_bans['game_key'], long_bans['side'])
+    long_bans = pd.concat([dimensions, long_bans[found].reset_index(drop=True)], axis=1)
+    bans_cube = _cube_table(long_bans, 'champion', {
+        'ban_count': ('priority', 'size'),
+        'games_banned': ('game_key', 'nunique'),
+        'priority_sum': ('priority', 'sum'),
+    })
+
+    # Objetivos: una fila por captura, con el equipo que captura
+    dimensions, found = _game_dimensions(main, monsters['game_key'], side_from_team(monsters['team']))
+    objectives = pd.concat([dimensions, monsters.loc[found, ['type', 'time']].reset_index(drop=True)], axis=1)
+    objectives['time'] = objectives['time'].astype(np.float64)
+    objectives['has_time'] = objectives['time'].notna()
+    objectives_cube = _cube_table(objectives, 'type', {
+        'count': ('has_time', 'size'),
+        'time_sum': ('time', 'sum'),
+        'time_count': ('has_time', 'sum'),
+    })
+
+    return {'teams': teams_cube, 'bans': bans_cube, 'objectives': objectives_cube}
+
+
+def build_analytics_cube(
+    main: pd.DataFrame,
+    bans: pd.DataFrame,
+    monsters: pd.DataFrame
+) -> Tuple[ChunkStream, ChunkStream, ChunkStream]:
+    """
+    Materializa el cubo analítico (equipos, bans y objetivos por liga, año,
+    split y equipo), particionado por liga.
+
+    Returns:
+        Tupla de streams (uno por tabla) con un chunk por liga
+    """
+    tables = cube_tables(main, bans, monsters)
+    logger.info(
+        "Cubo analítico: "
+        + ", ".join(f"{name} {len(table)} filas" for name, table in tables.items())
+        + f" ({main['league'].nunique()} ligas)"
+    )
+    return tuple(_league_partitions(tables[name]) for name in CUBE_TABLES)
+
+
+class AnalyticsCube:
+    """
+    Consultas de rollup sobre las tablas del cubo analítico.
+
+    Cada tabla se indexa por ``CUBE_DIMENSIONS`` + su dimensión propia con un
+    ``MultiIndex`` ordenado; los filtros se resuelven con ``get_locs``
+    (búsqueda binaria) y el rollup suma las medidas aditivas.
+
+    Args:
+        teams: Tabla ``analytics_cube_teams``
+        bans: Tabla ``analytics_cube_bans``
+        objectives: Tabla ``analytics_cube_objectives``
+    """
+
+    def __init__(self, teams: pd.DataFrame, bans: pd.DataFrame, objectives: pd.DataFrame):
+        self._tables = {}
+        for name, table in zip(CUBE_TABLES, [teams, bans, objectives]):
+            item, measures = CUBE_TABLES[name]
+            keys = CUBE_DIMENSIONS + [item]
+            table = table.astype({key: object for key in keys if key != 'year'})
+            self._tables[name] = table.set_index(keys)[measures].sort_index()
+
+    def _select(self, name: str, filters: Dict[str, Any]) -> pd.DataFrame:
+        """Filas de la tabla que cumplen los filtros (valor o lista por dimensión)."""
+        table = self._tables[name]
+        unknown = set(filters) - set(table.index.names)
+        if unknown:
+            raise ValueError(f"Dimensiones no disponibles en el cubo '{name}': {sorted(unknown)}")
+
+        selectors = []
+        for level, dim in enumerate(table.index.names):
+            if dim not in filters:
+                selectors.append(slice(None))
+                continue
+            values = filters[dim]
+            values = list(values) if isinstance(values, (list, tuple, set, np.ndarray)) else [values]
+            present = table.index.levels[level]
+            values = [value for value in values if value in present]
+            if not values:
+                return table.iloc[:0]
+            selectors.append(values)
+        return table.iloc[table.index.get_locs(selectors)]
+
+    @staticmethod
+    def _rollup(selected: pd.DataFrame, by: List[str]) -> pd.DataFrame:
+        """Suma las medidas por ``by`` (una fila total si ``by`` está vacío)."""
+        if by:
+            return selected.groupby(level=by, sort=True).sum().reset_index()
+        return selected.sum().to_frame().T.astype(selected.dtypes.to_dict())
+
+    def team_performance(self, by: Sequence[str] = ('team',), **filters: Any) -> pd.DataFrame:
+        """
+        Partidas, victorias, win rate y duración promedio por ``by``.
+
+        ``by`` y los filtros usan ``league``, ``year``, ``season``, ``team`` y ``side``.
+        """
+        by = list(by)
+        stats = self._rollup(self._select('teams', filters), by)
+        stats['losses'] = stats['games'] - stats['wins']
+        stats['win_rate'] = (stats['wins'] / stats['games']).round(3)
+        stats['avg_game_length'] = (stats['length_sum'] / stats['length_count'].replace(0, np.nan)).round(2)
+        return stats[by + ['games', 'wins', 'losses', 'win_rate', 'avg_game_length']].rename(
+            columns={'games': 'total_games'}
+        )
+
+    def champion_bans(self, by: Sequence[str] = (), **filters: Any) -> pd.DataFrame:
+        """
+        Bans por campeón (y ``by``) con las métricas de ``champion_bans_analysis``.
+
+        ``games_banned`` se suma entre equipos: en el draft un campeón se
+        banea a lo sumo una vez por partida. La presencia se mide, como en el
+        reporte, sobre las partidas del segmento con bans registrados (con
+        ``team`` en ``by`` o en los filtros, sobre las partidas de esos equipos).
+        """
+        by = list(by)
+        bans = self._rollup(self._select('bans', filters), by + ['champion'])
+        if bans.empty:
+            return pd.DataFrame()
+
+        # Partidas del segmento: lado azul = una fila por partida
+        team_filters = {dim: value for dim, value in filters.items() if dim in CUBE_DIMENSIONS}
+        if 'team' not in by and 'team' not in filters:
+            team_filters['side'] = 'blue'
+        games = self._rollup(self._select('teams', team_filters), by)[by + ['ban_games']]
+        bans['bans'] = bans.groupby(by)['ban_count'].transform('sum') if by else bans['ban_count'].sum()
+        stats = bans.merge(games, on=by, how='left') if by else bans.assign(ban_games=games['ban_games'].iloc[0])
+
+        stats['ban_percentage'] = (stats['ban_count'] / stats['bans'] * 100).round(2)
+        stats['presence_rate'] = (stats['games_banned'] / stats['ban_games'] * 100).round(2)
+        stats['avg_ban_priority'] = (stats['priority_sum'] / stats['ban_count']).round(2)
+        stats = stats.sort_values(
+            by + ['ban_count', 'champion'], ascending=[True] * len(by) + [False, True], ignore_index=True
+        )
+        return stats[by + ['champion', 'ban_count', 'ban_percentage', 'games_banned',
+                           'presence_rate', 'avg_ban_priority']]
+
+    def neutral_objectives(self, by: Sequence[str] = (), **filters: Any) -> pd.DataFrame:
+        """Capturas y tiempo promedio por tipo de objetivo (y ``by``)."""
+        by = list(by)
+        stats = self._rollup(self._select('objectives', filters), by + ['type'])
+        avg_time = stats['time_sum'] / stats['time_count'].replace(0, np.nan)
+        result = stats[by + ['type']].rename(columns={'type': 'objective_type'})
+        result['total_captured'] = stats['count']
+        result['avg_capture_time_seconds'] = avg_time
+        result['avg_capture_time_minutes'] = (avg_time / 60).round(2)
+        return result.sort_values(
+            by + ['total_captured'], ascending=[True] * len(by) + [False], kind='stable', ignore_index=True
+        )
@@ -0,0 +1,232 @@
+"""
+Motor de Duración de Partidos
+
+``analyze_game_duration`` escribía ``gamelength_minutes`` y
+``duration_category`` en el DataFrame de entrada (el dataset cacheado
+``intermediate_main_data``) y descartaba los conteos por categoría. Este motor
+no modifica sus entradas y discretiza la duración una sola vez:
+
+    - Cada partido recibe un bin de ``bin_width`` minutos (desde 0) y una
+      categoría de duración (códigos enteros calculados una vez)
+    - ``duration_partial`` agrega cada corte (todos los partidos, por liga, por
+      año) con esos códigos: conteo, suma, suma de cuadrados, mínimo, máximo,
+      histograma y conteos por categoría. Son agregados aditivos: los de
+      partidas distintas se combinan sumando (EDA incremental)
+    - ``render_duration`` arma las tablas del reporte: los percentiles salen
+      del histograma acumulado (borde inferior del bin que contiene el rango
+      ``q·(n - 1)``), así que el error es menor que ``bin_width`` (exacto si
+      los valores caen en los bordes, p. ej. minutos enteros con
+      ``bin_width`` 0.5 o 1)
+    - Conteo, media, desviación, mínimo y máximo son exactos
+
+Configuración (``data_exploration.duration``)::
+
+    column: gamelength          # duración en minutos
+    bin_width: 0.5
+    percentiles: [0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95]
+    dimensions: [league, year]
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# Categorías de duración: intervalos (0, 25], (25, 35], (35, 45], (45, inf)
+DURATION_EDGES = [25, 35, 45]
+DURATION_LABELS = ['Corta (<25 min)', 'Media (25-35 min)', 'Larga (35-45 min)', 'Muy Larga (>45 min)']
+
+DEFAULT_DURATION = {
+    'column': 'gamelength',
+    'bin_width': 0.5,
+    'percentiles': [0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95],
+    'dimensions': ['league', 'year'],
+}
+
+
+def _slices(df: pd.DataFrame, dimensions: List[str]) -> List[Tuple[str, np.ndarray, np.ndarray]]:
+    """Códigos de grupo por corte: ``(dimensión, código por fila, etiquetas)``."""
+    slices = [('all', np.zeros(len(df), dtype=np.int64), np.array(['all'], dtype=object))]
+    for dimension in dimensions:
+        if dimension not in df.columns:
+            logger.debug(f"Corte de duración '{dimension}' omitido: columna inexistente")
+            continue
+        codes, labels = pd.factorize(df[dimension], sort=True)
+        slices.append((dimension, codes.astype(np.int64), np.asarray(labels).astype(str).astype(object)))
+    return slices
+
+
+def duration_partial(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Agregados aditivos de duración por corte, sin modificar ``df``.
+
+    Los bins empiezan en 0 (``bin = floor(duración / bin_width)``), así que
+    los histogramas de partidas distintas se combinan sumando conteos.
+
+    Returns:
+        Diccionario con ``moments`` (count, sum, sum_squares, min, max por
+        dimension y segment), ``histogram`` (count por bin) y ``categories``
+        (count por código de categoría)
+    """
+    config = {**DEFAULT_DURATION, **(config or {})}
+
+    values = df[config['column']].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(values)
+    values = values[valid]
+
+    # Discretización única: bin del histograma y categoría de cada partido
+    bins = np.floor(values / config['bin_width']).astype(np.int64)
+    categories = np.searchsorted(DURATION_EDGES, values, side='left')
+
+    moments, histograms, category_counts = [], [], []
+    for dimension, codes, labels in _slices(df, config['dimensions']):
+        codes = codes[valid]
+        in_group = codes >= 0
+        g_codes, g_values = codes[in_group], values[in_group]
+        n_groups = len(labels)
+
+        minimum = np.full(n_groups, np.inf)
+        maximum = np.full(n_groups, -np.inf)
+        np.minimum.at(minimum, g_codes, g_values)
+        np.maximum.at(maximum, g_codes, g_values)
+        counts = np.bincount(g_codes, minlength=n_groups)
+        observed = counts > 0
+        moments.append(pd.DataFrame({
+            'dimension': dimension,
+            'segment': labels,
+            'count': counts,
+            'sum': np.bincount(g_codes, weights=g_values, minlength=n_groups),
+            'sum_squares': np.bincount(g_codes, weights=g_values ** 2, minlength=n_groups),
+            'min': minimum,
+            'max': maximum,
+        })[observed])
+
+        # Pares (grupo, bin) y (grupo, categoría) distintos con su conteo
+        for keys, column, tables in [
+            (bins[in_group], 'bin', histograms),
+            (categories[in_group], 'category', category_counts),
+        ]:
+            pairs, pair_counts = np.unique(np.stack([g_codes, keys]), axis=1, return_counts=True)
+            tables.append(pd.DataFrame({
+                'dimension': dimension,
+                'segment': labels[pairs[0]],
+                column: pairs[1],
+                'count': pair_counts,
+            }))
+
+    return {
+        'moments': pd.concat(moments, ignore_index=True),
+        'histogram': pd.concat(histograms, ignore_index=True),
+        'categories': pd.concat(category_counts, ignore_index=True),
+    }
+
+
+def render_duration(
+    partial: Dict[str, pd.DataFrame],
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Estadísticas, percentiles y categorías por segmento desde los agregados.
+
+    Los percentiles salen del histograma acumulado de cada segmento: el borde
+    inferior del bin que contiene el rango ``q·(n - 1)``, acotado a [min, max].
+    """
+    config = {**DEFAULT_DURATION, **(config or {})}
+    moments = partial['moments']
+    if moments.empty:
+        return pd.DataFrame(), pd.DataFrame()
+
+    # Primero el corte 'all', luego cada dimensión y segmento
+    moments = moments.assign(_by_dimension=moments['dimension'] != 'all').sort_values(
+        ['_by_dimension', 'dimension', 'segment'], ignore_index=True
+    )
+    n = moments['count'].to_numpy(dtype=np.float64)
+    mean = moments['sum'].to_numpy() / n
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = (moments['sum_squares'].to_numpy() - n * mean ** 2) / (n - 1)
+    stats = pd.DataFrame({
+        'dimension': moments['dimension'],
+        'segment': moments['segment'],
+        'count': moments['count'],
+        'mean': mean,
+        'std': np.sqrt(np.maximum(variance, 0)),
+        'min': moments['min'],
+        'max': moments['max'],
+    })
+
+    histograms = {
+        key: (group['bin'].to_numpy(), np.cumsum(group['count'].to_numpy()))
+        for key, group in partial['histogram'].sort_values('bin').groupby(['dimension', 'segment'])
+    }
+    ranks = np.outer(np.maximum(n - 1, 0), config['percentiles'])
+    quantiles = np.empty_like(ranks)
+    for i, key in enumerate(zip(stats['dimension'], stats['segment'])):
+        bins, cumulative = histograms[key]
+        # Primer bin cuyo acumulado supera el rango (base 0)
+        index = np.minimum(np.searchsorted(cumulative, ranks[i], side='right'), len(bins) - 1)
+        quantiles[i] = bins[index] * config['bin_width']
+    quantiles = np.clip(quantiles, stats[['min']].to_numpy(), stats[['max']].to_numpy())
+    for i, q in enumerate(config['percentiles']):
+        stats[f'p{round(q * 100):02d}'] = quantiles[:, i]
+    stats[stats.columns[3:]] = stats[stats.columns[3:]].round(2)
+
+    # Categorías: todas las del segmento, con 0 si no hay partidos
+    n_categories = len(DURATION_LABELS)
+    counts = partial['categories'].pivot_table(
+        index=['dimension', 'segment'], columns='category', values='count', aggfunc='sum', fill_value=0
+    ).reindex(
+        index=pd.MultiIndex.from_frame(stats[['dimension', 'segment']]),
+        columns=range(n_categories),
+        fill_value=0,
+    ).to_numpy()
+    categories = pd.DataFrame({
+        'dimension': np.repeat(stats['dimension'].to_numpy(), n_categories),
+        'segment': np.repeat(stats['segment'].to_numpy(), n_categories),
+        'category': np.tile(DURATION_LABELS, len(stats)),
+        'count': counts.ravel(),
+        'percentage': (counts / stats[['count']].to_numpy() * 100).round(2).ravel(),
+    })
+    return stats, categories
+
+
+def duration_tables(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Percentiles y categorías de duración por corte, sin modificar ``df``.
+
+    Args:
+        df: DataFrame con la columna de duración y las dimensiones de corte
+        config: Configuración ``data_exploration.duration``
+
+    Returns:
+        Tupla con (estadísticas y percentiles por segmento, conteos por
+        categoría y segmento). Ambas tablas tienen columnas ``dimension`` y
+        ``segment``; el corte ``all`` / ``all`` cubre todos los partidos.
+    """
+    return render_duration(duration_partial(df, config), config)
+
+
+def summarize_duration(percentiles: pd.DataFrame, categories: pd.DataFrame) -> pd.DataFrame:
+    """Resumen general (corte ``all``): estadísticas y distribución por categoría."""
+    overall = percentiles[percentiles['dimension'] == 'all'].iloc[0]
+    stats_df = pd.DataFrame({
+        'metric': ['count', 'mean', 'median', 'std', 'min', 'max', 'q25', 'q75'],
+        'value': [overall[col] for col in ['count', 'mean', 'p50', 'std', 'min', 'max', 'p25', 'p75']],
+        'category': 'Estadísticas Generales',
+    })
+    overall_categories = categories[categories['dimension'] == 'all']
+    category_df = pd.DataFrame({
+        'metric': overall_categories['category'].to_numpy(),
+        'value': overall_categories['percentage'].to_numpy(),
+        'category': 'Distribución por Duración (%)',
+    })
+    return pd.concat([stats_df, category_df], ignore_index=True)
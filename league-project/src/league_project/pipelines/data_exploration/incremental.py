@@ -0,0 +1,269 @@
+"""
+EDA Incremental
+
+Las partidas históricas no cambian entre ejecuciones semanales, pero
+``data_exploration`` recalculaba todas las tablas desde cero. Los análisis de
+equipos, bans, objetivos, estructuras y duración (y las estadísticas
+descriptivas) se expresan como agregados aditivos por partida (``*_partial``
+en ``nodes.py`` y ``duration.py``); este módulo los guarda como estado junto
+con las ``game_key`` ya procesadas y, en cada ejecución:
+
+    1. Detecta las partidas nuevas (``game_key`` que no están en el estado)
+    2. Calcula los agregados solo de esas partidas y los combina con los
+       guardados (sumas; mínimos y máximos de duración; ``merge`` de
+       ``DescriptiveMoments``)
+    3. Reescribe las tablas del reporte desde el estado combinado
+
+El costo de los agregados crece con las partidas nuevas, no con el
+histórico; los datasets se siguen leyendo completos para seleccionar las
+partidas nuevas por ``game_key`` y verificar las ya procesadas (operaciones
+vectorizadas, sin agrupar el histórico).
+
+Las partidas se identifican por ``game_key``, que es un hash estable de la
+URL: reordenar los archivos raw o agregar partidas al principio no cambia las
+claves de las ya procesadas.
+
+El estado se descarta y se reconstruye desde cero si cambia la configuración
+de los análisis (``params:data_exploration``) o si cambió alguna partida ya
+procesada en cualquiera de los datasets que leen los agregados (principal,
+bans, monsters, structures): se guarda un hash del contenido de cada partida
+en todas esas tablas (``game_content_hashes``) y se comparan todos en cada
+ejecución. Esto no es solo defensivo: ``clean_main_dataset`` imputa nulos con
+la mediana / moda del dataset completo, así que los valores imputados de
+partidas viejas pueden cambiar cuando llegan partidas nuevas.
+
+Uso::
+
+    kedro run --pipeline eda_incremental
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from league_project.game_keys import GAME_KEY, game_content_hashes
+from league_project.moments import DEFAULT_MAX_MODE_VALUES, DEFAULT_MOMENTS_SEED, DescriptiveMoments
+from league_project.sketches import DEFAULT_SKETCH_SIZE
+
+from .duration import DEFAULT_DURATION, duration_partial, render_duration, summarize_duration
+from .nodes import (
+    DEFAULT_BREAKDOWN_DIMENSIONS,
+    TEAM_PARTIAL_KEYS,
+    champion_bans_partial,
+    event_types_partial,
+    render_champion_bans,
+    render_event_types,
+    render_team_performance,
+    team_performance_partial,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Versión del formato del estado: un estado de otra versión se reconstruye
+STATE_VERSION = 3
+
+# Agregados aditivos guardados en el estado: nombre → (claves, columnas de
+# mínimo, columnas de máximo); el resto de columnas se suman
+_FOLDS = {
+    'teams': (TEAM_PARTIAL_KEYS, [], []),
+    'bans': (['dimension', 'segment', 'champion'], [], []),
+    'ban_segments': (['dimension', 'segment'], [], []),
+    'objectives': (['type', 'detail'], [], []),
+    'structures': (['type', 'detail'], [], []),
+    'duration_moments': (['dimension', 'segment'], ['min'], ['max']),
+    'duration_histogram': (['dimension', 'segment', 'bin'], [], []),
+    'duration_categories': (['dimension', 'segment', 'category'], [], []),
+}
+
+
+def _config_fingerprint(parameters: Dict[str, Any]) -> str:
+    """Huella de la configuración que define los agregados."""
+    config = {
+        'breakdown_dimensions': parameters.get('breakdown_dimensions', DEFAULT_BREAKDOWN_DIMENSIONS),
+        'duration': {**DEFAULT_DURATION, **(parameters.get('duration') or {})},
+        'descriptive_statistics': parameters.get('descriptive_statistics') or {},
+    }
+    return hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _fold(
+    previous: Optional[pd.DataFrame],
+    new: pd.DataFrame,
+    keys: List[str],
+    min_cols: List[str],
+    max_cols: List[str]
+) -> pd.DataFrame:
+    """Combina dos agregados con las mismas claves (suma, mínimo o máximo)."""
+    if previous is None or previous.empty:
+        return new.reset_index(drop=True)
+    if new.empty:
+        return previous
+
+    combined = pd.concat([previous, new], ignore_index=True)
+    agg = {
+        col: 'min' if col in min_cols else 'max' if col in max_cols else 'sum'
+        for col in combined.columns if col not in keys
+    }
+    return combined.groupby(keys, dropna=False, sort=False).agg(agg).reset_index()
+
+
+def _game_hashes(main: pd.DataFrame, *tables: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ``game_key`` ordenadas del dataset principal y el hash del contenido de
+    cada partida en el dataset principal y en ``tables``.
+    """
+    keys = np.unique(main[GAME_KEY].to_numpy())
+    return keys, game_content_hashes(keys, main, *tables)
+
+
+def _usable_state(previous: Any, game_keys: np.ndarray, row_hashes: np.ndarray, fingerprint: str) -> bool:
+    """Indica si el estado guardado se puede extender con las partidas nuevas."""
+    if not previous:
+        logger.info("Sin estado de EDA previo: se procesan todas las partidas")
+        return False
+    if previous.get('version') != STATE_VERSION or previous.get('fingerprint') != fingerprint:
+        logger.info("La configuración de la EDA cambió: se reconstruye el estado")
+        return False
+
+    positions = np.minimum(np.searchsorted(game_keys, previous['game_keys']), max(len(game_keys) - 1, 0))
+    found = game_keys[positions] == previous['game_keys'] if len(game_keys) else np.zeros(0, dtype=bool)
+    changed = len(previous['game_keys']) - int((found & (row_hashes[positions] == previous['row_hashes'])).sum())
+    if changed:
+        logger.warning(
+            f"{changed} partidas ya procesadas cambiaron o ya no están (p. ej. por la "
+            f"imputación de la limpieza): se reconstruye el estado"
+        )
+        return False
+    return True
+
+
+def update_eda_state(
+    previous_state: Optional[Dict[str, Any]],
+    main: pd.DataFrame,
+    bans: pd.DataFrame,
+    monsters: pd.DataFrame,
+    structures: pd.DataFrame,
+    parameters: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Combina los agregados de EDA del estado previo con los de las partidas nuevas.
+
+    Args:
+        previous_state: Estado de la ejecución anterior (``{}`` si no hay)
+        main: Dataset principal limpio (``game_key``, equipos, resultados,
+            duración y dimensiones de desglose)
+        bans: Dataset de bans limpio (con ``game_key``)
+        monsters: Dataset de monsters limpio (con ``game_key``)
+        structures: Dataset de structures limpio (con ``game_key``)
+        parameters: Parámetros ``data_exploration``
+
+    Returns:
+        Estado actualizado (agregados, ``DescriptiveMoments``, ``game_keys``
+        procesadas y el hash del contenido de cada una)
+    """
+    parameters = parameters or {}
+    fingerprint = _config_fingerprint(parameters)
+    game_keys, row_hashes = _game_hashes(main, bans, monsters, structures)
+
+    if not _usable_state(previous_state, game_keys, row_hashes, fingerprint):
+        previous_state = {'game_keys': np.empty(0, dtype=game_keys.dtype)}
+
+    new_keys = np.setdiff1d(game_keys, previous_state['game_keys'], assume_unique=True)
+    if len(new_keys) == 0 and 'version' in previous_state:
+        logger.info(f"EDA incremental: sin partidas nuevas ({len(game_keys)} procesadas)")
+        return previous_state
+
+    def new_rows(df: pd.DataFrame) -> pd.DataFrame:
+        return df[np.isin(df['game_key'].to_numpy(), new_keys)]
+
+    new_main = new_rows(main)
+    new_bans = new_rows(bans)
+    new_monsters = new_rows(monsters)
+    new_structures = new_rows(structures)
+    logger.info(
+        f"EDA incremental: {len(new_keys)} partidas nuevas "
+        f"({len(previous_state['game_keys'])} ya procesadas)"
+    )
+
+    duration = duration_partial(new_main, parameters.get('duration'))
+    ban_stats, ban_segments = champion_bans_partial(
+        new_bans, new_main, parameters.get('breakdown_dimensions', DEFAULT_BREAKDOWN_DIMENSIONS)
+    )
+    partials = {
+        'teams': team_performance_partial(new_main),
+        'bans': ban_stats,
+        'ban_segments': ban_segments,
+        'objectives': event_types_partial(new_monsters, detail='team'),
+        'structures': event_types_partial(new_structures, detail='lane'),
+        'duration_moments': duration['moments'],
+        'duration_histogram': duration['histogram'],
+        'duration_categories': duration['categories'],
+    }
+
+    state = {
+        'version': STATE_VERSION,
+        'fingerprint': fingerprint,
+        'game_keys': game_keys,
+        'row_hashes': row_hashes,
+    }
+    for name, (keys, min_cols, max_cols) in _FOLDS.items():
+        state[name] = _fold(previous_state.get(name), partials[name], keys, min_cols, max_cols)
+
+    config = parameters.get('descriptive_statistics') or {}
+    moments = previous_state.get('moments')
+    if moments is None:
+        moments = DescriptiveMoments(
+            sketch_size=config.get('sketch_size', DEFAULT_SKETCH_SIZE),
+            max_mode_values=config.get('max_mode_values', DEFAULT_MAX_MODE_VALUES),
+            seed=config.get('seed', DEFAULT_MOMENTS_SEED),
+        )
+    state['moments'] = moments.update(new_main.drop(columns=['game_key']))
+
+    return state
+
+
+def render_eda_state(
+    state: Dict[str, Any],
+    parameters: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, ...]:
+    """
+    Reescribe las tablas del reporte de EDA desde el estado combinado.
+
+    Returns:
+        Tupla con (estadísticas descriptivas, rendimiento por equipo, por
+        equipo y lado, por equipo y rival, bans por campeón, desglose de bans,
+        objetivos neutrales, estructuras, resumen de duración, percentiles de
+        duración por segmento, categorías de duración por segmento)
+    """
+    parameters = parameters or {}
+
+    descriptive = state['moments'].to_frame().round(2).reset_index()
+    teams = render_team_performance(state['teams'])
+    bans = render_champion_bans(state['bans'], state['ban_segments'])
+    objectives = render_event_types(
+        state['objectives'], 'objective_type', 'total_captured', 'avg_capture_time'
+    )
+    structures = render_event_types(
+        state['structures'], 'structure_type', 'total_destroyed', 'avg_destruction_time'
+    )
+    percentiles, categories = render_duration(
+        {
+            'moments': state['duration_moments'],
+            'histogram': state['duration_histogram'],
+            'categories': state['duration_categories'],
+        },
+        parameters.get('duration'),
+    )
+    summary = summarize_duration(percentiles, categories) if not percentiles.empty else pd.DataFrame()
+
+    logger.info(
+        f"Reporte de EDA reescrito desde el estado: {len(state['game_keys'])} partidas, "
+        f"{len(teams[0])} equipos, {len(bans[0])} campeones"
+    )
+
+    return (descriptive, *teams, *bans, objectives, structures, summary, percentiles, categories)
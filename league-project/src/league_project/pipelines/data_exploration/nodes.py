@@ -8,7 +8,13 @@ Genera estadísticas, visualizaciones y reportes de insights.
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Iterable, Optional, Tuple, Union
+
+from league_project.moments import DEFAULT_MAX_MODE_VALUES, DEFAULT_MOMENTS_SEED, DescriptiveMoments
+from league_project.sketches import DEFAULT_SKETCH_SIZE
+
+from .correlations import correlation_pairs
+from .duration import DEFAULT_DURATION, duration_tables, summarize_duration
 
 logger = logging.getLogger(__name__)
 
@@ -17,33 +23,45 @@ logger = logging.getLogger(__name__)
 # NODO 1: Estadísticas Descriptivas del Dataset Principal
 # ============================================================================
 
-def generate_descriptive_statistics(df: pd.DataFrame) -> pd.DataFrame:
+def generate_descriptive_statistics(
+    df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    parameters: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
     """
     Genera estadísticas descriptivas completas del dataset principal.
     
+    Todas las métricas salen de una sola pasada por los datos
+    (``league_project.moments.DescriptiveMoments``): momentos combinables y
+    cuantiles de un sketch, así que el nodo acepta el DataFrame completo o sus
+    chunks. Con el DataFrame completo en memoria los cuantiles y la mediana
+    son exactos; con chunks salen de sketches con semilla fija (aproximados
+    pero iguales en cada ejecución). El resumen combinable se conserva entre
+    ejecuciones en ``eda_state`` (pipeline ``eda_incremental``), que sabe qué
+    partidas ya incluye.
+    
     Args:
-        df: DataFrame limpio del dataset principal
+        df: DataFrame limpio del dataset principal (o iterable de chunks)
+        parameters: Parámetros ``data_exploration`` (usa ``descriptive_statistics``)
         
     Returns:
-        DataFrame con estadísticas descriptivas
+        DataFrame con estadísticas descriptivas por variable
     """
     logger.info("Generando estadísticas descriptivas")
+    config = (parameters or {}).get('descriptive_statistics') or {}
     
-    # Estadísticas básicas
-    stats = df.describe().transpose()
-    
-    # Agregar estadísticas adicionales
-    stats['median'] = df.median(numeric_only=True)
-    stats['mode'] = df.mode(numeric_only=True).iloc[0] if len(df.mode(numeric_only=True)) > 0 else np.nan
-    stats['skewness'] = df.skew(numeric_only=True)
-    stats['kurtosis'] = df.kurtosis(numeric_only=True)
-    stats['missing_count'] = df.isnull().sum()
-    stats['missing_percentage'] = (df.isnull().sum() / len(df)) * 100
+    summary = DescriptiveMoments(
+        sketch_size=config.get('sketch_size', DEFAULT_SKETCH_SIZE),
+        max_mode_values=config.get('max_mode_values', DEFAULT_MAX_MODE_VALUES),
+        seed=config.get('seed', DEFAULT_MOMENTS_SEED),
+    )
+    in_memory = isinstance(df, pd.DataFrame)
+    for chunk in ([df] if in_memory else df):
+        summary.update(chunk)
     
     # Redondear valores
-    stats = stats.round(2)
+    stats = summary.to_frame(data=df if in_memory else None).round(2).reset_index()
     
-    logger.info(f"Estadísticas generadas para {len(stats)} columnas")
+    logger.info(f"Estadísticas generadas para {len(stats)} columnas ({len(summary)} filas)")
     
     return stats
 
@@ -52,170 +70,327 @@ def generate_descriptive_statistics(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 2: Análisis de Win Rate por Equipo
 # ============================================================================
 
-def analyze_team_performance(df: pd.DataFrame) -> pd.DataFrame:
+def stack_labels(first: pd.Series, second: pd.Series) -> pd.Series:
+    """Concatena dos columnas de etiquetas conservando el tipo ``category``."""
+    if isinstance(first.dtype, pd.CategoricalDtype) and isinstance(second.dtype, pd.CategoricalDtype):
+        return pd.Series(pd.api.types.union_categoricals([first, second], ignore_order=True))
+    return pd.Series(np.concatenate([first.astype(object).to_numpy(), second.astype(object).to_numpy()]))
+
+
+def _stack_team_sides(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apila los lados azul y rojo en una tabla larga: una fila por equipo y
+    partida con ``team``, ``opponent``, ``side``, ``win`` y ``game_length``.
+    """
+    n_games = len(df)
+    game_length = (
+        df['gamelength_minutes'].to_numpy(dtype=np.float64)
+        if 'gamelength_minutes' in df.columns else np.full(n_games, np.nan)
+    )
+    return pd.DataFrame({
+        'team': stack_labels(df['blueteamtag'], df['redteamtag']),
+        'opponent': stack_labels(df['redteamtag'], df['blueteamtag']),
+        'side': pd.Categorical.from_codes(np.repeat([0, 1], n_games), categories=['blue', 'red']),
+        'win': np.concatenate([df['bresult'].to_numpy(), df['rresult'].to_numpy()]).astype(np.int64),
+        'game_length': np.tile(game_length, 2),
+    })
+
+
+# Grano de los agregados de equipos: las tres tablas del reporte salen de él
+TEAM_PARTIAL_KEYS = ['team', 'side', 'opponent']
+
+
+def team_performance_partial(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agregado aditivo por equipo, lado y rival: partidas, victorias y suma de
+    duraciones. Los agregados de partidas distintas se combinan sumando.
+    """
+    long = _stack_team_sides(df)
+    long['length_count'] = long['game_length'].notna()
+    partial = long.groupby(TEAM_PARTIAL_KEYS, observed=True, dropna=False, sort=False).agg(
+        games=('win', 'size'),
+        wins=('win', 'sum'),
+        length_sum=('game_length', 'sum'),
+        length_count=('length_count', 'sum'),
+    ).reset_index()
+    return partial.astype({key: object for key in TEAM_PARTIAL_KEYS})
+
+
+def _team_stats(partial: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """Partidas, victorias, win rate y duración promedio en un solo groupby."""
+    stats = partial.groupby(keys).agg(
+        total_games=('games', 'sum'),
+        wins=('wins', 'sum'),
+        length_sum=('length_sum', 'sum'),
+        length_count=('length_count', 'sum'),
+    ).reset_index()
+    stats['losses'] = stats['total_games'] - stats['wins']
+    stats['win_rate'] = (stats['wins'] / stats['total_games']).round(3)
+    stats['avg_game_length'] = (stats['length_sum'] / stats['length_count'].replace(0, np.nan)).round(2)
+    return stats[keys + ['total_games', 'wins', 'losses', 'win_rate', 'avg_game_length']]
+
+
+def render_team_performance(partial: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Tablas del reporte de equipos a partir del agregado por equipo, lado y rival."""
+    partial = partial[partial['team'].notna()]
+    
+    # Ordenar por win rate
+    result_df = _team_stats(partial, ['team']).sort_values(
+        ['win_rate', 'total_games'], ascending=False, ignore_index=True
+    )
+    by_side = _team_stats(partial, ['team', 'side'])
+    by_opponent = _team_stats(partial[partial['opponent'].notna()], ['team', 'opponent']).rename(
+        columns={'total_games': 'games'}
+    )
+    return result_df, by_side, by_opponent
+
+
+def analyze_team_performance(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Analiza el rendimiento de equipos (win rate, estadísticas promedio).
     
+    Los lados azul y rojo se apilan en una sola tabla larga (una fila por
+    equipo y partida) que se agrega por equipo, lado y rival; las tres tablas
+    del reporte salen de ese agregado, que también usa la EDA incremental.
+    
     Args:
         df: DataFrame limpio con datos de partidos
         
     Returns:
-        DataFrame con análisis de rendimiento por equipo
+        Tupla con (rendimiento por equipo, por equipo y lado, por equipo y rival)
     """
     logger.info("Analizando rendimiento de equipos")
     
-    team_stats = []
+    required = ['blueteamtag', 'redteamtag', 'bresult', 'rresult']
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        logger.warning(f"Columnas de equipos no encontradas: {missing}")
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
     
-    # Procesar equipos azules
-    if 'blueteamtag' in df.columns and 'bresult' in df.columns:
-        blue_teams = df.groupby('blueteamtag').agg({
-            'bresult': ['count', 'sum', 'mean'],
-            'gamelength_minutes': 'mean'
-        }).reset_index()
-        
-        blue_teams.columns = ['team', 'total_games', 'wins', 'win_rate', 'avg_game_length']
-        
-        for _, row in blue_teams.iterrows():
-            team_stats.append({
-                'team': row['team'],
-                'total_games': int(row['total_games']),
-                'wins': int(row['wins']),
-                'losses': int(row['total_games'] - row['wins']),
-                'win_rate': float(row['win_rate']),
-                'avg_game_length': float(row['avg_game_length'])
-            })
-    
-    # Procesar equipos rojos
-    if 'redteamtag' in df.columns and 'rresult' in df.columns:
-        red_teams = df.groupby('redteamtag').agg({
-            'rresult': ['count', 'sum', 'mean'],
-            'gamelength_minutes': 'mean'
-        }).reset_index()
-        
-        red_teams.columns = ['team', 'total_games', 'wins', 'win_rate', 'avg_game_length']
-        
-        for _, row in red_teams.iterrows():
-            # Buscar si el equipo ya existe (jugó en azul)
-            existing_team = next((t for t in team_stats if t['team'] == row['team']), None)
-            
-            if existing_team:
-                # Combinar estadísticas
-                total_games = existing_team['total_games'] + int(row['total_games'])
-                total_wins = existing_team['wins'] + int(row['wins'])
-                existing_team['total_games'] = total_games
-                existing_team['wins'] = total_wins
-                existing_team['losses'] = total_games - total_wins
-                existing_team['win_rate'] = total_wins / total_games
-                existing_team['avg_game_length'] = (
-                    (existing_team['avg_game_length'] * (existing_team['total_games'] - int(row['total_games'])) +
-                     row['avg_game_length'] * int(row['total_games'])) / total_games
-                )
-            else:
-                team_stats.append({
-                    'team': row['team'],
-                    'total_games': int(row['total_games']),
-                    'wins': int(row['wins']),
-                    'losses': int(row['total_games'] - row['wins']),
-                    'win_rate': float(row['win_rate']),
-                    'avg_game_length': float(row['avg_game_length'])
-                })
-    
-    result_df = pd.DataFrame(team_stats)
+    result_df, by_side, by_opponent = render_team_performance(team_performance_partial(df))
     
-    # Ordenar por win rate
-    if 'win_rate' in result_df.columns and len(result_df) > 0:
-        result_df = result_df.sort_values('win_rate', ascending=False)
-        # Redondear valores
-        result_df['win_rate'] = result_df['win_rate'].round(3)
-        result_df['avg_game_length'] = result_df['avg_game_length'].round(2)
+    logger.info(f"Análisis completado para {len(result_df)} equipos "
+                f"({len(by_opponent)} enfrentamientos equipo-rival)")
     
-    logger.info(f"Análisis completado para {len(result_df)} equipos")
-    
-    return result_df
+    return result_df, by_side, by_opponent
 
 
 # ============================================================================
 # NODO 3: Análisis de Campeones Más Baneados
 # ============================================================================
 
-def analyze_champion_bans(df: pd.DataFrame) -> pd.DataFrame:
+BAN_COLUMNS = ['ban_1', 'ban_2', 'ban_3', 'ban_4', 'ban_5']
+
+# Dimensiones por defecto de los desgloses por segmento
+DEFAULT_BREAKDOWN_DIMENSIONS = ['league', 'year', 'season', 'side']
+
+
+def side_from_team(team: pd.Series) -> pd.Series:
+    """Normaliza la columna de equipo ('Bluebans', 'bKills'...) a 'blue' / 'red'."""
+    lowered = team.astype(str).str.lower()
+    return pd.Series(
+        np.select([lowered.str.startswith('b'), lowered.str.startswith('r')], ['blue', 'red'], 'unknown'),
+        index=team.index
+    )
+
+
+def long_ban_table(df: pd.DataFrame, ban_cols: list) -> pd.DataFrame:
+    """
+    Convierte el dataset de bans a formato largo: una fila por ban con
+    ``game_key``, ``side``, ``champion`` y ``priority`` (1 = primer ban).
+    """
+    id_vars = [col for col in ['game_key', 'team'] if col in df.columns]
+    long = df[id_vars + ban_cols].melt(id_vars=id_vars, var_name='slot', value_name='champion')
+    long = long[long['champion'].notna() & (long['champion'].astype(str) != '')]
+
+    long['priority'] = long['slot'].map({col: i for i, col in enumerate(ban_cols, 1)}).astype('int8')
+    long['champion'] = long['champion'].astype(str)
+    if 'game_key' not in long.columns:
+        # Sin clave de partida cada fila del dataset cuenta como una partida
+        long['game_key'] = long.index % len(df)
+    if 'team' in long.columns:
+        long['side'] = side_from_team(long['team'])
+
+    return long.drop(columns=['slot', 'team'], errors='ignore')
+
+
+def champion_bans_partial(
+    df: pd.DataFrame,
+    games: Optional[pd.DataFrame] = None,
+    dimensions: Optional[list] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Agregados aditivos de bans por corte (``all`` / ``all`` y cada dimensión).
+    
+    Cada partida aporta a un solo agregado, así que los de partidas distintas
+    se combinan sumando (también ``games_banned``, que cuenta partidas).
+    
+    Returns:
+        Tupla con (por dimension, segment y champion: ban_count, games_banned y
+        priority_sum; por dimension y segment: games y bans)
+    """
+    dimensions = DEFAULT_BREAKDOWN_DIMENSIONS if dimensions is None else dimensions
+    available_ban_cols = [col for col in BAN_COLUMNS if col in df.columns]
+    long = long_ban_table(df, available_ban_cols)
+    
+    if games is not None and 'game_key' in games.columns:
+        dims = games.drop_duplicates('game_key').set_index('game_key')
+        for col in dims.columns:
+            long[col] = long['game_key'].map(dims[col])
+    long['all'] = 'all'
+    
+    ban_tables, segment_tables = [], []
+    for dim in ['all'] + list(dimensions):
+        if dim not in long.columns:
+            logger.warning(f"Dimensión '{dim}' no disponible para el desglose de bans")
+            continue
+        bans = long.groupby([dim, 'champion'], observed=True, sort=False).agg(
+            ban_count=('priority', 'size'),
+            games_banned=('game_key', 'nunique'),
+            priority_sum=('priority', 'sum'),
+        ).reset_index()
+        segments = long.groupby(dim, observed=True, sort=False).agg(
+            games=('game_key', 'nunique'),
+            bans=('priority', 'size'),
+        ).reset_index()
+        for table, tables in [(bans, ban_tables), (segments, segment_tables)]:
+            table.insert(0, 'dimension', dim)
+            tables.append(table.rename(columns={dim: 'segment'}).astype({'segment': str}))
+    
+    return pd.concat(ban_tables, ignore_index=True), pd.concat(segment_tables, ignore_index=True)
+
+
+def render_champion_bans(bans: pd.DataFrame, segments: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Resumen por campeón y desglose por segmento a partir de los agregados de bans."""
+    stats = bans.merge(segments, on=['dimension', 'segment'], how='left')
+    stats['presence_rate'] = (stats['games_banned'] / stats['games'] * 100).round(2)
+    stats['avg_ban_priority'] = (stats['priority_sum'] / stats['ban_count']).round(2)
+    stats['ban_percentage'] = (stats['ban_count'] / stats['bans'] * 100).round(2)
+    
+    overall = stats['dimension'] == 'all'
+    ban_counts = stats[overall].sort_values(
+        ['ban_count', 'champion'], ascending=[False, True], ignore_index=True
+    )[['champion', 'ban_count', 'ban_percentage', 'games_banned', 'presence_rate', 'avg_ban_priority']]
+    
+    breakdown = stats[~overall].sort_values(
+        ['dimension', 'segment', 'ban_count', 'champion'],
+        ascending=[True, True, False, True], ignore_index=True
+    )[['dimension', 'segment', 'champion', 'ban_count', 'games_banned', 'presence_rate', 'avg_ban_priority']]
+    if breakdown.empty:
+        breakdown = pd.DataFrame()
+    
+    return ban_counts, breakdown
+
+
+def analyze_champion_bans(
+    df: pd.DataFrame,
+    games: Optional[pd.DataFrame] = None,
+    parameters: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Analiza los campeones más baneados y su frecuencia.
     
+    Los bans se pasan una vez a formato largo (una fila por ban) y todas las
+    métricas salen de agregados aditivos por corte (todas las partidas y cada
+    dimensión de desglose), los mismos que combina la EDA incremental.
+    
     Args:
-        df: DataFrame limpio de bans
+        df: DataFrame limpio de bans (``game_key``, ``team``, ``ban_1``..``ban_5``)
+        games: Dimensiones por partida (``game_key``, ``league``, ``year``,
+            ``season``) para los desgloses
+        parameters: Configuración (``params:data_exploration``);
+            ``breakdown_dimensions`` elige los desgloses
         
     Returns:
-        DataFrame con análisis de bans por campeón
+        Tupla con (análisis de bans por campeón, desglose por segmento)
+    
+    Métricas:
+        - ban_count / ban_percentage: bans del campeón y % sobre todos los bans
+        - games_banned: partidas distintas en que fue baneado
+        - presence_rate: % de partidas en que fue baneado
+        - avg_ban_priority: posición promedio del ban (1 = primer ban)
     """
     logger.info("Analizando bans de campeones")
-    
-    # El dataset de bans tiene columnas ban_1, ban_2, ban_3, ban_4, ban_5
-    ban_columns = ['ban_1', 'ban_2', 'ban_3', 'ban_4', 'ban_5']
+    parameters = parameters or {}
     
     # Verificar que existan las columnas
-    available_ban_cols = [col for col in ban_columns if col in df.columns]
-    
-    if not available_ban_cols:
+    if not any(col in df.columns for col in BAN_COLUMNS):
         logger.warning("No se encontraron columnas de bans (ban_1, ban_2, etc.)")
-        return pd.DataFrame()
+        return pd.DataFrame(), pd.DataFrame()
     
-    # Combinar todos los bans en una lista
-    all_bans = []
-    for col in available_ban_cols:
-        bans = df[col].dropna()
-        bans = bans[bans != '']  # Eliminar valores vacíos
-        all_bans.extend(bans.tolist())
+    bans, segments = champion_bans_partial(
+        df, games, parameters.get('breakdown_dimensions', DEFAULT_BREAKDOWN_DIMENSIONS)
+    )
     
-    if not all_bans:
+    if bans.empty:
         logger.warning("No se encontraron bans en los datos")
-        return pd.DataFrame()
-    
-    # Crear DataFrame con todos los bans
-    bans_series = pd.Series(all_bans)
-    
-    # Contar bans por campeón
-    ban_counts = bans_series.value_counts().reset_index()
-    ban_counts.columns = ['champion', 'ban_count']
-    
-    # Calcular porcentaje
-    total_bans = len(bans_series)
-    ban_counts['ban_percentage'] = (ban_counts['ban_count'] / total_bans * 100).round(2)
+        return pd.DataFrame(), pd.DataFrame()
     
-    # Calcular en cuántos juegos únicos fue baneado
-    games_banned = []
-    for champion in ban_counts['champion']:
-        games = 0
-        for col in available_ban_cols:
-            games += (df[col] == champion).sum()
-        games_banned.append(games)
+    ban_counts, breakdown = render_champion_bans(bans, segments)
     
-    ban_counts['games_banned'] = games_banned
+    logger.info(f"Análisis de bans completado para {len(ban_counts)} campeones "
+                f"({len(breakdown)} filas de desglose)")
     
-    # Calcular prioridad promedio de ban (1 = primer ban, 5 = último ban)
-    ban_priorities = []
-    for champion in ban_counts['champion']:
-        priorities = []
-        for i, col in enumerate(available_ban_cols, 1):
-            if champion in df[col].values:
-                count = (df[col] == champion).sum()
-                priorities.extend([i] * count)
-        if priorities:
-            ban_priorities.append(sum(priorities) / len(priorities))
-        else:
-            ban_priorities.append(0)
-    
-    ban_counts['avg_ban_priority'] = [round(p, 2) for p in ban_priorities]
-    
-    logger.info(f"Análisis de bans completado para {len(ban_counts)} campeones")
-    
-    return ban_counts
+    return ban_counts, breakdown
 
 
 # ============================================================================
 # NODO 4: Análisis de Objetivos Neutrales
 # ============================================================================
 
+def event_types_partial(df: pd.DataFrame, detail: Optional[str] = None) -> pd.DataFrame:
+    """
+    Agregado aditivo de eventos por tipo y detalle (equipo, lane): conteo y
+    suma de tiempos. Los agregados de partidas distintas se combinan sumando.
+    """
+    keys = pd.DataFrame({
+        'type': df['type'].astype(object),
+        'detail': df[detail].astype(object) if detail in df.columns else np.nan,
+    })
+    time = df['time'] if 'time' in df.columns else pd.Series(np.nan, index=df.index)
+    keys['time'] = time.astype(np.float64)
+    keys['time_count'] = time.notna()
+    return keys.groupby(['type', 'detail'], dropna=False, sort=False).agg(
+        count=('time_count', 'size'),
+        time_sum=('time', 'sum'),
+        time_count=('time_count', 'sum'),
+    ).reset_index()
+
+
+def render_event_types(
+    partial: pd.DataFrame,
+    type_col: str,
+    count_col: str,
+    time_col: str,
+    has_time: bool = True
+) -> pd.DataFrame:
+    """
+    Conteo por tipo, tiempo promedio (segundos y minutos) y conteos por
+    detalle como columnas, a partir del agregado de ``event_types_partial``.
+    """
+    partial = partial[partial['type'].notna()]
+    
+    counts = partial.groupby('type').agg(
+        total=('count', 'sum'), time_sum=('time_sum', 'sum'), time_count=('time_count', 'sum')
+    )
+    counts = counts.sort_values('total', ascending=False, kind='stable')
+    result = pd.DataFrame({type_col: counts.index.to_numpy(), count_col: counts['total'].to_numpy()})
+    
+    if has_time:
+        avg_time = (counts['time_sum'] / counts['time_count'].replace(0, np.nan)).to_numpy()
+        result[f'{time_col}_seconds'] = avg_time
+        result[f'{time_col}_minutes'] = (avg_time / 60).round(2)
+    
+    # Conteos por detalle (equipo o lane) como columnas
+    details = partial[partial['detail'].notna()]
+    if not details.empty:
+        pivot = details.pivot_table(index='type', columns='detail', values='count', aggfunc='sum', fill_value=0)
+        pivot.columns.name = None
+        result = result.merge(pivot, left_on=type_col, right_index=True, how='left')
+    
+    return result
+
+
 def analyze_neutral_objectives(df: pd.DataFrame) -> pd.DataFrame:
     """
     Analiza la captura de objetivos neutrales (dragones, baron, herald).
@@ -232,32 +407,11 @@ def analyze_neutral_objectives(df: pd.DataFrame) -> pd.DataFrame:
         logger.warning("Columna 'type' no encontrada")
         return pd.DataFrame()
     
-    # Contar por tipo de objetivo
-    objective_counts = df['type'].value_counts().reset_index()
-    objective_counts.columns = ['objective_type', 'total_captured']
-    
-    # Tiempo promedio de captura
-    if 'time' in df.columns:
-        avg_time = df.groupby('type')['time'].mean().reset_index()
-        avg_time.columns = ['objective_type', 'avg_capture_time_seconds']
-        objective_counts = objective_counts.merge(avg_time, on='objective_type', how='left')
-        objective_counts['avg_capture_time_minutes'] = (
-            objective_counts['avg_capture_time_seconds'] / 60
-        ).round(2)
-    
-    # Captura por equipo
-    if 'team' in df.columns:
-        team_captures = df.groupby(['type', 'team']).size().reset_index(name='captures')
-        # Pivotear para tener equipos como columnas
-        team_pivot = team_captures.pivot(
-            index='type', columns='team', values='captures'
-        ).reset_index()
-        team_pivot.columns.name = None
-        objective_counts = objective_counts.merge(
-            team_pivot, left_on='objective_type', right_on='type', how='left'
-        )
-        if 'type' in objective_counts.columns:
-            objective_counts = objective_counts.drop('type', axis=1)
+    # Conteo, tiempo promedio de captura y captura por equipo
+    objective_counts = render_event_types(
+        event_types_partial(df, detail='team'),
+        'objective_type', 'total_captured', 'avg_capture_time', has_time='time' in df.columns
+    )
     
     logger.info(f"Análisis de objetivos completado para {len(objective_counts)} tipos")
     
@@ -284,31 +438,11 @@ def analyze_structures(df: pd.DataFrame) -> pd.DataFrame:
         logger.warning("Columna 'type' no encontrada")
         return pd.DataFrame()
     
-    # Contar por tipo de estructura
-    structure_counts = df['type'].value_counts().reset_index()
-    structure_counts.columns = ['structure_type', 'total_destroyed']
-    
-    # Tiempo promedio de destrucción
-    if 'time' in df.columns:
-        avg_time = df.groupby('type')['time'].mean().reset_index()
-        avg_time.columns = ['structure_type', 'avg_destruction_time_seconds']
-        structure_counts = structure_counts.merge(avg_time, on='structure_type', how='left')
-        structure_counts['avg_destruction_time_minutes'] = (
-            structure_counts['avg_destruction_time_seconds'] / 60
-        ).round(2)
-    
-    # Destrucción por lane
-    if 'lane' in df.columns:
-        lane_counts = df.groupby(['type', 'lane']).size().reset_index(name='count')
-        lane_pivot = lane_counts.pivot(
-            index='type', columns='lane', values='count'
-        ).reset_index()
-        lane_pivot.columns.name = None
-        structure_counts = structure_counts.merge(
-            lane_pivot, left_on='structure_type', right_on='type', how='left'
-        )
-        if 'type' in structure_counts.columns:
-            structure_counts = structure_counts.drop('type', axis=1)
+    # Conteo, tiempo promedio de destrucción y destrucción por lane
+    structure_counts = render_event_types(
+        event_types_partial(df, detail='lane'),
+        'structure_type', 'total_destroyed', 'avg_destruction_time', has_time='time' in df.columns
+    )
     
     logger.info(f"Análisis de estructuras completado para {len(structure_counts)} tipos")
     
@@ -319,53 +453,32 @@ def analyze_structures(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 6: Análisis de Correlaciones
 # ============================================================================
 
-def analyze_correlations(df: pd.DataFrame) -> pd.DataFrame:
+def analyze_correlations(df: pd.DataFrame, parameters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
     Analiza correlaciones entre variables numéricas.
     
+    Los pares salen del motor de ``correlations.py`` (bloques de columnas,
+    float32 solo en DataFrames anchos, Spearman con rangos cacheados y
+    filtros ``top_k`` / ``threshold``).
+    
     Args:
         df: DataFrame limpio del dataset principal
+        parameters: Parámetros ``data_exploration`` (usa ``correlations``)
         
     Returns:
-        DataFrame con matriz de correlación
+        DataFrame con los pares de variables ordenados por |correlación|
     """
-    logger.info("Analizando correlaciones")
+    config = (parameters or {}).get('correlations')
+    logger.info(f"Analizando correlaciones ({(config or {}).get('method', 'pearson')})")
     
-    # Seleccionar solo columnas numéricas
-    numeric_df = df.select_dtypes(include=[np.number])
-    
-    # Calcular matriz de correlación
-    corr_matrix = numeric_df.corr()
-    
-    # Convertir a formato largo para mejor análisis
-    corr_pairs = []
-    for i in range(len(corr_matrix.columns)):
-        for j in range(i+1, len(corr_matrix.columns)):
-            corr_pairs.append({
-                'variable_1': corr_matrix.columns[i],
-                'variable_2': corr_matrix.columns[j],
-                'correlation': corr_matrix.iloc[i, j],
-                'abs_correlation': abs(corr_matrix.iloc[i, j])
-            })
-    
-    corr_df = pd.DataFrame(corr_pairs)
-    
-    # Ordenar por correlación absoluta
-    corr_df = corr_df.sort_values('abs_correlation', ascending=False)
+    corr_df = correlation_pairs(df, config)
     
     # Clasificar fuerza de correlación
-    def classify_correlation(corr):
-        abs_corr = abs(corr)
-        if abs_corr >= 0.7:
-            return 'Fuerte'
-        elif abs_corr >= 0.4:
-            return 'Moderada'
-        elif abs_corr >= 0.2:
-            return 'Débil'
-        else:
-            return 'Muy Débil'
-    
-    corr_df['strength'] = corr_df['correlation'].apply(classify_correlation)
+    corr_df['strength'] = np.select(
+        [corr_df['abs_correlation'] >= 0.7, corr_df['abs_correlation'] >= 0.4, corr_df['abs_correlation'] >= 0.2],
+        ['Fuerte', 'Moderada', 'Débil'],
+        default='Muy Débil'
+    )
     corr_df['correlation'] = corr_df['correlation'].round(3)
     
     logger.info(f"Análisis de correlaciones completado: {len(corr_df)} pares analizados")
@@ -377,66 +490,45 @@ def analyze_correlations(df: pd.DataFrame) -> pd.DataFrame:
 # NODO 7: Análisis de Duración de Partidos
 # ============================================================================
 
-def analyze_game_duration(df: pd.DataFrame) -> pd.DataFrame:
+def analyze_game_duration(
+    df: pd.DataFrame,
+    parameters: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Analiza la duración de los partidos y su distribución.
     
+    No modifica ``df``: la discretización y los cortes por liga y año salen del
+    motor de histogramas de ``duration.py``.
+    
     Args:
         df: DataFrame limpio del dataset principal
+        parameters: Parámetros ``data_exploration`` (usa ``duration``)
         
     Returns:
-        DataFrame con análisis de duración
+        Tupla con (resumen general con estadísticas y distribución por
+        categoría, estadísticas y percentiles por segmento, conteos por
+        categoría y segmento)
     """
     logger.info("Analizando duración de partidos")
     
-    duration_col = None
-    if 'gamelength_minutes' in df.columns:
-        duration_col = 'gamelength_minutes'
-    elif 'gamelength' in df.columns:
-        df['gamelength_minutes'] = df['gamelength'] / 60
-        duration_col = 'gamelength_minutes'
-    
-    if duration_col is None:
-        logger.warning("No se encontró columna de duración")
-        return pd.DataFrame()
-    
-    # Estadísticas descriptivas
-    stats = {
-        'metric': ['count', 'mean', 'median', 'std', 'min', 'max', 'q25', 'q75'],
-        'value': [
-            len(df[duration_col]),
-            df[duration_col].mean(),
-            df[duration_col].median(),
-            df[duration_col].std(),
-            df[duration_col].min(),
-            df[duration_col].max(),
-            df[duration_col].quantile(0.25),
-            df[duration_col].quantile(0.75),
-        ]
-    }
-    
-    stats_df = pd.DataFrame(stats)
-    stats_df['value'] = stats_df['value'].round(2)
-    
-    # Categorizar duración
-    bins = [0, 25, 35, 45, float('inf')]
-    labels = ['Corta (<25 min)', 'Media (25-35 min)', 'Larga (35-45 min)', 'Muy Larga (>45 min)']
-    df['duration_category'] = pd.cut(df[duration_col], bins=bins, labels=labels)
+    config = {**DEFAULT_DURATION, **((parameters or {}).get('duration') or {})}
+    if config['column'] not in df.columns:
+        logger.warning(f"No se encontró columna de duración ({config['column']})")
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
     
-    # Contar por categoría
-    category_counts = df['duration_category'].value_counts().reset_index()
-    category_counts.columns = ['category', 'count']
-    category_counts['percentage'] = (category_counts['count'] / len(df) * 100).round(2)
+    percentiles, categories = duration_tables(df, config)
+    if percentiles.empty:
+        logger.warning("La columna de duración no tiene valores")
+        return pd.DataFrame(), percentiles, categories
     
-    # Combinar estadísticas
-    stats_df['category'] = 'Estadísticas Generales'
-    category_counts['metric'] = category_counts['category']
-    category_counts['value'] = category_counts['percentage']
-    category_counts = category_counts[['metric', 'value', 'category']]
+    stats_df = summarize_duration(percentiles, categories)
     
-    logger.info(f"Análisis de duración completado")
+    logger.info(
+        f"Análisis de duración completado: {int(percentiles['count'].iloc[0])} partidos, "
+        f"{len(percentiles) - 1} segmentos"
+    )
     
-    return stats_df
+    return stats_df, percentiles, categories
 
 
 # ============================================================================
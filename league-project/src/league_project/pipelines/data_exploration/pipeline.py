@@ -16,6 +16,8 @@ from .nodes import (
     analyze_game_duration,
     generate_eda_report
 )
+from .cube import build_analytics_cube
+from .incremental import render_eda_state, update_eda_state
 
 
 def create_pipeline(**kwargs) -> Pipeline:
@@ -23,14 +25,15 @@ def create_pipeline(**kwargs) -> Pipeline:
     Crea el pipeline de exploración de datos.
     
     Este pipeline:
-    1. Genera estadísticas descriptivas
-    2. Analiza rendimiento de equipos
-    3. Analiza bans de campeones
+    1. Genera estadísticas descriptivas (una pasada, resumen combinable)
+    2. Analiza rendimiento de equipos (total, por lado y por rival)
+    3. Analiza bans de campeones (con desglose por liga, año, temporada y lado)
     4. Analiza objetivos neutrales
     5. Analiza destrucción de estructuras
     6. Analiza correlaciones
-    7. Analiza duración de partidos
+    7. Analiza duración de partidos (histograma, percentiles y categorías por liga y año)
     8. Genera reporte completo de EDA
+    9. Materializa el cubo analítico (liga × año × split × equipo)
     
     Returns:
         Pipeline de Kedro con todos los nodos de exploración
@@ -42,7 +45,7 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=generate_descriptive_statistics,
-                inputs="intermediate_main_data",
+                inputs=["intermediate_main_data@numeric", "params:data_exploration"],
                 outputs="descriptive_statistics",
                 name="generate_descriptive_stats_node",
                 tags=["eda", "statistics"],
@@ -53,8 +56,12 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=analyze_team_performance,
-                inputs="intermediate_main_data",
-                outputs="team_performance_analysis",
+                inputs="intermediate_main_data@teams",
+                outputs=[
+                    "team_performance_analysis",
+                    "team_side_performance",
+                    "team_matchup_performance",
+                ],
                 name="analyze_team_performance_node",
                 tags=["eda", "teams"],
             ),
@@ -64,8 +71,8 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=analyze_champion_bans,
-                inputs="intermediate_bans",
-                outputs="champion_bans_analysis",
+                inputs=["intermediate_bans@eda", "intermediate_main_data@games", "params:data_exploration"],
+                outputs=["champion_bans_analysis", "champion_bans_breakdown"],
                 name="analyze_champion_bans_node",
                 tags=["eda", "champions"],
             ),
@@ -75,7 +82,7 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=analyze_neutral_objectives,
-                inputs="intermediate_monsters",
+                inputs="intermediate_monsters@eda",
                 outputs="neutral_objectives_analysis",
                 name="analyze_neutral_objectives_node",
                 tags=["eda", "objectives"],
@@ -86,7 +93,7 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=analyze_structures,
-                inputs="intermediate_structures",
+                inputs="intermediate_structures@eda",
                 outputs="structures_analysis",
                 name="analyze_structures_node",
                 tags=["eda", "structures"],
@@ -97,7 +104,7 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=analyze_correlations,
-                inputs="intermediate_main_data",
+                inputs=["intermediate_main_data@numeric", "params:data_exploration"],
                 outputs="correlations_analysis",
                 name="analyze_correlations_node",
                 tags=["eda", "correlations"],
@@ -108,8 +115,8 @@ def create_pipeline(**kwargs) -> Pipeline:
             # ================================================================
             node(
                 func=analyze_game_duration,
-                inputs="intermediate_main_data",
-                outputs="game_duration_analysis",
+                inputs=["intermediate_main_data@duration", "params:data_exploration"],
+                outputs=["game_duration_analysis", "game_duration_percentiles", "game_duration_categories"],
                 name="analyze_game_duration_node",
                 tags=["eda", "duration"],
             ),
@@ -132,7 +139,134 @@ def create_pipeline(**kwargs) -> Pipeline:
                 name="generate_eda_report_node",
                 tags=["eda", "reporting"],
             ),
+            
+            # ================================================================
+            # NODO 9: Cubo analítico (liga × año × split × equipo)
+            # ================================================================
+            node(
+                func=build_analytics_cube,
+                inputs=[
+                    "intermediate_main_data@cube",
+                    "intermediate_bans@eda",
+                    "intermediate_monsters@eda",
+                ],
+                outputs=[
+                    "analytics_cube_teams",
+                    "analytics_cube_bans",
+                    "analytics_cube_objectives",
+                ],
+                name="build_analytics_cube_node",
+                tags=["eda", "cube"],
+            ),
         ],
         tags=["data_exploration_pipeline"]
     )
 
+
+def create_incremental_pipeline(**kwargs) -> Pipeline:
+    """
+    Crea el pipeline de exploración incremental.
+    
+    Mismas tablas de reporte que ``create_pipeline``, pero los análisis de
+    equipos, bans, objetivos, estructuras, duración y estadísticas
+    descriptivas se actualizan solo con las partidas nuevas sobre el estado
+    guardado (``eda_state``). Las correlaciones y el cubo analítico se
+    recalculan completos.
+    
+    Returns:
+        Pipeline de Kedro de la EDA incremental
+    """
+    return pipeline(
+        [
+            # ================================================================
+            # NODO 1: Combinar las partidas nuevas con el estado de EDA
+            # ================================================================
+            node(
+                func=update_eda_state,
+                inputs=[
+                    "eda_state_previous",
+                    "intermediate_main_data@incremental",
+                    "intermediate_bans@eda",
+                    "intermediate_monsters@eda",
+                    "intermediate_structures@eda",
+                    "params:data_exploration",
+                ],
+                outputs="eda_state",
+                name="update_eda_state_node",
+                tags=["eda", "incremental"],
+            ),
+            
+            # ================================================================
+            # NODO 2: Reescribir las tablas del reporte desde el estado
+            # ================================================================
+            node(
+                func=render_eda_state,
+                inputs=["eda_state", "params:data_exploration"],
+                outputs=[
+                    "descriptive_statistics",
+                    "team_performance_analysis",
+                    "team_side_performance",
+                    "team_matchup_performance",
+                    "champion_bans_analysis",
+                    "champion_bans_breakdown",
+                    "neutral_objectives_analysis",
+                    "structures_analysis",
+                    "game_duration_analysis",
+                    "game_duration_percentiles",
+                    "game_duration_categories",
+                ],
+                name="render_eda_state_node",
+                tags=["eda", "incremental", "reporting"],
+            ),
+            
+            # ================================================================
+            # NODO 3: Análisis de correlaciones (completo)
+            # ================================================================
+            node(
+                func=analyze_correlations,
+                inputs=["intermediate_main_data@numeric", "params:data_exploration"],
+                outputs="correlations_analysis",
+                name="analyze_correlations_node",
+                tags=["eda", "correlations"],
+            ),
+            
+            # ================================================================
+            # NODO 4: Generar reporte completo de EDA
+            # ================================================================
+            node(
+                func=generate_eda_report,
+                inputs=[
+                    "descriptive_statistics",
+                    "team_performance_analysis",
+                    "champion_bans_analysis",
+                    "neutral_objectives_analysis",
+                    "structures_analysis",
+                    "correlations_analysis",
+                    "game_duration_analysis",
+                ],
+                outputs="eda_complete_report",
+                name="generate_eda_report_node",
+                tags=["eda", "reporting"],
+            ),
+            
+            # ================================================================
+            # NODO 5: Cubo analítico (liga × año × split × equipo)
+            # ================================================================
+            node(
+                func=build_analytics_cube,
+                inputs=[
+                    "intermediate_main_data@cube",
+                    "intermediate_bans@eda",
+                    "intermediate_monsters@eda",
+                ],
+                outputs=[
+                    "analytics_cube_teams",
+                    "analytics_cube_bans",
+                    "analytics_cube_objectives",
+                ],
+                name="build_analytics_cube_node",
+                tags=["eda", "cube"],
+            ),
+        ],
+        tags=["data_exploration_incremental_pipeline"]
+    )
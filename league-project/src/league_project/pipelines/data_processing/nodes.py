@@ -5,189 +5,313 @@ Feature engineering y preparación de datos para modelado.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
 import logging
 
+from league_project.game_keys import GAME_KEY, encode_game_keys, game_content_hashes
+from league_project.splits import split_config, split_indices
+
+from .timeline import DEFAULT_GOLD_TIMELINE, gold_timeline_features
+from .windows import windowed_event_features
+
 logger = logging.getLogger(__name__)
 
 
-def aggregate_kills_features(
-    df_matches: pd.DataFrame,
-    df_kills: pd.DataFrame
-) -> pd.DataFrame:
+# Features de conteo por tabla de eventos: valor de ``Team`` → feature, y
+# diferencias azul - rojo
+EVENT_FEATURES = {
+    'kills': (
+        {'bKills': 'blue_kills', 'rKills': 'red_kills'},
+        {'kill_diff': ('blue_kills', 'red_kills')},
+    ),
+    'monsters': (
+        {'bDragons': 'blue_dragons', 'rDragons': 'red_dragons', 'bBarons': 'blue_barons', 'rBarons': 'red_barons'},
+        {'dragon_diff': ('blue_dragons', 'red_dragons'), 'baron_diff': ('blue_barons', 'red_barons')},
+    ),
+    'structures': (
+        {'bTowers': 'blue_towers', 'rTowers': 'red_towers', 'bInhibs': 'blue_inhibs', 'rInhibs': 'red_inhibs'},
+        {'tower_diff': ('blue_towers', 'red_towers'), 'inhib_diff': ('blue_inhibs', 'red_inhibs')},
+    ),
+}
+
+# Minutos por defecto de las features de oro (feature_engineering.gold_minutes)
+DEFAULT_GOLD_MINUTES = [10, 15, 20]
+
+# Versión del cálculo de features: subirla cuando cambie el código de alguna
+# feature o del hash de entrada (``input_hash``), para que el feature store
+# recalcule las partidas guardadas
+FEATURE_DEFINITION_VERSION = 3
+
+
+def feature_definition(parameters: Optional[Dict] = None, matchinfo_columns: Optional[List[str]] = None) -> str:
     """
-    Agrega features de kills por partida.
-    
-    Args:
-        df_matches: DataFrame con información de partidas
-        df_kills: DataFrame con información de kills
-        
-    Returns:
-        DataFrame con features de kills agregados
+    Huella de la definición de las features por partida: versión del
+    cálculo, features de eventos, parámetros ``feature_engineering`` que
+    cambian los valores (``gold_minutes``, ``time_windows``, ``gold_timeline``)
+    y columnas de matchinfo que se guardan con ellas.
     """
-    logger.info("Agregando features de kills...")
-    
-    # Contar kills por equipo
-    kills_blue = df_kills[df_kills['Team'] == 'bKills'].groupby('Address').size().reset_index(name='blue_kills')
-    kills_red = df_kills[df_kills['Team'] == 'rKills'].groupby('Address').size().reset_index(name='red_kills')
-    
-    # Merge con el dataset principal
-    df_features = df_matches.copy()
-    df_features = df_features.merge(kills_blue, on='Address', how='left')
-    df_features = df_features.merge(kills_red, on='Address', how='left')
-    
-    # Llenar NaN con 0
-    df_features['blue_kills'] = df_features['blue_kills'].fillna(0)
-    df_features['red_kills'] = df_features['red_kills'].fillna(0)
-    
-    # Crear feature de diferencia
-    df_features['kill_diff'] = df_features['blue_kills'] - df_features['red_kills']
-    
-    logger.info(f"✓ Features de kills agregados: blue_kills, red_kills, kill_diff")
-    
-    return df_features
+    parameters = parameters or {}
+    config = {
+        'version': FEATURE_DEFINITION_VERSION,
+        'matchinfo_columns': sorted(matchinfo_columns or []),
+        'event_features': EVENT_FEATURES,
+        'gold_minutes': list(parameters.get('gold_minutes') or DEFAULT_GOLD_MINUTES),
+        'time_windows': sorted(set(parameters.get('time_windows') or [])),
+        'gold_timeline': {**DEFAULT_GOLD_TIMELINE, **(parameters.get('gold_timeline') or {})},
+    }
+    return hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:16]
 
 
-def aggregate_monsters_features(
-    df_features: pd.DataFrame,
-    df_monsters: pd.DataFrame
+def _encode_events(tables: Dict[str, pd.DataFrame]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Partida, código de feature (``EVENT_FEATURES``) y minuto de cada evento
+    de las tablas de eventos; los eventos de otros tipos se descartan.
+    """
+    features = [feature for name in EVENT_FEATURES for feature in EVENT_FEATURES[name][0].values()]
+    codes = {team: features.index(feature) for name in EVENT_FEATURES
+             for team, feature in EVENT_FEATURES[name][0].items()}
+
+    keys, feature_codes, times = [], [], []
+    for name, df in tables.items():
+        code = df['Team'].astype(object).map(codes).to_numpy(dtype=np.float64, na_value=np.nan)
+        known = ~np.isnan(code)
+        keys.append(df[GAME_KEY].to_numpy()[known])
+        feature_codes.append(code[known].astype(np.int64))
+        time = df['Time'] if 'Time' in df.columns else pd.Series(np.nan, index=df.index)
+        times.append(time.to_numpy(dtype=np.float64, na_value=np.nan)[known])
+
+    return np.concatenate(keys), np.concatenate(feature_codes), np.concatenate(times), features
+
+
+def _event_diffs() -> Dict[str, Tuple[str, str]]:
+    """Diferencias azul - rojo de todas las tablas de eventos."""
+    return {diff: pair for name in EVENT_FEATURES for diff, pair in EVENT_FEATURES[name][1].items()}
+
+
+def _event_counts(keys: np.ndarray, codes: np.ndarray, features: List[str]) -> pd.DataFrame:
+    """
+    Conteos por partida y lado de todas las tablas de eventos en una pasada:
+    los pares (partida, feature) se cuentan con un solo ``bincount``.
+    """
+    game_index, game_keys = pd.factorize(keys, sort=True)
+    n_features = len(features)
+    counts = np.bincount(
+        game_index * n_features + codes,
+        minlength=len(game_keys) * n_features
+    ).reshape(len(game_keys), n_features)
+
+    result = pd.DataFrame(counts, columns=features)
+    result.insert(0, GAME_KEY, game_keys)
+    for diff, (blue, red) in _event_diffs().items():
+        result[diff] = result[blue] - result[red]
+
+    # Orden de columnas por tabla: conteos y luego sus diferencias
+    order = [GAME_KEY]
+    for name in EVENT_FEATURES:
+        order += list(EVENT_FEATURES[name][0].values()) + list(EVENT_FEATURES[name][1])
+    return result[order]
+
+
+def _gold_at_minutes(df_gold: pd.DataFrame, gold_minutes: List[int]) -> pd.DataFrame:
+    """
+    Diferencia de oro por partida en los minutos dados (``gold_diff_<m>``).
+
+    Toma la primera serie ``golddiff`` de cada partida y lee de una vez las
+    columnas ``min_<m>``; un minuto sin columna en las series parseadas
+    (partidas más cortas) queda como NaN.
+    """
+    df_gold_features = df_gold.loc[df_gold['Type'] == 'golddiff'].drop_duplicates(GAME_KEY)
+
+    df_gold_agg = pd.DataFrame({GAME_KEY: df_gold_features[GAME_KEY].to_numpy()})
+    for minute in gold_minutes:
+        column = f'min_{minute}'
+        df_gold_agg[f'gold_diff_{minute}'] = (
+            df_gold_features[column].to_numpy() if column in df_gold_features.columns else np.nan
+        )
+    return df_gold_agg
+
+
+def aggregate_event_features(
+    df_kills: pd.DataFrame,
+    df_monsters: pd.DataFrame,
+    df_structures: pd.DataFrame,
+    df_gold: pd.DataFrame,
+    parameters: Optional[Dict] = None,
+    df_games: Optional[pd.DataFrame] = None
 ) -> pd.DataFrame:
     """
-    Agrega features de objetivos (dragones y barones).
+    Agrega las features de eventos por partida en una sola etapa.
+    
+    Reemplaza la cadena kills → monsters → structures → gold: los conteos por
+    lado de las tres tablas de eventos salen de un único conteo conjunto y la
+    diferencia de oro de una sola lectura de las series, sin copias
+    intermedias de la tabla de partidas.
+    
+    Con ``time_windows`` se agregan además los conteos, diferencias y primer
+    evento hasta cada minuto de corte (``windows.windowed_event_features``),
+    que no dependen de lo ocurrido después del corte. Con ``gold_timeline``
+    se agregan las features de la serie de oro completa
+    (``timeline.gold_timeline_features``).
+    
+    Con ``df_games`` solo se calculan las partidas de esa tabla (las que
+    faltan en el feature store); todas las features son por partida, así que
+    el resultado de cada una no depende de las demás.
     
     Args:
-        df_features: DataFrame con features actuales
+        df_kills: DataFrame con información de kills
         df_monsters: DataFrame con información de monstruos
+        df_structures: DataFrame con información de estructuras
+        df_gold: DataFrame con información de oro
+        parameters: Parámetros ``feature_engineering`` (usa ``gold_minutes``,
+            ``time_windows`` y ``gold_timeline``)
+        df_games: Partidas a calcular (con ``game_key``); ``None`` = todas
         
     Returns:
-        DataFrame con features de monstruos agregados
+        DataFrame con una fila por ``game_key``: kills, dragones, barones,
+        torres e inhibidores por lado, sus diferencias, ``gold_diff_<m>``,
+        las features por ventana (``<feature>_<c>``, ``first_<evento>_<c>``)
+        y las de la serie de oro (``gold_slope``, ``gold_auc``...)
     """
-    logger.info("Agregando features de objetivos (dragones/barones)...")
+    logger.info("Agregando features de eventos (kills, objetivos, estructuras, oro)...")
     
-    # Dragones por equipo
-    dragons_blue = df_monsters[df_monsters['Team'] == 'bDragons'].groupby('Address').size().reset_index(name='blue_dragons')
-    dragons_red = df_monsters[df_monsters['Team'] == 'rDragons'].groupby('Address').size().reset_index(name='red_dragons')
+    parameters = parameters or {}
+    gold_minutes = parameters.get('gold_minutes') or DEFAULT_GOLD_MINUTES
+    time_windows = parameters.get('time_windows') or []
     
-    # Barones por equipo
-    barons_blue = df_monsters[df_monsters['Team'] == 'bBarons'].groupby('Address').size().reset_index(name='blue_barons')
-    barons_red = df_monsters[df_monsters['Team'] == 'rBarons'].groupby('Address').size().reset_index(name='red_barons')
+    if df_games is not None:
+        selected = df_games[GAME_KEY].to_numpy()
+        df_kills, df_monsters, df_structures, df_gold = (
+            df[np.isin(df[GAME_KEY].to_numpy(), selected)]
+            for df in (df_kills, df_monsters, df_structures, df_gold)
+        )
     
-    # Merge
-    df_result = df_features.copy()
-    df_result = df_result.merge(dragons_blue, on='Address', how='left')
-    df_result = df_result.merge(dragons_red, on='Address', how='left')
-    df_result = df_result.merge(barons_blue, on='Address', how='left')
-    df_result = df_result.merge(barons_red, on='Address', how='left')
-    
-    # Llenar NaN con 0
-    df_result['blue_dragons'] = df_result['blue_dragons'].fillna(0)
-    df_result['red_dragons'] = df_result['red_dragons'].fillna(0)
-    df_result['blue_barons'] = df_result['blue_barons'].fillna(0)
-    df_result['red_barons'] = df_result['red_barons'].fillna(0)
-    
-    # Features de diferencia
-    df_result['dragon_diff'] = df_result['blue_dragons'] - df_result['red_dragons']
-    df_result['baron_diff'] = df_result['blue_barons'] - df_result['red_barons']
-    
-    logger.info(f"✓ Features de objetivos agregados")
-    
-    return df_result
+    keys, codes, times, features = _encode_events(
+        {'kills': df_kills, 'monsters': df_monsters, 'structures': df_structures}
+    )
+    df_events = _event_counts(keys, codes, features)
+    if time_windows:
+        windows = windowed_event_features(keys, codes, times, features, _event_diffs(), time_windows, GAME_KEY)
+        df_events = df_events.merge(windows, on=GAME_KEY, how='left')
+    df_events = df_events.merge(_gold_at_minutes(df_gold, gold_minutes), on=GAME_KEY, how='outer')
+    timeline_config = parameters.get('gold_timeline') or {}
+    if timeline_config.get('enabled', True):
+        df_events = df_events.merge(gold_timeline_features(df_gold, timeline_config), on=GAME_KEY, how='outer')
+    
+    logger.info(f"✓ Features de eventos agregados: {len(df_events)} partidas, "
+                f"{df_events.shape[1] - 1} features")
+    
+    return df_events
 
 
-def aggregate_structures_features(
-    df_features: pd.DataFrame,
-    df_structures: pd.DataFrame
-) -> pd.DataFrame:
+def plan_feature_store_update(
+    store_index: pd.DataFrame,
+    df_matches: pd.DataFrame,
+    game_keys: pd.DataFrame,
+    df_kills: pd.DataFrame,
+    df_monsters: pd.DataFrame,
+    df_structures: pd.DataFrame,
+    df_gold: pd.DataFrame,
+    parameters: Optional[Dict] = None
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
-    Agrega features de estructuras (torres e inhibidores).
+    Partidas de matchinfo que el feature store no tiene al día.
+    
+    Las features de una partida terminada no cambian, así que solo se calculan
+    las partidas que faltan en el store, las guardadas con otra definición de
+    features (``feature_definition``) y aquellas cuyos datos de entrada
+    cambiaron: cada partida se guarda con un hash de su contenido en matchinfo
+    y en las tablas parseadas (``input_hash``), que se compara en cada
+    ejecución. Las partidas guardadas que ya no están en matchinfo se
+    eliminan del store. La ejecución semanal calcula features de las partidas
+    nuevas, no del histórico.
     
     Args:
-        df_features: DataFrame con features actuales
+        store_index: ``game_key``, ``feature_definition`` e ``input_hash`` del
+            feature store
+        df_matches: DataFrame con información de partidas
+        game_keys: Tabla ``address → game_key``
+        df_kills: DataFrame con información de kills
+        df_monsters: DataFrame con información de monstruos
         df_structures: DataFrame con información de estructuras
+        df_gold: DataFrame con información de oro
+        parameters: Parámetros ``feature_engineering``
         
     Returns:
-        DataFrame con features de estructuras agregados
+        Tupla con (filas de matchinfo a calcular, con ``game_key`` en lugar de
+        ``Address`` y su ``input_hash``; plan con la ``definition`` vigente y
+        las claves a eliminar en ``evict``)
     """
-    logger.info("Agregando features de estructuras (torres/inhibidores)...")
-    
-    # Torres destruidas por equipo
-    towers_blue = df_structures[df_structures['Team'] == 'bTowers'].groupby('Address').size().reset_index(name='blue_towers')
-    towers_red = df_structures[df_structures['Team'] == 'rTowers'].groupby('Address').size().reset_index(name='red_towers')
-    
-    # Inhibidores
-    inhibs_blue = df_structures[df_structures['Team'] == 'bInhibs'].groupby('Address').size().reset_index(name='blue_inhibs')
-    inhibs_red = df_structures[df_structures['Team'] == 'rInhibs'].groupby('Address').size().reset_index(name='red_inhibs')
-    
-    # Merge
-    df_result = df_features.copy()
-    df_result = df_result.merge(towers_blue, on='Address', how='left')
-    df_result = df_result.merge(towers_red, on='Address', how='left')
-    df_result = df_result.merge(inhibs_blue, on='Address', how='left')
-    df_result = df_result.merge(inhibs_red, on='Address', how='left')
-    
-    # Llenar NaN con 0
-    df_result['blue_towers'] = df_result['blue_towers'].fillna(0)
-    df_result['red_towers'] = df_result['red_towers'].fillna(0)
-    df_result['blue_inhibs'] = df_result['blue_inhibs'].fillna(0)
-    df_result['red_inhibs'] = df_result['red_inhibs'].fillna(0)
-    
-    # Features de diferencia
-    df_result['tower_diff'] = df_result['blue_towers'] - df_result['red_towers']
-    df_result['inhib_diff'] = df_result['blue_inhibs'] - df_result['red_inhibs']
-    
-    logger.info(f"✓ Features de estructuras agregados")
-    
-    return df_result
+    definition = feature_definition(parameters, list(df_matches.columns))
+    df_games = encode_game_keys(df_matches, game_keys, column='Address', dataset_name='matchinfo')
+    
+    duplicated = df_games[GAME_KEY].duplicated(keep='last')
+    if duplicated.any():
+        logger.warning(f"matchinfo: {int(duplicated.sum())} partidas repetidas (se usa la última fila)")
+        df_games = df_games[~duplicated]
+    
+    keys = df_games[GAME_KEY].to_numpy()
+    input_hashes = game_content_hashes(keys, df_games, df_kills, df_monsters, df_structures, df_gold)
+    
+    current = store_index[store_index['feature_definition'].to_numpy() == definition]
+    stored_keys = current[GAME_KEY].to_numpy(dtype=np.int64)
+    stored_hashes = current['input_hash'].to_numpy()
+    positions = pd.Index(stored_keys).get_indexer(keys)
+    found = positions >= 0
+    up_to_date = found.copy()
+    up_to_date[found] = stored_hashes[positions[found]] == input_hashes[found]
+    
+    df_pending = df_games[~up_to_date].assign(input_hash=input_hashes[~up_to_date])
+    evict = np.setdiff1d(stored_keys, keys)
+    
+    outdated = len(store_index) - len(current)
+    if outdated:
+        logger.info(f"La definición de features cambió: {outdated} partidas del feature store se recalculan")
+    changed = int((found & ~up_to_date).sum())
+    if changed:
+        logger.info(f"{changed} partidas guardadas cambiaron en los datos de entrada: se recalculan")
+    if len(evict):
+        logger.info(f"{len(evict)} partidas del feature store ya no están en matchinfo: se eliminan")
+    logger.info(f"✓ Feature store: {len(df_pending)} partidas por calcular, "
+                f"{int(up_to_date.sum())} al día")
+    
+    return df_pending, {'definition': definition, 'evict': evict}
 
 
-def aggregate_gold_features(
-    df_features: pd.DataFrame,
-    df_gold: pd.DataFrame
-) -> pd.DataFrame:
+def merge_match_features(
+    df_games: pd.DataFrame,
+    df_events: pd.DataFrame,
+    plan: Dict[str, Any]
+) -> Dict[str, Any]:
     """
-    Agrega features de diferencia de oro en momentos clave.
+    Une las features de eventos a las partidas con un solo merge.
+    
+    Los conteos de partidas sin eventos quedan en 0. Las features de oro
+    faltantes (``gold_*``) quedan como NaN: su imputación usa la mediana de
+    todas las partidas y se hace al leer el feature store (``select_features``),
+    no en cada partición.
     
     Args:
-        df_features: DataFrame con features actuales
-        df_gold: DataFrame con información de oro
+        df_games: Partidas a guardar (``plan_feature_store_update``)
+        df_events: Features por partida (``aggregate_event_features``)
+        plan: Plan de la actualización (``plan_feature_store_update``)
         
     Returns:
-        DataFrame con features de oro agregados
+        Actualización del feature store: ``definition``, ``features`` y
+        claves a eliminar (``evict``)
     """
-    logger.info("Agregando features de diferencia de oro...")
+    logger.info("Uniendo features de eventos a las partidas...")
     
-    # Obtener diferencia de gold en minutos específicos
-    df_gold_features = df_gold[df_gold['Type'] == 'golddiff'].copy()
+    df_result = df_games.merge(df_events, on=GAME_KEY, how='left')
     
-    # Extraer gold difference en minutos 10, 15, 20
-    gold_stats = []
-    for address in df_gold_features['Address'].unique():
-        match_gold = df_gold_features[df_gold_features['Address'] == address]
-        
-        gold_10 = match_gold['min_10'].values[0] if len(match_gold) > 0 else np.nan
-        gold_15 = match_gold['min_15'].values[0] if len(match_gold) > 0 else np.nan
-        gold_20 = match_gold['min_20'].values[0] if len(match_gold) > 0 else np.nan
-        
-        gold_stats.append({
-            'Address': address,
-            'gold_diff_10': gold_10,
-            'gold_diff_15': gold_15,
-            'gold_diff_20': gold_20
-        })
-    
-    df_gold_agg = pd.DataFrame(gold_stats)
+    # Llenar conteos con 0
+    count_cols = [col for col in df_events.columns if not col.startswith('gold_') and col != GAME_KEY]
+    df_result[count_cols] = df_result[count_cols].fillna(0)
     
-    # Merge con features
-    df_result = df_features.merge(df_gold_agg, on='Address', how='left')
+    logger.info(f"✓ Features unidos: {df_result.shape}")
     
-    # Imputar con mediana
-    df_result['gold_diff_10'] = df_result['gold_diff_10'].fillna(df_result['gold_diff_10'].median())
-    df_result['gold_diff_15'] = df_result['gold_diff_15'].fillna(df_result['gold_diff_15'].median())
-    df_result['gold_diff_20'] = df_result['gold_diff_20'].fillna(df_result['gold_diff_20'].median())
-    
-    logger.info(f"✓ Features de oro agregados")
-    
-    return df_result
+    return {'definition': plan['definition'], 'features': df_result, 'evict': plan['evict']}
 
 
 def select_features(
@@ -197,20 +321,33 @@ def select_features(
     """
     Selecciona features finales para modelado.
     
+    Las filas se ordenan por ``game_key``, de modo que la tabla no depende de
+    en qué partición del feature store quedó cada partida, y las features de
+    oro faltantes se imputan con la mediana de todas las partidas. Se
+    conservan también las columnas de ``split.time_columns`` (año y temporada)
+    para la división temporal.
+    
     Args:
-        df_features: DataFrame con todas las features
+        df_features: Feature store (todas las features por partida)
         parameters: Diccionario con configuración
         
     Returns:
-        DataFrame con features seleccionados y targets
+        DataFrame con features seleccionados, targets y columnas de tiempo
     """
     logger.info("Seleccionando features finales...")
     
     feature_cols = parameters['feature_columns']
     target_cols = parameters['target_columns']
+    time_cols = [col for col in split_config(parameters)['time_columns']
+                 if col in df_features.columns and col not in feature_cols + target_cols]
     
     # Seleccionar columnas
-    df_model = df_features[feature_cols + target_cols].copy()
+    df_model = df_features.sort_values(GAME_KEY, kind='stable')[feature_cols + target_cols + time_cols]
+    df_model = df_model.reset_index(drop=True)
+    
+    # Imputar oro con mediana
+    gold_cols = [col for col in feature_cols if col.startswith('gold_')]
+    df_model[gold_cols] = df_model[gold_cols].fillna(df_model[gold_cols].median())
     
     logger.info(f"✓ Features seleccionados: {len(feature_cols)}")
     logger.info(f"✓ Tamaño del dataset: {df_model.shape}")
@@ -221,54 +358,58 @@ def select_features(
 def split_data(
     df_model: pd.DataFrame,
     parameters: Dict
-) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series, pd.Series, pd.Series]:
+) -> Dict[str, np.ndarray]:
     """
-    Divide datos en train/test para regresión y clasificación.
+    Divide datos en train/test como índices de fila.
+    
+    Una sola mezcla sirve para regresión y clasificación; las features y los
+    targets de cada conjunto se derivan de los índices
+    (``scale_features`` y ``splits.split_targets``), sin copias intermedias.
     
     Args:
         df_model: DataFrame con features y targets
-        parameters: Diccionario con configuración
+        parameters: Diccionario con configuración (``test_size``,
+            ``random_state`` y ``split``: ``mode`` random / stratified /
+            temporal)
         
     Returns:
-        Tupla con (X_train, X_test, y_reg_train, y_reg_test, y_cls_train, y_cls_test)
+        Diccionario ``{'train': índices, 'test': índices}``
     """
-    from sklearn.model_selection import train_test_split
-    
-    logger.info("Dividiendo datos en train/test...")
-    
-    feature_cols = parameters['feature_columns']
-    test_size = parameters['test_size']
-    random_state = parameters['random_state']
-    
-    X = df_model[feature_cols].copy()
-    y_regression = df_model['gamelength'].copy()
-    y_classification = df_model['bResult'].copy()
-    
-    # División train/test
-    X_train, X_test, y_reg_train, y_reg_test = train_test_split(
-        X, y_regression, test_size=test_size, random_state=random_state
-    )
-    
-    _, _, y_cls_train, y_cls_test = train_test_split(
-        X, y_classification, test_size=test_size, random_state=random_state
+    config = split_config(parameters)
+    logger.info(f"Dividiendo datos en train/test (modo {config['mode']})...")
+    
+    indices = split_indices(
+        df_model,
+        test_size=parameters['test_size'],
+        random_state=parameters['random_state'],
+        mode=config['mode'],
+        stratify_column=config['stratify_column'],
+        time_columns=config['time_columns'],
+        season_order=config['season_order'],
     )
     
-    logger.info(f"✓ Train set: {len(X_train)} muestras ({len(X_train)/len(X)*100:.1f}%)")
-    logger.info(f"✓ Test set: {len(X_test)} muestras ({len(X_test)/len(X)*100:.1f}%)")
+    n_train, n_test = len(indices['train']), len(indices['test'])
+    logger.info(f"✓ Train set: {n_train} muestras ({n_train/len(df_model)*100:.1f}%)")
+    logger.info(f"✓ Test set: {n_test} muestras ({n_test/len(df_model)*100:.1f}%)")
     
-    return X_train, X_test, y_reg_train, y_reg_test, y_cls_train, y_cls_test
+    return indices
 
 
 def scale_features(
-    X_train: pd.DataFrame,
-    X_test: pd.DataFrame
+    df_model: pd.DataFrame,
+    indices: Dict[str, np.ndarray],
+    parameters: Dict
 ) -> Tuple[pd.DataFrame, pd.DataFrame, object]:
     """
     Estandariza features usando StandardScaler.
     
+    La matriz de features se extrae una vez y cada conjunto se toma por sus
+    índices; el scaler se ajusta solo con train.
+    
     Args:
-        X_train: Features de entrenamiento
-        X_test: Features de test
+        df_model: DataFrame con features y targets
+        indices: Índices de train y test (``split_data``)
+        parameters: Diccionario con configuración
         
     Returns:
         Tupla con (X_train_scaled, X_test_scaled, scaler)
@@ -277,13 +418,17 @@ def scale_features(
     
     logger.info("Estandarizando features con StandardScaler...")
     
+    feature_cols = parameters['feature_columns']
+    X = df_model[feature_cols].to_numpy(dtype=np.float64)
+    train, test = indices['train'], indices['test']
+    
     scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_test_scaled = scaler.transform(X_test)
+    X_train_scaled = scaler.fit_transform(X[train])
+    X_test_scaled = scaler.transform(X[test])
     
     # Convertir de vuelta a DataFrame
-    X_train_scaled = pd.DataFrame(X_train_scaled, columns=X_train.columns, index=X_train.index)
-    X_test_scaled = pd.DataFrame(X_test_scaled, columns=X_test.columns, index=X_test.index)
+    X_train_scaled = pd.DataFrame(X_train_scaled, columns=feature_cols, index=df_model.index[train])
+    X_test_scaled = pd.DataFrame(X_test_scaled, columns=feature_cols, index=df_model.index[test])
     
     logger.info(f"✓ Estandarización completada")
     logger.info(f"   Media después: {X_train_scaled.mean().mean():.6f}")
@@ -4,10 +4,9 @@ Pipeline de procesamiento de datos.
 
 from kedro.pipeline import Pipeline, node, pipeline
 from .nodes import (
-    aggregate_kills_features,
-    aggregate_monsters_features,
-    aggregate_structures_features,
-    aggregate_gold_features,
+    plan_feature_store_update,
+    aggregate_event_features,
+    merge_match_features,
     select_features,
     split_data,
     scale_features,
@@ -18,50 +17,69 @@ def create_pipeline(**kwargs) -> Pipeline:
     """
     Crea el pipeline de procesamiento de datos.
     
+    Las features por partida se guardan en un feature store (Parquet
+    particionado con manifiesto): cada ejecución calcula solo las partidas
+    que faltan en el store, que se guardaron con otra definición de features
+    o cuyos datos de entrada cambiaron, agrega sus features de eventos en una
+    sola etapa (``match_event_features``, en memoria salvo que se declare en
+    el catálogo), las une a matchinfo con un solo merge y las agrega como una
+    partición nueva. ``model_input_table`` se selecciona desde el store y la
+    división train/test se guarda como índices de fila (``split_indices``).
+    
     Returns:
         Pipeline de Kedro con todos los nodos de procesamiento
     """
     return pipeline(
         [
             node(
-                func=aggregate_kills_features,
-                inputs=["matchinfo", "kills"],
-                outputs="features_with_kills",
-                name="aggregate_kills_node",
-            ),
-            node(
-                func=aggregate_monsters_features,
-                inputs=["features_with_kills", "monsters"],
-                outputs="features_with_monsters",
-                name="aggregate_monsters_node",
+                func=plan_feature_store_update,
+                inputs=[
+                    "feature_store_previous",
+                    "matchinfo",
+                    "game_keys",
+                    "parsed_kills",
+                    "parsed_monsters",
+                    "parsed_structures",
+                    "parsed_gold",
+                    "params:feature_engineering",
+                ],
+                outputs=["feature_store_pending", "feature_store_plan"],
+                name="plan_feature_store_update_node",
             ),
             node(
-                func=aggregate_structures_features,
-                inputs=["features_with_monsters", "structures"],
-                outputs="features_with_structures",
-                name="aggregate_structures_node",
+                func=aggregate_event_features,
+                inputs=[
+                    "parsed_kills",
+                    "parsed_monsters",
+                    "parsed_structures",
+                    "parsed_gold",
+                    "params:feature_engineering",
+                    "feature_store_pending",
+                ],
+                outputs="match_event_features",
+                name="aggregate_event_features_node",
             ),
             node(
-                func=aggregate_gold_features,
-                inputs=["features_with_structures", "gold"],
-                outputs="features_complete",
-                name="aggregate_gold_node",
+                func=merge_match_features,
+                inputs=["feature_store_pending", "match_event_features", "feature_store_plan"],
+                outputs="feature_store",
+                name="merge_match_features_node",
             ),
             node(
                 func=select_features,
-                inputs=["features_complete", "params:model_options"],
+                inputs=["feature_store", "params:model_options"],
                 outputs="model_input_table",
                 name="select_features_node",
             ),
             node(
                 func=split_data,
                 inputs=["model_input_table", "params:model_options"],
-                outputs=["X_train", "X_test", "y_reg_train", "y_reg_test", "y_cls_train", "y_cls_test"],
+                outputs="split_indices",
                 name="split_data_node",
             ),
             node(
                 func=scale_features,
-                inputs=["X_train", "X_test"],
+                inputs=["model_input_table", "split_indices", "params:model_options"],
                 outputs=["X_train_scaled", "X_test_scaled", "scaler"],
                 name="scale_features_node",
             ),
@@ -0,0 +1,178 @@
+"""
+Features de la Serie de Oro Completa
+
+``parsed_gold`` guarda el oro minuto a minuto (``min_1`` … ``min_N``) de
+``golddiff``, ``goldblue``, ``goldred`` y cada posición, pero solo tres
+minutos llegaban a ``features_complete``. Este módulo carga cada serie en una
+matriz contigua float32 (partidas × minutos) y calcula con reducciones
+vectorizadas de NumPy:
+
+    - ``gold_slope``: pendiente (mínimos cuadrados) de ``golddiff`` por minuto
+    - ``gold_max_lead_blue`` / ``gold_max_lead_red`` y su minuto
+      (``*_minute``): mayor ventaja de cada lado y cuándo la alcanzó
+    - ``gold_auc``: área bajo la curva de ``golddiff`` (regla del trapecio,
+      oro·minuto; positiva = ventaja azul acumulada)
+    - ``gold_lead_changes``: veces que cambia el lado que lidera (los
+      empates no cuentan como cambio)
+    - ``gold_timeline_minutes``: minutos con dato
+    - ``gold_share_<lado>_<posición>``: oro de la posición sobre el del
+      equipo en el último minuto
+
+Las partidas más cortas traen NaN al final de la serie: cada reducción usa la
+máscara de minutos con dato, y el "último minuto" es el último con dato de
+cada partida. Con ``horizon`` solo se usan los primeros minutos, para
+features disponibles durante la partida.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from league_project.game_keys import GAME_KEY
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_GOLD_TIMELINE = {
+    'enabled': True,
+    'horizon': None,
+}
+
+POSITIONS = ['Top', 'Jungle', 'Middle', 'ADC', 'Support']
+
+
+def gold_matrix(
+    df_gold: pd.DataFrame,
+    series_type: str,
+    game_keys: np.ndarray,
+    horizon: Optional[int] = None
+) -> np.ndarray:
+    """
+    Serie ``series_type`` como matriz float32 contigua (una fila por partida
+    de ``game_keys``, en ese orden; NaN si la partida no tiene la serie).
+    """
+    minute_cols = [col for col in df_gold.columns if col.startswith('min_')]
+    minute_cols = sorted(minute_cols, key=lambda col: int(col[4:]))[:horizon]
+
+    series = df_gold.loc[df_gold['Type'] == series_type].drop_duplicates(GAME_KEY)
+    values = series[minute_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+
+    matrix = np.full((len(game_keys), len(minute_cols)), np.nan, dtype=np.float32)
+    positions = pd.Index(series[GAME_KEY].to_numpy()).get_indexer(game_keys)
+    found = positions >= 0
+    matrix[found] = values[positions[found]]
+    return matrix
+
+
+def _last_valid(valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Índice del último minuto con dato de cada fila y si la fila tiene alguno."""
+    has_data = valid.any(axis=1)
+    last = valid.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+    return np.where(has_data, last, 0), has_data
+
+
+def _lead_changes(diff: np.ndarray) -> np.ndarray:
+    """Cambios de signo de la ventaja por fila, arrastrando el último líder en los empates."""
+    sign = np.sign(diff)
+    known = np.isfinite(sign) & (sign != 0)
+    rows = np.arange(len(diff))[:, None]
+    # Índice del último minuto con líder (no empate ni NaN) hasta cada minuto
+    carried = np.maximum.accumulate(np.where(known, np.arange(diff.shape[1]), 0), axis=1)
+    leader = np.where(known[rows, carried], sign[rows, carried], 0)
+    return (leader[:, 1:] * leader[:, :-1] < 0).sum(axis=1)
+
+
+def _diff_features(diff: np.ndarray) -> Dict[str, np.ndarray]:
+    """Pendiente, máximas ventajas, área y cambios de líder de ``golddiff``."""
+    valid = ~np.isnan(diff)
+    n = valid.sum(axis=1)
+    minutes = np.arange(1, diff.shape[1] + 1, dtype=np.float64)
+    values = np.where(valid, diff, 0).astype(np.float64)
+
+    # Mínimos cuadrados con la máscara de minutos con dato
+    sx = valid @ minutes
+    sxx = valid @ minutes ** 2
+    sy = values.sum(axis=1)
+    sxy = values @ minutes
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(n >= 2, (n * sxy - sx * sy) / (n * sxx - sx ** 2), np.nan)
+
+    has_data = n > 0
+    blue_lead = np.where(valid, diff, -np.inf)
+    red_lead = np.where(valid, -diff, -np.inf)
+    blue_at = np.argmax(blue_lead, axis=1)
+    red_at = np.argmax(red_lead, axis=1)
+    rows = np.arange(len(diff))
+
+    # Trapecio entre minutos consecutivos con dato
+    segments = valid[:, 1:] & valid[:, :-1]
+    auc = np.where(segments, (values[:, 1:] + values[:, :-1]) / 2, 0).sum(axis=1)
+
+    return {
+        'gold_slope': slope,
+        'gold_max_lead_blue': np.where(has_data, blue_lead[rows, blue_at], np.nan),
+        'gold_max_lead_blue_minute': np.where(has_data, blue_at + 1, np.nan),
+        'gold_max_lead_red': np.where(has_data, red_lead[rows, red_at], np.nan),
+        'gold_max_lead_red_minute': np.where(has_data, red_at + 1, np.nan),
+        'gold_auc': np.where(has_data, auc, np.nan),
+        'gold_lead_changes': np.where(has_data, _lead_changes(diff), np.nan),
+        'gold_timeline_minutes': n,
+    }
+
+
+def _share_features(df_gold: pd.DataFrame, game_keys: np.ndarray, horizon: Optional[int]) -> Dict[str, np.ndarray]:
+    """Oro de cada posición sobre el del equipo en el último minuto con dato."""
+    features = {}
+    rows = np.arange(len(game_keys))
+    types = set(df_gold['Type'].unique())
+    for side in ['blue', 'red']:
+        position_types = [f'gold{side}{position}' for position in POSITIONS]
+        if not any(series in types for series in position_types):
+            continue
+
+        final = {}
+        for series in [f'gold{side}'] + position_types:
+            matrix = gold_matrix(df_gold, series, game_keys, horizon)
+            if matrix.shape[1] == 0:
+                final[series] = np.full(len(game_keys), np.nan)
+                continue
+            last, has_data = _last_valid(~np.isnan(matrix))
+            final[series] = np.where(has_data, matrix[rows, last], np.nan).astype(np.float64)
+
+        total = final[f'gold{side}']
+        total = np.where(np.isnan(total), np.sum([final[series] for series in position_types], axis=0), total)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for position, series in zip(POSITIONS, position_types):
+                features[f'gold_share_{side}_{position.lower()}'] = np.where(total > 0, final[series] / total, np.nan)
+    return features
+
+
+def gold_timeline_features(df_gold: pd.DataFrame, config: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Features de la serie de oro completa por partida.
+
+    Args:
+        df_gold: Series de oro parseadas (``game_key``, ``Type``, ``min_1``..``min_N``)
+        config: Configuración ``feature_engineering.gold_timeline``
+            (``enabled``, ``horizon`` en minutos o ``None``)
+
+    Returns:
+        DataFrame con una fila por partida con serie ``golddiff``
+    """
+    config = {**DEFAULT_GOLD_TIMELINE, **(config or {})}
+    horizon = config['horizon']
+
+    game_keys = np.sort(df_gold.loc[df_gold['Type'] == 'golddiff', GAME_KEY].unique())
+    diff = gold_matrix(df_gold, 'golddiff', game_keys, horizon)
+
+    features = pd.DataFrame({GAME_KEY: game_keys})
+    for name, values in {**_diff_features(diff), **_share_features(df_gold, game_keys, horizon)}.items():
+        features[name] = values
+
+    logger.info(f"Features de la serie de oro: {features.shape[1] - 1} columnas, "
+                f"matriz {diff.shape[0]}×{diff.shape[1]} float32"
+                + (f" (horizonte {horizon} min)" if horizon else ""))
+
+    return features
@@ -0,0 +1,115 @@
+"""
+Motor de Features por Ventana de Tiempo
+
+Los conteos de eventos sobre toda la partida incluyen lo que pasa hasta el
+final, así que filtran el resultado. Para modelos de probabilidad de victoria
+durante la partida, este motor calcula los mismos conteos por lado, sus
+diferencias y qué lado consiguió el primer evento de cada tipo, hasta cada
+minuto de corte (``feature_engineering.time_windows``).
+
+Todos los cortes salen de una sola pasada:
+
+    1. Los eventos se ordenan una vez por (partida, feature, tiempo)
+    2. Cada grupo (partida, feature) ocupa un tramo contiguo del arreglo; con
+       el tiempo desplazado por grupo (``grupo · span + tiempo``) el arreglo
+       completo queda ordenado
+    3. El conteo de un grupo hasta el minuto ``c`` es la posición de
+       ``grupo · span + c`` (``searchsorted``) menos el inicio del grupo; una
+       sola búsqueda resuelve todos los grupos y todos los cortes
+    4. El primer evento de cada grupo es el primer elemento de su tramo
+
+Columnas por corte ``c`` (en minutos): ``<feature>_<c>`` (conteos por lado),
+``<diff>_<c>`` (azul - rojo) y ``first_<evento>_<c>`` (1 si el lado azul
+consiguió el primero, -1 si fue el rojo, 0 si aún no hubo).
+"""
+
+import logging
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _cutoff_label(cutoff: float) -> str:
+    """Sufijo de columna del corte (``10``, ``7.5``)."""
+    return f'{cutoff:g}'
+
+
+def windowed_event_features(
+    game_keys: np.ndarray,
+    codes: np.ndarray,
+    times: np.ndarray,
+    features: List[str],
+    diffs: Dict[str, Tuple[str, str]],
+    cutoffs: Sequence[float],
+    key_name: str = 'game_key'
+) -> pd.DataFrame:
+    """
+    Conteos, diferencias y primer evento por partida hasta cada corte.
+
+    Args:
+        game_keys: Partida de cada evento
+        codes: Índice en ``features`` de cada evento
+        times: Minuto de cada evento (los NaN no entran en ninguna ventana)
+        features: Nombres de las features de conteo (por lado)
+        diffs: Diferencia → (feature azul, feature roja)
+        cutoffs: Minutos de corte
+        key_name: Nombre de la columna de partida
+
+    Returns:
+        DataFrame con una fila por partida con eventos con tiempo
+    """
+    cutoffs = np.asarray(sorted(set(cutoffs)), dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64)
+    valid = ~np.isnan(times)
+
+    game_index, keys = pd.factorize(np.asarray(game_keys)[valid], sort=True)
+    n_games, n_features = len(keys), len(features)
+    n_groups = n_games * n_features
+
+    # Orden único por (partida, feature, tiempo)
+    group = game_index.astype(np.int64) * n_features + np.asarray(codes)[valid]
+    minutes = times[valid]
+    order = np.lexsort((minutes, group))
+    group, minutes = group[order], minutes[order]
+
+    origin = minutes.min() if len(minutes) else 0.0
+    span = (minutes.max() - origin + 1) if len(minutes) else 1.0
+    shifted = group * span + (minutes - origin)
+
+    groups = np.arange(n_groups)
+    starts = np.searchsorted(group, groups, side='left')
+    ends = np.searchsorted(group, groups, side='right')
+
+    # Todos los cortes de todos los grupos en una búsqueda; un corte antes del
+    # primer evento cae justo antes del tramo del grupo
+    offsets = np.clip(cutoffs - origin, -0.5, span - 1)
+    positions = np.searchsorted(shifted, (groups[:, None] * span + offsets[None, :]).ravel(), side='right')
+    counts = (positions.reshape(n_groups, len(cutoffs)) - starts[:, None]).reshape(n_games, n_features, len(cutoffs))
+
+    first = np.full(n_groups, np.inf)
+    observed = ends > starts
+    first[observed] = minutes[starts[observed]]
+    first = first.reshape(n_games, n_features)
+
+    columns = {key_name: keys}
+    index = {feature: i for i, feature in enumerate(features)}
+    for j, cutoff in enumerate(cutoffs):
+        label = _cutoff_label(cutoff)
+        for i, feature in enumerate(features):
+            columns[f'{feature}_{label}'] = counts[:, i, j]
+        for diff, (blue, red) in diffs.items():
+            columns[f'{diff}_{label}'] = counts[:, index[blue], j] - counts[:, index[red], j]
+        for diff, (blue, red) in diffs.items():
+            blue_first, red_first = first[:, index[blue]], first[:, index[red]]
+            columns[f"first_{diff.removesuffix('_diff')}_{label}"] = np.select(
+                [(blue_first <= cutoff) & (blue_first < red_first), (red_first <= cutoff) & (red_first < blue_first)],
+                [1, -1],
+                0
+            ).astype(np.int8)
+
+    logger.info(f"Features por ventana: {len(cutoffs)} cortes, {len(columns) - 1} columnas, {n_games} partidas")
+
+    return pd.DataFrame(columns)
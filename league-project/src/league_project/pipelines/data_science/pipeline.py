@@ -3,6 +3,8 @@ Pipeline de data science.
 """
 
 from kedro.pipeline import Pipeline, node, pipeline
+
+from league_project.splits import split_targets
 from .nodes import (
     train_regression_models,
     train_classification_models,
@@ -15,11 +17,22 @@ def create_pipeline(**kwargs) -> Pipeline:
     """
     Crea el pipeline de data science.
     
+    Los targets de train y test se derivan de ``model_input_table`` y
+    ``split_indices``. El mismo nodo está en el pipeline de evaluación, así
+    cada uno se ejecuta por separado; combinados, Kedro lo ejecuta una vez.
+    
     Returns:
         Pipeline de Kedro con entrenamiento de modelos
     """
     return pipeline(
         [
+            # Targets de train y test
+            node(
+                func=split_targets,
+                inputs=["model_input_table", "split_indices"],
+                outputs=["y_reg_train", "y_reg_test", "y_cls_train", "y_cls_test"],
+                name="split_targets_node",
+            ),
             # Regresión
             node(
                 func=train_regression_models,
@@ -3,6 +3,8 @@ Pipeline de evaluación.
 """
 
 from kedro.pipeline import Pipeline, node, pipeline
+
+from league_project.splits import split_targets
 from .nodes import (
     evaluate_regression_models,
     evaluate_classification_models,
@@ -16,11 +18,22 @@ def create_pipeline(**kwargs) -> Pipeline:
     """
     Crea el pipeline de evaluación.
     
+    Los targets de train y test se derivan de ``model_input_table`` y
+    ``split_indices``. El mismo nodo está en el pipeline de data science, así
+    cada uno se ejecuta por separado; combinados, Kedro lo ejecuta una vez.
+    
     Returns:
         Pipeline de Kedro con evaluación de modelos
     """
     return pipeline(
         [
+            # Targets de train y test
+            node(
+                func=split_targets,
+                inputs=["model_input_table", "split_indices"],
+                outputs=["y_reg_train", "y_reg_test", "y_cls_train", "y_cls_test"],
+                name="split_targets_node",
+            ),
             # Evaluación de Regresión
             node(
                 func=evaluate_regression_models,
@@ -0,0 +1,11 @@
+"""
+Pipeline de Parseo de Eventos (Event Parsing)
+
+Convierte las columnas codificadas como listas de Python en LeagueofLegends.csv
+(kills, torres, dragones, oro por minuto) en tablas columnares de eventos y
+matrices de oro por minuto que alimentan al pipeline de data_processing.
+"""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
@@ -0,0 +1,340 @@
+"""
+Nodos del Pipeline de Parseo de Eventos
+
+LeagueofLegends.csv guarda los eventos de cada partida como listas de Python
+serializadas en texto (ver data/01_raw/_columns.csv), por ejemplo::
+
+    bKills:   [[10.82, 'C9 Hai', 'TSM Bjergsen', ['TSM Santorin'], 9229, 8469], ...]
+    bTowers:  [[27.542, 'MID_LANE', 'BASE_TURRET'], ...]
+    golddiff: [0, 0, -14, -65, ...]
+
+En lugar de evaluar cada celda con ``ast.literal_eval`` (que construye un AST
+por celda), los eventos se extraen con expresiones regulares compiladas
+(``re.findall``) y las series de oro se convierten en una sola operación de
+NumPy sobre todos los valores concatenados.
+
+Las tablas resultantes tienen el mismo formato que kills.csv, monsters.csv,
+structures.csv y gold.csv, salvo que la URL ``Address`` se reemplaza por la
+clave entera ``game_key`` (ver ``league_project.game_keys``).
+"""
+
+import itertools
+import logging
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from league_project.game_keys import GAME_KEY, encode_game_keys
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Gramática de las listas serializadas
+# ============================================================================
+
+_NUM = r"-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?"
+_STR = r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\""
+_VAL = rf"{_NUM}|{_STR}|None"
+
+# [tiempo, víctima, asesino, [asistencias], x, y]
+_KILL_EVENT = re.compile(
+    rf"\[(?P<Time>{_NUM}),\s*(?P<Victim>{_STR}|None),\s*(?P<Killer>{_STR}|None),\s*"
+    rf"\[(?P<assists>(?:(?:{_STR})(?:,\s*)?)*)\],\s*(?P<x_pos>{_VAL}),\s*(?P<y_pos>{_VAL})\]"
+)
+
+# [tiempo] | [tiempo, campo_1] | [tiempo, campo_1, campo_2]
+_OBJECTIVE_EVENT = re.compile(
+    rf"\[(?P<Time>{_NUM})(?:,\s*(?P<field_1>{_STR}|None))?(?:,\s*(?P<field_2>{_STR}|None))?\]"
+)
+
+_QUOTED = re.compile(_STR)
+_ESCAPE = re.compile(r"\\(.)")
+
+MAX_ASSISTS = 4
+
+KILL_COLUMNS = ['bKills', 'rKills']
+
+# Columna → tipo por defecto cuando el evento no trae el tipo
+MONSTER_COLUMNS = {
+    'bDragons': 'DRAGON',
+    'rDragons': 'DRAGON',
+    'bBarons': 'BARON_NASHOR',
+    'rBarons': 'BARON_NASHOR',
+    'bHeralds': 'RIFT_HERALD',
+    'rHeralds': 'RIFT_HERALD',
+}
+
+STRUCTURE_COLUMNS = {
+    'bTowers': None,
+    'rTowers': None,
+    'bInhibs': 'INHIBITOR',
+    'rInhibs': 'INHIBITOR',
+}
+
+GOLD_COLUMNS = [
+    'golddiff', 'goldblue', 'goldred',
+    'goldblueTop', 'goldblueJungle', 'goldblueMiddle', 'goldblueADC', 'goldblueSupport',
+    'goldredTop', 'goldredJungle', 'goldredMiddle', 'goldredADC', 'goldredSupport',
+]
+
+
+# ============================================================================
+# Funciones auxiliares
+# ============================================================================
+
+def _unquote(values: pd.Series) -> pd.Series:
+    """
+    Convierte literales de texto ('x' o "x") a str y 'None' a NaN.
+
+    Los nombres se repiten mucho (jugadores, tipos de torre), así que la
+    conversión se hace sobre los valores únicos y se expande con los códigos.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+
+    decoded = np.empty(len(uniques) + 1, dtype=object)
+    for i, literal in enumerate(uniques):
+        if literal[:1] in ("'", '"'):
+            text = literal[1:-1]
+            decoded[i] = _ESCAPE.sub(r"\1", text) if '\\' in text else text
+        else:
+            decoded[i] = np.nan  # None
+    decoded[-1] = np.nan
+
+    return pd.Series(decoded[codes], index=values.index, name=values.name)
+
+
+def _game_key_array(df: pd.DataFrame, game_keys: pd.DataFrame, dataset_name: str) -> np.ndarray:
+    """Clave entera de partida de cada fila del dataset principal."""
+    encoded = encode_game_keys(df[['Address']], game_keys, column='Address', dataset_name=dataset_name)
+    return encoded[GAME_KEY].to_numpy()
+
+
+def _extract_events(
+    df: pd.DataFrame,
+    keys: np.ndarray,
+    columns: List[str],
+    pattern: re.Pattern
+) -> pd.DataFrame:
+    """
+    Extrae todos los eventos de las columnas indicadas en una tabla larga.
+
+    Cada celda se recorre una sola vez con ``pattern.findall`` (en C) y los
+    eventos de todas las partidas se aplanan en un único DataFrame.
+
+    Returns:
+        DataFrame con ``game_key``, ``Team`` (columna de origen) y los grupos
+        nombrados del patrón, en orden de partida y de evento
+    """
+    group_names = list(pattern.groupindex)
+    frames = []
+
+    for col in columns:
+        if col not in df.columns:
+            logger.warning(f"Columna '{col}' no encontrada, se omite")
+            continue
+
+        found = [pattern.findall(cell) if isinstance(cell, str) else [] for cell in df[col]]
+        counts = np.fromiter(map(len, found), dtype=np.int64, count=len(found))
+
+        events = pd.DataFrame.from_records(
+            list(itertools.chain.from_iterable(found)), columns=group_names
+        )
+        events.insert(0, 'Team', col)
+        events.insert(0, GAME_KEY, np.repeat(keys, counts))
+        frames.append(events)
+
+    if not frames:
+        return pd.DataFrame(columns=[GAME_KEY, 'Team', *group_names])
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def _parse_numeric_lists(series: pd.Series) -> np.ndarray:
+    """
+    Convierte una columna de listas numéricas en una matriz (filas × posiciones).
+
+    Todas las listas se concatenan en un único texto que NumPy convierte de una
+    vez; las listas más cortas quedan rellenas con NaN al final.
+
+    Returns:
+        Matriz float32 de forma (len(series), largo de la lista más larga)
+    """
+    body = series.fillna('[]').str.strip().str.slice(1, -1).str.strip()
+    non_empty = (body.str.len() > 0).to_numpy()
+    lengths = np.where(non_empty, body.str.count(',').to_numpy() + 1, 0)
+
+    max_len = int(lengths.max()) if len(lengths) else 0
+    matrix = np.full((len(series), max_len), np.nan, dtype=np.float32)
+
+    total = int(lengths.sum())
+    if total:
+        values = np.array(','.join(body[non_empty]).split(','), dtype=np.float64)
+        rows = np.repeat(np.arange(len(series)), lengths)
+        starts = np.cumsum(lengths) - lengths
+        cols = np.arange(total) - np.repeat(starts, lengths)
+        matrix[rows, cols] = values
+
+    return matrix
+
+
+def _fill_default_type(
+    types: pd.Series,
+    teams: pd.Series,
+    defaults: Dict[str, Optional[str]]
+) -> pd.Series:
+    """Completa el tipo de evento faltante con el tipo por defecto de la columna."""
+    return types.fillna(teams.map(defaults))
+
+
+# ============================================================================
+# NODO 1: Kills
+# ============================================================================
+
+def parse_kill_events(df: pd.DataFrame, game_keys: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte bKills/rKills en una tabla de kills (formato de kills.csv).
+
+    Args:
+        df: DataFrame raw de LeagueofLegends.csv
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
+
+    Returns:
+        DataFrame con game_key, Team, Time, Victim, Killer, Assist_1..4, x_pos, y_pos
+    """
+    logger.info(f"Parseando kills de {len(df)} partidas")
+
+    keys = _game_key_array(df, game_keys, dataset_name='parsed_kills')
+    events = _extract_events(df, keys, KILL_COLUMNS, _KILL_EVENT)
+
+    kills = events[[GAME_KEY, 'Team']].copy()
+    kills['Time'] = pd.to_numeric(events['Time'], errors='coerce')
+    kills['Victim'] = _unquote(events['Victim'])
+    kills['Killer'] = _unquote(events['Killer'])
+
+    # Asistencias: lista de textos → columnas Assist_1..Assist_4. El
+    # constructor (a diferencia de from_records) acepta una lista vacía con el
+    # índice vacío: sin kills quedan Assist_1..4 como columnas vacías
+    padding = [None] * MAX_ASSISTS
+    assists = pd.DataFrame(
+        [(_QUOTED.findall(cell) + padding)[:MAX_ASSISTS] for cell in events['assists']],
+        columns=[f'Assist_{i + 1}' for i in range(MAX_ASSISTS)],
+        index=events.index,
+    )
+    for col in assists.columns:
+        kills[col] = _unquote(assists[col])
+
+    # Las posiciones pueden venir como texto (p. ej. 'TooEarly') → NaN
+    kills['x_pos'] = pd.to_numeric(events['x_pos'], errors='coerce')
+    kills['y_pos'] = pd.to_numeric(events['y_pos'], errors='coerce')
+
+    logger.info(f"✓ {len(kills)} kills parseados")
+
+    return kills
+
+
+# ============================================================================
+# NODO 2: Objetivos neutrales
+# ============================================================================
+
+def parse_monster_events(df: pd.DataFrame, game_keys: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte dragones, barones y heraldos en una tabla (formato de monsters.csv).
+
+    Args:
+        df: DataFrame raw de LeagueofLegends.csv
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
+
+    Returns:
+        DataFrame con game_key, Team, Time, Type
+    """
+    logger.info(f"Parseando objetivos neutrales de {len(df)} partidas")
+
+    keys = _game_key_array(df, game_keys, dataset_name='parsed_monsters')
+    events = _extract_events(df, keys, list(MONSTER_COLUMNS), _OBJECTIVE_EVENT)
+
+    monsters = events[[GAME_KEY, 'Team']].copy()
+    monsters['Time'] = pd.to_numeric(events['Time'], errors='coerce')
+    monsters['Type'] = _fill_default_type(_unquote(events['field_1']), events['Team'], MONSTER_COLUMNS)
+
+    logger.info(f"✓ {len(monsters)} objetivos parseados")
+
+    return monsters
+
+
+# ============================================================================
+# NODO 3: Estructuras
+# ============================================================================
+
+def parse_structure_events(df: pd.DataFrame, game_keys: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte torres e inhibidores en una tabla (formato de structures.csv).
+
+    Args:
+        df: DataFrame raw de LeagueofLegends.csv
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
+
+    Returns:
+        DataFrame con game_key, Team, Time, Lane, Type
+    """
+    logger.info(f"Parseando estructuras de {len(df)} partidas")
+
+    keys = _game_key_array(df, game_keys, dataset_name='parsed_structures')
+    events = _extract_events(df, keys, list(STRUCTURE_COLUMNS), _OBJECTIVE_EVENT)
+
+    structures = events[[GAME_KEY, 'Team']].copy()
+    structures['Time'] = pd.to_numeric(events['Time'], errors='coerce')
+    structures['Lane'] = _unquote(events['field_1'])
+    structures['Type'] = _fill_default_type(_unquote(events['field_2']), events['Team'], STRUCTURE_COLUMNS)
+
+    logger.info(f"✓ {len(structures)} estructuras parseadas")
+
+    return structures
+
+
+# ============================================================================
+# NODO 4: Series de oro por minuto
+# ============================================================================
+
+def parse_gold_timelines(df: pd.DataFrame, game_keys: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte las series de oro por minuto en una tabla ancha (formato de gold.csv).
+
+    Cada columna de oro se convierte en una matriz float32 (partidas × minutos)
+    rellena con NaN para partidas más cortas.
+
+    Args:
+        df: DataFrame raw de LeagueofLegends.csv
+        game_keys: Tabla ``address → game_key`` (``build_game_keys``)
+
+    Returns:
+        DataFrame con game_key, Type y min_1..min_N
+    """
+    logger.info(f"Parseando series de oro de {len(df)} partidas")
+
+    keys = _game_key_array(df, game_keys, dataset_name='parsed_gold')
+    frames = []
+
+    for col in GOLD_COLUMNS:
+        if col not in df.columns:
+            logger.warning(f"Columna '{col}' no encontrada, se omite")
+            continue
+
+        matrix = _parse_numeric_lists(df[col])
+        minutes = pd.DataFrame(
+            matrix, columns=[f'min_{i + 1}' for i in range(matrix.shape[1])]
+        )
+        minutes.insert(0, 'Type', col)
+        minutes.insert(0, GAME_KEY, keys)
+        frames.append(minutes)
+
+    if not frames:
+        return pd.DataFrame(columns=[GAME_KEY, 'Type'])
+
+    gold = pd.concat(frames, ignore_index=True)
+
+    logger.info(f"✓ {len(frames)} series de oro parseadas ({gold.shape[1] - 2} minutos máx.)")
+
+    return gold
@@ -0,0 +1,62 @@
+"""
+Pipeline de Parseo de Eventos
+
+Extrae las tablas de eventos y las series de oro del dataset principal
+(LeagueofLegends.csv) para alimentar al pipeline de data_processing.
+"""
+
+from kedro.pipeline import Pipeline, node, pipeline
+from .nodes import (
+    parse_kill_events,
+    parse_monster_events,
+    parse_structure_events,
+    parse_gold_timelines,
+)
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    """
+    Crea el pipeline de parseo de eventos.
+    
+    Este pipeline:
+    1. Parsea kills (bKills, rKills)
+    2. Parsea objetivos neutrales (dragones, barones, heraldos)
+    3. Parsea estructuras (torres, inhibidores)
+    4. Parsea series de oro por minuto
+    
+    Returns:
+        Pipeline de Kedro con los nodos de parseo
+    """
+    return pipeline(
+        [
+            node(
+                func=parse_kill_events,
+                inputs=["raw_main_data@events", "game_keys"],
+                outputs="parsed_kills",
+                name="parse_kill_events_node",
+                tags=["parsing", "kills"],
+            ),
+            node(
+                func=parse_monster_events,
+                inputs=["raw_main_data@events", "game_keys"],
+                outputs="parsed_monsters",
+                name="parse_monster_events_node",
+                tags=["parsing", "monsters"],
+            ),
+            node(
+                func=parse_structure_events,
+                inputs=["raw_main_data@events", "game_keys"],
+                outputs="parsed_structures",
+                name="parse_structure_events_node",
+                tags=["parsing", "structures"],
+            ),
+            node(
+                func=parse_gold_timelines,
+                inputs=["raw_main_data@events", "game_keys"],
+                outputs="parsed_gold",
+                name="parse_gold_timelines_node",
+                tags=["parsing", "gold"],
+            ),
+        ],
+        tags=["event_parsing_pipeline"]
+    )
@@ -0,0 +1,107 @@
+"""
+Runners paralelos con memoria acotada.
+
+Los siete nodos ``clean_*`` de ``data_cleaning`` y los siete nodos de
+análisis de ``data_exploration`` no dependen entre sí, así que pueden
+ejecutarse a la vez. Kedro ya trae ``ParallelRunner`` (procesos) y
+``ThreadRunner`` (hilos), pero elige el número de workers solo por núcleos:
+con datasets grandes varios workers pueden agotar la memoria del worker de
+Airflow. Estos runners limitan además los workers simultáneos según un
+presupuesto de memoria::
+
+    kedro run --pipeline data_cleaning --runner league_project.runners.BoundedParallelRunner
+    kedro run --pipeline eda --runner league_project.runners.BoundedThreadRunner
+
+Se configuran con variables de entorno (el CLI de Kedro no acepta argumentos
+para el runner):
+
+    - ``LEAGUE_MAX_WORKERS``: tope de workers (por defecto, núcleos disponibles)
+    - ``LEAGUE_MEMORY_BUDGET_MB``: memoria total para los workers (por
+      defecto, el 75% de la memoria física)
+    - ``LEAGUE_WORKER_MEMORY_MB``: memoria estimada por worker (1024)
+
+Workers = min(nodos paralelizables, ``LEAGUE_MAX_WORKERS``,
+presupuesto // memoria por worker), con un mínimo de 1.
+
+La cota es una estimación estática: el número de workers se fija al
+arrancar con ``LEAGUE_WORKER_MEMORY_MB``, sin medir la memoria que usa cada
+nodo. Un nodo que use más que esa estimación puede superar el presupuesto;
+en ese caso hay que subir ``LEAGUE_WORKER_MEMORY_MB``.
+
+El modo streaming (``--env streaming``) pasa iteradores de chunks entre
+nodos, que no se pueden enviar a otro proceso: con ese entorno se debe usar
+``BoundedThreadRunner``.
+"""
+
+import logging
+import os
+from typing import Optional
+
+from kedro.pipeline import Pipeline
+from kedro.runner import ParallelRunner, ThreadRunner
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_MEMORY_MB = 1024
+DEFAULT_MEMORY_FRACTION = 0.75
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+def _physical_memory_mb() -> Optional[int]:
+    """Memoria física del equipo en MB (``None`` si no se puede determinar)."""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 ** 2)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def memory_bounded_workers(required: int) -> int:
+    """
+    Número de workers que respeta el presupuesto de memoria.
+
+    Args:
+        required: Workers que pediría el runner de Kedro para el pipeline
+
+    Returns:
+        Workers a usar (al menos 1)
+    """
+    worker_mb = _env_int('LEAGUE_WORKER_MEMORY_MB') or DEFAULT_WORKER_MEMORY_MB
+    budget_mb = _env_int('LEAGUE_MEMORY_BUDGET_MB')
+    if budget_mb is None:
+        physical = _physical_memory_mb()
+        budget_mb = int(physical * DEFAULT_MEMORY_FRACTION) if physical else None
+
+    workers = required
+    if budget_mb is not None:
+        workers = min(workers, budget_mb // worker_mb)
+    workers = max(1, workers)
+
+    logger.info(
+        f"Workers en paralelo: {workers} (solicitados por el runner: {required}, "
+        f"presupuesto: {budget_mb} MB, {worker_mb} MB por worker)"
+    )
+    return workers
+
+
+class BoundedParallelRunner(ParallelRunner):
+    """``ParallelRunner`` (procesos) con workers limitados por memoria."""
+
+    def __init__(self, max_workers: Optional[int] = None, is_async: bool = False):
+        super().__init__(max_workers=max_workers or _env_int('LEAGUE_MAX_WORKERS'), is_async=is_async)
+
+    def _get_required_workers_count(self, pipeline: Pipeline) -> int:
+        return memory_bounded_workers(super()._get_required_workers_count(pipeline))
+
+
+class BoundedThreadRunner(ThreadRunner):
+    """``ThreadRunner`` (hilos) con workers limitados por memoria."""
+
+    def __init__(self, max_workers: Optional[int] = None, is_async: bool = False):
+        super().__init__(max_workers=max_workers or _env_int('LEAGUE_MAX_WORKERS'), is_async=is_async)
+
+    def _get_required_workers_count(self, pipeline: Pipeline) -> int:
+        return memory_bounded_workers(super()._get_required_workers_count(pipeline))
@@ -0,0 +1,146 @@
+"""
+División train/test por índices.
+
+La división se guarda como un arreglo de posiciones de fila por conjunto
+(``{'train': ..., 'test': ...}``) sobre ``model_input_table``, no como
+copias de las features y de cada target. Los conjuntos de features y los
+targets se derivan de esos índices donde se necesitan: una sola mezcla para
+todos los targets, y los pipelines de modelado y evaluación usan exactamente
+las mismas filas.
+
+Modos (``model_options.split.mode``):
+
+    - ``random``: mezcla aleatoria (las mismas filas que
+      ``train_test_split`` con el mismo ``random_state``)
+    - ``stratified``: como ``random``, con la proporción de
+      ``stratify_column`` (``bResult``) igual en train y test
+    - ``temporal``: orden cronológico por ``time_columns`` (año y
+      temporada, con ``season_order``); el test son las partidas más recientes
+"""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SPLIT_MODES = ('random', 'stratified', 'temporal')
+
+DEFAULT_SPLIT = {
+    'mode': 'random',
+    'stratify_column': 'bResult',
+    'time_columns': ['Year', 'Season'],
+    'season_order': ['Winter', 'Spring', 'MSI', 'Summer', 'Regional', 'WC'],
+}
+
+
+def split_config(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Configuración ``model_options.split`` con los valores por defecto."""
+    return {**DEFAULT_SPLIT, **(parameters.get('split') or {})}
+
+
+def _season_rank(seasons: pd.Series, season_order: List[str]) -> np.ndarray:
+    """
+    Posición de cada temporada en ``season_order``; una temporada con sufijo
+    (``Spring_Playoffs``) toma la de su prefijo y las desconocidas van al final.
+    """
+    values = seasons.astype(str)
+    rank = np.full(len(values), len(season_order), dtype=np.int64)
+    for position, season in reversed(list(enumerate(season_order))):
+        rank[values.str.startswith(season).to_numpy()] = position
+
+    unknown = sorted(values[rank == len(season_order)].unique())
+    if unknown:
+        logger.warning(f"Temporadas fuera de season_order (se ordenan al final): {unknown}")
+    return rank
+
+
+def chronological_order(df: pd.DataFrame, time_columns: List[str], season_order: List[str]) -> np.ndarray:
+    """Posiciones de las filas en orden cronológico (orden estable en empates)."""
+    keys = []
+    for col in time_columns:
+        if col not in df.columns:
+            raise KeyError(f"La división temporal necesita la columna '{col}' en la tabla de modelado")
+        if col == 'Season':
+            keys.append(_season_rank(df[col], season_order))
+        else:
+            keys.append(df[col].to_numpy())
+    # lexsort ordena por la última clave primero
+    return np.lexsort(keys[::-1])
+
+
+def split_indices(
+    df: pd.DataFrame,
+    test_size: float,
+    random_state: Optional[int] = None,
+    mode: str = 'random',
+    stratify_column: str = 'bResult',
+    time_columns: Optional[List[str]] = None,
+    season_order: Optional[List[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Posiciones de fila de train y test.
+
+    Args:
+        df: Tabla de modelado
+        test_size: Fracción de filas de test
+        random_state: Semilla de los modos ``random`` y ``stratified``
+        mode: ``random``, ``stratified`` o ``temporal``
+        stratify_column: Columna cuya proporción se conserva (``stratified``)
+        time_columns: Columnas que definen el orden cronológico (``temporal``)
+        season_order: Orden de las temporadas dentro del año (``temporal``)
+
+    Returns:
+        Diccionario ``{'train': int64[], 'test': int64[]}``
+    """
+    from sklearn.model_selection import train_test_split
+
+    if mode not in SPLIT_MODES:
+        raise ValueError(f"Modo de división desconocido: '{mode}' (opciones: {', '.join(SPLIT_MODES)})")
+
+    positions = np.arange(len(df), dtype=np.int64)
+    if mode == 'temporal':
+        order = chronological_order(
+            df,
+            time_columns or DEFAULT_SPLIT['time_columns'],
+            season_order or DEFAULT_SPLIT['season_order'],
+        )
+        n_test = math.ceil(test_size * len(df))
+        train, test = order[:len(df) - n_test], order[len(df) - n_test:]
+    else:
+        stratify = df[stratify_column].to_numpy() if mode == 'stratified' else None
+        train, test = train_test_split(
+            positions, test_size=test_size, random_state=random_state, stratify=stratify
+        )
+
+    return {'train': train.astype(np.int64), 'test': test.astype(np.int64)}
+
+
+def split_target(
+    df: pd.DataFrame,
+    indices: Dict[str, np.ndarray],
+    column: str
+) -> Tuple[pd.Series, pd.Series]:
+    """Target ``column`` de train y test a partir de los índices."""
+    target = df[column]
+    return target.iloc[indices['train']], target.iloc[indices['test']]
+
+
+def split_targets(
+    df_model: pd.DataFrame,
+    indices: Dict[str, np.ndarray]
+) -> Tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+    """
+    Targets de regresión (``gamelength``) y clasificación (``bResult``) de
+    train y test. Es nodo de los pipelines de modelado y de evaluación, que
+    se ejecutan por separado.
+
+    Returns:
+        Tupla con (y_reg_train, y_reg_test, y_cls_train, y_cls_test)
+    """
+    y_reg_train, y_reg_test = split_target(df_model, indices, 'gamelength')
+    y_cls_train, y_cls_test = split_target(df_model, indices, 'bResult')
+    return y_reg_train, y_reg_test, y_cls_train, y_cls_test
@@ -0,0 +1,207 @@
+"""
+Tests del pipeline de limpieza de datos.
+"""
+import numpy as np
+import pandas as pd
+
+from league_project.game_keys import build_game_key_index
+from league_project.pipelines.data_cleaning.derived_features import (
+    compute_derived_features,
+)
+from league_project.pipelines.data_cleaning.nodes import (
+    DEFAULT_DERIVED_FEATURES,
+    compact_dataset,
+)
+from league_project.pipelines.data_cleaning.outliers import filter_outliers, outlier_bounds
+from league_project.pipelines.data_cleaning.profiling import profile_dataset
+from league_project.pipelines.data_cleaning.schema import apply_cleaning_schema
+from league_project.pipelines.data_cleaning.streaming import FingerprintSet, stream_clean
+
+
+class TestDerivedFeatures:
+    def test_kda_uses_numerator_when_no_deaths(self):
+        df = pd.DataFrame({'kills': [3, 4], 'deaths': [0, 2], 'assists': [2, 4]})
+
+        result = compute_derived_features(df, DEFAULT_DERIVED_FEATURES)
+
+        assert result['kda'].tolist() == [5.0, 4.0]
+
+    def test_per_minute_and_missing_columns(self):
+        df = pd.DataFrame({'gold': [600.0, 0.0], 'gamelength_minutes': [30.0, 0.0]})
+        specs = [
+            {'name': 'gold_per_minute', 'op': 'per_minute', 'columns': ['gold'],
+             'zero_division': 'nan'},
+            {'name': 'kda', 'op': 'ratio', 'numerator': ['kills'], 'denominator': ['deaths']},
+        ]
+
+        result = compute_derived_features(df, specs)
+
+        assert result['gold_per_minute'].iloc[0] == 20.0
+        assert np.isnan(result['gold_per_minute'].iloc[1])
+        assert 'kda' not in result.columns
+
+
+class TestCleaningSchema:
+    SCHEMA = {
+        'columns': {
+            'time': {'dtype': 'numeric', 'min': 0},
+            'team': {'normalize': ['strip', 'title']},
+        },
+    }
+
+    def test_single_mask_filters_invalid_and_duplicate_rows(self):
+        raw = pd.DataFrame({
+            'Address': ['a', 'a', 'b', 'c'],
+            'Team': [' blue', 'blue ', 'red', 'red'],
+            'Time': [1.0, 1.0, -1.0, 'x'],
+        })
+
+        result = apply_cleaning_schema(raw, self.SCHEMA)
+
+        assert result.columns.tolist() == ['address', 'team', 'time']
+        assert result['team'].tolist() == ['Blue']
+
+    def test_does_not_mutate_input(self):
+        raw = pd.DataFrame({'Team': [' blue'], 'Time': [1]})
+
+        apply_cleaning_schema(raw, self.SCHEMA)
+
+        assert raw.columns.tolist() == ['Team', 'Time']
+        assert raw['Team'].iloc[0] == ' blue'
+
+    def test_address_replaced_by_game_key(self):
+        game_keys = build_game_key_index(pd.Series(['http://a', 'http://b']))
+        raw = pd.DataFrame({'Address': ['http://b', 'http://a', 'http://zzz'], 'Time': [1, 2, 3]})
+
+        result = apply_cleaning_schema(raw, {}, game_keys=game_keys)
+
+        assert list(result.columns) == ['game_key', 'time']
+        assert result['game_key'].dtype == np.int64
+        assert result['game_key'].tolist()[:2] == game_keys['game_key'].tolist()[::-1]
+        # Una URL fuera del diccionario recibe su propia clave, no una compartida
+        assert result['game_key'].iloc[2] not in (-1, *game_keys['game_key'])
+
+    def test_game_keys_stable_when_raw_rows_are_reordered_or_prepended(self):
+        before = build_game_key_index(pd.Series(['http://a', 'http://b', 'http://c']))
+        after = build_game_key_index(pd.Series(['http://new', 'http://c', 'http://a', 'http://b']))
+
+        assert before.set_index('address')['game_key'].equals(
+            after.set_index('address')['game_key'].loc[before['address']]
+        )
+
+
+class TestOutlierFiltering:
+    def test_single_mask_with_counts_per_rule(self):
+        df = pd.DataFrame({
+            'kills': [1, 2, 3, 2, 1, 3, 2, 100],
+            'gold': [500, 600, -1, 550, 520, 580, 610, 590],
+        })
+        config = {'rules': [
+            {'column': 'kills', 'method': 'iqr', 'factor': 3},
+            {'column': 'gold', 'method': 'range', 'min': 0},
+            {'column': 'missing', 'method': 'iqr'},
+        ]}
+
+        result, counts = filter_outliers(df, config)
+
+        assert counts == {'kills:iqr': 1, 'gold:range': 1}
+        assert result.index.tolist() == [0, 1, 3, 4, 5, 6]
+
+    def test_bounds_are_exact_in_memory_and_reproducible_in_chunks(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({'kills': rng.gamma(2.0, 3.0, 20_000)})
+        rules = [{'column': 'kills', 'method': 'iqr', 'factor': 3}]
+
+        _, low, high = outlier_bounds(df, rules)['kills:iqr']
+        q1, q3 = df['kills'].quantile([0.25, 0.75])
+        assert (low, high) == (q1 - 3 * (q3 - q1), q3 + 3 * (q3 - q1))
+
+        def chunked():
+            return (df.iloc[i:i + 1000] for i in range(0, len(df), 1000))
+        config = {'sketch_size': 50, 'seed': 7}
+        assert outlier_bounds(chunked(), rules, config) == outlier_bounds(chunked(), rules, config)
+
+
+class TestProfiling:
+    def test_incremental_profile_matches_full_profile(self):
+        df = pd.DataFrame({'team': ['a', 'b', 'a', None, 'b', 'b'], 'kills': [1, 2, 1, 4, 2, 7]})
+
+        _, state = profile_dataset(df.iloc[:4])
+        incremental, state = profile_dataset(df, state)
+        full, _ = profile_dataset(df)
+        cached, _ = profile_dataset(df, state)
+        changed, _ = profile_dataset(df.iloc[::-1].reset_index(drop=True), state)
+
+        assert incremental['profile_mode'] == 'incremental'
+        assert cached['profile_mode'] == 'cached'
+        assert changed['profile_mode'] == 'full'
+        for key in ['missing_values', 'duplicate_rows', 'memory_usage_mb', 'fingerprint']:
+            assert incremental[key] == full[key]
+        assert (full['missing_values'], full['duplicate_rows']) == (1, 2)
+
+    def test_any_edited_row_invalidates_cached_profile(self):
+        df = pd.DataFrame({
+            'kills': np.arange(5000, dtype=np.float64),
+            'team': pd.Categorical(['Blue', 'Red'] * 2500),
+            'name': ['x'] * 5000,
+        })
+        _, state = profile_dataset(df)
+        assert profile_dataset(df.copy(), state)[0]['profile_mode'] == 'cached'
+
+        for position in [0, 1, 2501, 4999]:
+            edited = df.copy()
+            edited.loc[position, 'kills'] = np.nan
+            report, _ = profile_dataset(edited, state)
+            assert report['profile_mode'] == 'full'
+            assert report['missing_values'] == 1
+        for column, value in [('team', 'Red'), ('name', 'y')]:
+            edited = df.copy()
+            edited.loc[2500, column] = value
+            assert profile_dataset(edited, state)[0]['profile_mode'] == 'full'
+
+    def test_sampled_mode_reports_error_bound(self):
+        df = pd.DataFrame({'x': np.where(np.arange(10_000) % 4 == 0, np.nan, 1.0)})
+
+        report, state = profile_dataset(df, config={'sample_threshold': 1000, 'sample_rows': 2000})
+
+        assert state is None
+        assert report['profile_mode'] == 'sampled'
+        assert abs(report['missing_percentage'] - 25.0) <= report['missing_percentage_error']
+
+
+class TestStreamingCleaning:
+    def test_deduplicates_across_chunks(self):
+        raw = pd.DataFrame({'Team': ['a', 'b', 'a', 'c', 'b'], 'Time': [1, 2, 1, 3, 2]})
+        chunks = (raw.iloc[i:i + 2] for i in range(0, len(raw), 2))
+
+        result = pd.concat(list(stream_clean(chunks, TestCleaningSchema.SCHEMA, 'test')))
+
+        assert result['team'].tolist() == ['A', 'B', 'C']
+
+    def test_fingerprint_set_membership(self):
+        fingerprints = FingerprintSet()
+        for start in range(0, 100, 10):
+            fingerprints.add(np.arange(start, start + 10, dtype=np.uint64))
+
+        found = fingerprints.contains(np.array([0, 55, 99, 100, 500], dtype=np.uint64))
+
+        assert found.tolist() == [True, True, True, False, False]
+        assert len(fingerprints) == 100
+
+
+class TestCompaction:
+    def test_compacts_types_and_reports_memory(self):
+        df = pd.DataFrame({
+            'team': ['bKills', 'rKills'] * 50,
+            'count': np.arange(100, dtype=np.float64),
+            'ratio': np.linspace(0, 1, 100),
+            'game_key': np.arange(100, dtype=np.int32),
+        })
+
+        compacted, stats = compact_dataset(df, {'exclude': ['game_key']})
+
+        assert compacted['team'].dtype == 'category'
+        assert compacted['count'].dtype == np.int8
+        assert compacted['ratio'].dtype == np.float32
+        assert compacted['game_key'].dtype == np.int32
+        assert stats['memory_after_mb'] < stats['memory_before_mb']
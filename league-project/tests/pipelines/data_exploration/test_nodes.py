@@ -0,0 +1,236 @@
+"""
+Tests del pipeline de exploración de datos.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from league_project.pipelines.data_exploration.nodes import (
+    analyze_champion_bans,
+    analyze_correlations,
+    analyze_game_duration,
+    analyze_neutral_objectives,
+    analyze_structures,
+    analyze_team_performance,
+)
+from league_project.pipelines.data_exploration.cube import AnalyticsCube, cube_tables
+from league_project.pipelines.data_exploration.incremental import render_eda_state, update_eda_state
+
+
+class TestChampionBans:
+    def test_counts_priority_presence_and_breakdown(self):
+        bans = pd.DataFrame({
+            'game_key': [0, 0, 1, 1],
+            'team': ['Bluebans', 'Redbans', 'Bluebans', 'Redbans'],
+            'ban_1': ['Zed', 'Ahri', 'Zed', 'Zed'],
+            'ban_2': ['Ahri', None, 'Lux', ''],
+        })
+        games = pd.DataFrame({'game_key': [0, 1], 'league': ['LCK', 'NALCS']})
+
+        summary, breakdown = analyze_champion_bans(
+            bans, games, {'breakdown_dimensions': ['league', 'side']}
+        )
+
+        zed = summary.set_index('champion').loc['Zed']
+        assert summary['champion'].tolist() == ['Zed', 'Ahri', 'Lux']
+        assert (zed['ban_count'], zed['games_banned'], zed['presence_rate']) == (3, 2, 100.0)
+        assert summary.set_index('champion').loc['Ahri', 'avg_ban_priority'] == 1.5
+
+        by_league = breakdown[breakdown['dimension'] == 'league'].set_index(['segment', 'champion'])
+        assert by_league.loc[('NALCS', 'Zed'), 'ban_count'] == 2
+        assert set(breakdown.loc[breakdown['dimension'] == 'side', 'segment']) == {'blue', 'red'}
+
+
+class TestTeamPerformance:
+    def test_stacks_both_sides(self):
+        matches = pd.DataFrame({
+            'blueteamtag': pd.Categorical(['SKT', 'C9', 'SKT']),
+            'redteamtag': pd.Categorical(['C9', 'TSM', 'TSM']),
+            'bresult': [1, 0, 0],
+            'rresult': [0, 1, 1],
+            'gamelength_minutes': [30.0, 40.0, 50.0],
+        })
+
+        overall, by_side, by_opponent = analyze_team_performance(matches)
+
+        skt = overall.set_index('team').loc['SKT']
+        assert overall['team'].iloc[0] == 'TSM'
+        assert (skt['total_games'], skt['wins'], skt['losses'], skt['avg_game_length']) == (2, 1, 1, 40.0)
+        assert by_side.set_index(['team', 'side']).loc[('C9', 'red'), 'win_rate'] == 0.0
+        assert by_opponent.set_index(['team', 'opponent']).loc[('TSM', 'SKT'), 'wins'] == 1
+
+
+class TestEventTypes:
+    CATALOG = Path(__file__).resolve().parents[3] / 'conf' / 'base' / 'catalog.yml'
+
+    def test_detail_counts_survive_catalog_projection(self):
+        catalog = yaml.safe_load(self.CATALOG.read_text())
+        monsters = pd.DataFrame({
+            'game_key': [0, 0, 1], 'team': ['Bdragons', 'Rdragons', 'Bbarons'],
+            'type': ['fire_dragon', 'fire_dragon', 'baron_nashor'], 'time': [10.0, 14.0, 25.0],
+        })
+        structures = pd.DataFrame({
+            'game_key': [0, 1], 'team': ['bTowers', 'rTowers'], 'lane': ['MID_LANE', 'TOP_LANE'],
+            'type': ['OUTER_TURRET', 'OUTER_TURRET'], 'time': [12.0, 15.0],
+        })
+
+        objectives = analyze_neutral_objectives(
+            monsters[catalog['intermediate_monsters@eda']['load_args']['columns']]
+        ).set_index('objective_type')
+        destroyed = analyze_structures(
+            structures[catalog['intermediate_structures@eda']['load_args']['columns']]
+        ).set_index('structure_type')
+
+        assert (objectives.loc['fire_dragon', 'Bdragons'], objectives.loc['fire_dragon', 'Rdragons']) == (1, 1)
+        assert destroyed.loc['OUTER_TURRET', ['MID_LANE', 'TOP_LANE']].tolist() == [1, 1]
+
+
+class TestCorrelations:
+    def test_blockwise_pairs_match_pandas(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.normal(size=(300, 9)), columns=list('abcdefghi'))
+        df['b'] = df['a'] * 2 + rng.normal(size=300) * 0.1
+        df = df.mask(rng.random(df.shape) < 0.1)
+
+        for method in ['pearson', 'spearman']:
+            result = analyze_correlations(df, {'correlations': {'method': method, 'block_size': 4}})
+            expected = df.corr(method=method)
+            assert len(result) == 9 * 8 // 2
+            for row in result.itertuples():
+                assert abs(row.correlation - expected.loc[row.variable_1, row.variable_2]) < 0.01
+        assert result.iloc[0][['variable_1', 'variable_2', 'strength']].tolist() == ['a', 'b', 'Fuerte']
+
+    def test_top_k_and_threshold(self):
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame(rng.normal(size=(200, 12)))
+        df[12] = df[0] + df[1]
+
+        top = analyze_correlations(df, {'correlations': {'top_k': 2, 'block_size': 5}})
+        assert sorted(top[['variable_1', 'variable_2']].values.tolist()) == [[0, 12], [1, 12]]
+        strong = analyze_correlations(df, {'correlations': {'threshold': 0.5}})
+        assert (strong['abs_correlation'] >= 0.5).all() and len(strong) == 2
+
+    def test_large_magnitude_and_collinear_columns(self):
+        rng = np.random.default_rng(2)
+        result = rng.integers(0, 2, 500)
+        df = pd.DataFrame({
+            'bresult': result,
+            'rresult': 1 - result,
+            'game_key': rng.integers(0, 2 ** 62, 500),
+            'kills': rng.poisson(8, 500).astype(float),
+        })
+        df.loc[::9, 'kills'] = np.nan
+        expected = df.corr()
+
+        for float32_columns in [1000, 1]:
+            pairs = analyze_correlations(df, {'correlations': {'float32_columns': float32_columns}})
+            for row in pairs.itertuples():
+                assert abs(row.abs_correlation - abs(expected.loc[row.variable_1, row.variable_2])) < 1e-5
+        exact = analyze_correlations(df).set_index(['variable_1', 'variable_2'])
+        assert abs(exact.loc[('bresult', 'rresult'), 'abs_correlation'] - 1.0) < 1e-12
+
+
+class TestGameDuration:
+    def test_histogram_tables_without_mutating_input(self):
+        df = pd.DataFrame({
+            'gamelength': [20, 30, 30, 40, 50, 36, None],
+            'league': ['LCK', 'LCK', 'LCK', 'NALCS', 'NALCS', 'NALCS', 'LCK'],
+            'year': [2016, 2016, 2017, 2017, 2017, 2017, 2017],
+        })
+        original = df.copy()
+
+        summary, percentiles, categories = analyze_game_duration(df)
+
+        pd.testing.assert_frame_equal(df, original)
+        overall = dict(zip(summary['metric'], summary['value']))
+        assert overall['count'] == 6 and overall['median'] == 30 and overall['max'] == 50
+        assert overall['Media (25-35 min)'] == round(2 / 6 * 100, 2)
+
+        lck = percentiles.set_index(['dimension', 'segment']).loc[('league', 'LCK')]
+        assert (lck['count'], lck['mean'], lck['p50']) == (3, 26.67, 30)
+        nalcs = categories[(categories['dimension'] == 'league') & (categories['segment'] == 'NALCS')]
+        assert nalcs['count'].tolist() == [0, 0, 2, 1]
+
+
+class TestIncrementalEda:
+    def test_folding_new_games_matches_full_analysis(self):
+        main = pd.DataFrame({
+            'game_key': [0, 1, 2, 3],
+            'blueteamtag': ['SKT', 'G2', 'SKT', 'FNC'],
+            'redteamtag': ['G2', 'FNC', 'FNC', 'SKT'],
+            'bresult': [1, 0, 1, 0],
+            'rresult': [0, 1, 0, 1],
+            'gamelength': [30.0, 41.0, 24.0, 36.0],
+            'league': ['LCK', 'EULCS', 'LCK', 'EULCS'],
+            'year': [2016, 2016, 2017, 2017],
+        })
+        bans = pd.DataFrame({
+            'game_key': [0, 1, 2, 3],
+            'team': ['Bluebans', 'Redbans', 'Bluebans', 'Redbans'],
+            'ban_1': ['Zed', 'Ahri', 'Zed', 'Lux'],
+        })
+        events = pd.DataFrame({'game_key': [0, 2, 3], 'type': ['DRAGON', 'BARON', 'DRAGON'], 'time': [10.0, 25.0, 12.0]})
+        parameters = {'breakdown_dimensions': ['league']}
+
+        def run(state, keys):
+            def rows(df):
+                return df[df['game_key'].isin(keys)]
+            return update_eda_state(state, rows(main), rows(bans), rows(events), rows(events), parameters)
+
+        incremental = render_eda_state(run(run({}, [0, 1]), [0, 1, 2, 3]), parameters)
+        full = render_eda_state(run({}, [0, 1, 2, 3]), parameters)
+
+        for folded, expected in zip(incremental, full):
+            pd.testing.assert_frame_equal(folded, expected)
+        teams = incremental[1].set_index('team')
+        assert (teams.loc['SKT', 'total_games'], teams.loc['SKT', 'wins']) == (3, 3)
+
+        # Filas reordenadas: el estado se conserva; un ban corregido de una
+        # partida ya procesada reconstruye el estado
+        state = run({}, [0, 1, 2, 3])
+        shuffled = update_eda_state(state, main[::-1], bans[::-1], events[::-1], events[::-1], parameters)
+        assert shuffled is state
+        fixed_bans = bans.assign(ban_1=['Zed', 'Ahri', 'Zed', 'Ahri'])
+        rebuilt = render_eda_state(update_eda_state(state, main, fixed_bans, events, events, parameters))
+        assert rebuilt[4].set_index('champion').loc['Ahri', 'ban_count'] == 2
+
+
+class TestAnalyticsCube:
+    def test_rollups_match_full_analyses(self):
+        main = pd.DataFrame({
+            'game_key': [0, 1, 2],
+            'league': ['LCK', 'LCK', 'NALCS'],
+            'year': [2016, 2017, 2017],
+            'season': ['Spring', 'Summer', 'Spring'],
+            'blueteamtag': ['SKT', 'KT', 'TSM'],
+            'redteamtag': ['KT', 'SKT', 'C9'],
+            'bresult': [1, 0, 1],
+            'rresult': [0, 1, 0],
+            'gamelength_minutes': [30.0, 40.0, 35.0],
+        })
+        bans = pd.DataFrame({
+            'game_key': [0, 0, 1, 2],
+            'team': ['Bluebans', 'Redbans', 'Bluebans', 'Redbans'],
+            'ban_1': ['Zed', 'Ahri', 'Zed', 'Zed'],
+            'ban_2': ['Lux', None, 'Ahri', None],
+        })
+        monsters = pd.DataFrame({
+            'game_key': [0, 1, 1, 2],
+            'team': ['Bdragons', 'Rbarons', 'Rdragons', 'Bdragons'],
+            'type': ['fire_dragon', 'baron_nashor', 'air_dragon', 'fire_dragon'],
+            'time': [10.0, 30.0, 12.0, 14.0],
+        })
+        cube = AnalyticsCube(**cube_tables(main, bans, monsters))
+
+        expected_teams = analyze_team_performance(main)[0].sort_values('team', ignore_index=True)
+        pd.testing.assert_frame_equal(cube.team_performance(), expected_teams, check_dtype=False)
+        expected_bans = analyze_champion_bans(bans, main)[0]
+        pd.testing.assert_frame_equal(cube.champion_bans(), expected_bans, check_dtype=False)
+
+        lck = cube.champion_bans(by=['year'], league='LCK').set_index(['year', 'champion'])
+        assert (lck.loc[(2017, 'Zed'), 'ban_count'], lck.loc[(2017, 'Zed'), 'presence_rate']) == (1, 100.0)
+        skt = cube.neutral_objectives(by=['team'], team='SKT', year=[2016, 2017])
+        assert skt['objective_type'].tolist() == ['air_dragon', 'baron_nashor', 'fire_dragon']
+        assert cube.team_performance(league='LCK', team='Nobody').empty
@@ -0,0 +1,177 @@
+"""
+Tests del pipeline de procesamiento de datos.
+"""
+import numpy as np
+import pandas as pd
+
+from league_project.datasets import FeatureStoreDataset
+from league_project.game_keys import address_keys, build_game_key_index
+from league_project.pipelines.data_processing.nodes import (
+    aggregate_event_features,
+    merge_match_features,
+    plan_feature_store_update,
+    select_features,
+)
+from league_project.pipelines.data_processing.timeline import gold_timeline_features
+
+
+GAME_KEYS = build_game_key_index(pd.Series(['a', 'b', 'c', 'd']))
+KEYS = GAME_KEYS['game_key'].to_numpy()
+
+
+class TestEventFeatures:
+    def test_fused_counts_and_configured_gold_minutes(self):
+        kills = pd.DataFrame({'game_key': KEYS[[0, 0, 0, 1]], 'Team': ['bKills', 'rKills', 'bKills', 'rKills']})
+        monsters = pd.DataFrame({'game_key': KEYS[[1, 1]], 'Team': ['bDragons', 'bHeralds']})
+        structures = pd.DataFrame({'game_key': KEYS[[0]], 'Team': ['rTowers']})
+        gold = pd.DataFrame({
+            'game_key': KEYS[[0, 0, 0, 1, 2]],
+            'Type': ['goldblue', 'golddiff', 'golddiff', 'golddiff', 'golddiff'],
+            'min_5': [9000.0, 100.0, -1.0, 300.0, np.nan],
+            'min_10': [9500.0, 200.0, -1.0, 600.0, 800.0],
+        })
+        matches = pd.DataFrame({'Address': ['a', 'b', 'c', 'd'], 'gamelength': [30, 31, 32, 33]})
+
+        params = {'gold_minutes': [5, 10, 30]}
+        games, plan = plan_feature_store_update(
+            pd.DataFrame(columns=['game_key', 'feature_definition', 'input_hash']),
+            matches, GAME_KEYS, kills, monsters, structures, gold, params
+        )
+        events = aggregate_event_features(kills, monsters, structures, gold, params, games)
+        store = merge_match_features(games, events, plan)['features']
+        result = select_features(store, {
+            'feature_columns': ['blue_kills', 'kill_diff', 'dragon_diff', 'tower_diff',
+                                'gold_diff_5', 'gold_diff_10', 'gold_diff_30'],
+            'target_columns': ['gamelength'],
+        }).sort_values('gamelength')
+
+        assert result['blue_kills'].tolist() == [2, 0, 0, 0]
+        assert result['kill_diff'].tolist() == [1, -1, 0, 0]
+        assert result['dragon_diff'].tolist() == [0, 1, 0, 0]
+        assert result['tower_diff'].tolist() == [-1, 0, 0, 0]
+        assert result['gold_diff_5'].tolist() == [100.0, 300.0, 200.0, 200.0]
+        assert result['gold_diff_10'].tolist() == [200.0, 600.0, 800.0, 600.0]
+        assert result['gold_diff_30'].isna().all()
+
+    def test_time_windows_count_only_events_up_to_cutoff(self):
+        kills = pd.DataFrame({
+            'game_key': [0, 0, 0, 1],
+            'Team': ['rKills', 'bKills', 'bKills', 'bKills'],
+            'Time': [4.0, 10.0, 16.5, np.nan],
+        })
+        monsters = pd.DataFrame({'game_key': [0], 'Team': ['bDragons'], 'Time': [12.0]})
+        structures = pd.DataFrame({'game_key': [0], 'Team': ['rTowers'], 'Time': [15.0]})
+        gold = pd.DataFrame({'game_key': [0, 1], 'Type': 'golddiff', 'min_10': [50.0, -50.0]})
+
+        events = aggregate_event_features(
+            kills, monsters, structures, gold, {'gold_minutes': [10], 'time_windows': [10, 5, 15]}
+        ).set_index('game_key')
+
+        game = events.loc[0]
+        assert [game[f'blue_kills_{c}'] for c in (5, 10, 15)] == [0, 1, 1]
+        assert [game[f'kill_diff_{c}'] for c in (5, 10, 15)] == [-1, 0, 0]
+        assert [game[f'first_kill_{c}'] for c in (5, 10, 15)] == [-1, -1, -1]
+        assert [game[f'first_dragon_{c}'] for c in (5, 10, 15)] == [0, 0, 1]
+        assert game['first_tower_15'] == -1 and game['blue_kills'] == 2
+        # Eventos sin tiempo cuentan en el total pero en ninguna ventana
+        assert events.loc[1, 'blue_kills'] == 1 and np.isnan(events.loc[1, 'blue_kills_15'])
+
+
+class TestFeatureStore:
+    def test_computes_only_new_changed_or_outdated_games(self, tmp_path):
+        path = str(tmp_path / 'feature_store')
+        key = dict(zip('abc', address_keys('abc')))
+        empty = pd.DataFrame({'game_key': pd.Series(dtype='int64'), 'Team': pd.Series(dtype=object)})
+        gold = pd.DataFrame({'game_key': list(key.values()), 'Type': 'golddiff', 'min_10': [10.0, 20.0, 30.0]})
+
+        def kills(counts):
+            return pd.DataFrame({'game_key': [key[a] for a, n in counts.items() for _ in range(n)], 'Team': 'bKills'})
+
+        def run(addresses, df_kills, params):
+            # La limpieza reconstruye game_keys en el orden de los archivos raw
+            game_keys = build_game_key_index(pd.Series(addresses))
+            index = FeatureStoreDataset(path, load_args={'columns': ['game_key', 'feature_definition', 'input_hash']})
+            games, plan = plan_feature_store_update(
+                index.load(), pd.DataFrame({'Address': addresses}), game_keys, df_kills, empty, empty, gold, params
+            )
+            events = aggregate_event_features(df_kills, empty, empty, gold, params, games)
+            FeatureStoreDataset(path).save(merge_match_features(games, events, plan))
+            return sorted(game_keys.set_index('game_key').loc[games['game_key'], 'address'])
+
+        def stored():
+            store = FeatureStoreDataset(path).load()
+            addresses = {k: a for a, k in key.items()}
+            return sorted(zip(store['game_key'].map(addresses), store['blue_kills']))
+
+        params = {'gold_minutes': [10], 'gold_timeline': {'enabled': False}}
+        assert run(['a', 'b'], kills({'a': 1, 'c': 2}), params) == ['a', 'b']
+        # Partida nueva al principio y filas reordenadas: solo se calcula la nueva
+        assert run(['c', 'b', 'a'], kills({'a': 1, 'c': 2}), params) == ['c']
+        assert run(['c', 'b', 'a'], kills({'a': 1, 'c': 2}), params) == []
+        assert stored() == [('a', 1), ('b', 0), ('c', 2)]
+        # Datos de entrada corregidos: se recalcula esa partida y reemplaza su fila
+        assert run(['c', 'b', 'a'], kills({'a': 3, 'c': 2}), params) == ['a']
+        assert stored() == [('a', 3), ('b', 0), ('c', 2)]
+        # Partida que ya no está en matchinfo: se elimina del store
+        assert run(['c', 'a'], kills({'a': 3, 'c': 2}), params) == []
+        assert stored() == [('a', 3), ('c', 2)]
+
+        # Otra definición de features: se recalcula todo y se descartan las particiones viejas
+        assert run(['c', 'a'], kills({'a': 3, 'c': 2}), {**params, 'gold_minutes': [10, 15]}) == ['a', 'c']
+        assert FeatureStoreDataset(path).load()['gold_diff_15'].isna().all()
+        assert len(list((tmp_path / 'feature_store').glob('part-*.parquet'))) == 1
+
+    def test_longer_new_game_keeps_stored_games_up_to_date(self, tmp_path):
+        path = str(tmp_path / 'feature_store')
+        empty = pd.DataFrame({'game_key': pd.Series(dtype='int64'), 'Team': pd.Series(dtype=object)})
+        params = {'gold_minutes': [1], 'gold_timeline': {'enabled': False}}
+
+        def run(addresses, gold):
+            game_keys = build_game_key_index(pd.Series(addresses))
+            index = FeatureStoreDataset(path, load_args={'columns': ['game_key', 'feature_definition', 'input_hash']})
+            games, plan = plan_feature_store_update(
+                index.load(), pd.DataFrame({'Address': addresses}), game_keys, empty, empty, empty, gold, params
+            )
+            events = aggregate_event_features(empty, empty, empty, gold, params, games)
+            FeatureStoreDataset(path).save(merge_match_features(games, events, plan))
+            return len(games)
+
+        key = dict(zip('abc', address_keys('abc')))
+        gold = pd.DataFrame({'game_key': [key['a'], key['b']], 'Type': 'golddiff',
+                             'min_1': [0, 0], 'min_2': [10, -5]})
+        assert run(['a', 'b'], gold) == 2
+
+        # parse_gold_timelines rellena con NaN hasta el minuto de la partida
+        # más larga: la partida nueva agrega min_3 y cambia el tipo a float
+        longer = pd.concat([gold, pd.DataFrame({'game_key': [key['c']], 'Type': 'golddiff',
+                                                'min_1': [0], 'min_2': [3], 'min_3': [40]})],
+                           ignore_index=True).astype({'min_1': 'float32', 'min_2': 'float32'})
+        assert run(['a', 'b', 'c'], longer) == 1
+        assert sorted(FeatureStoreDataset(path).load()['game_key']) == sorted(key.values())
+
+
+class TestGoldTimeline:
+    def test_reductions_respect_game_length(self):
+        gold = pd.DataFrame({
+            'game_key': [0, 0, 0, 1],
+            'Type': ['golddiff', 'goldblue', 'goldblueTop', 'golddiff'],
+            'min_1': [0.0, 2500.0, 500.0, 100.0],
+            'min_2': [200.0, 3000.0, 600.0, -100.0],
+            'min_3': [-100.0, 4000.0, 1000.0, np.nan],
+            'min_4': [400.0, 5000.0, 1500.0, np.nan],
+        })
+
+        features = gold_timeline_features(gold).set_index('game_key')
+
+        game = features.loc[0]
+        assert game['gold_slope'] == 90.0  # polyfit([1, 2, 3, 4], [0, 200, -100, 400], 1)
+        assert (game['gold_max_lead_blue'], game['gold_max_lead_blue_minute']) == (400, 4)
+        assert (game['gold_max_lead_red'], game['gold_max_lead_red_minute']) == (100, 3)
+        assert game['gold_auc'] == 100 + 50 + 150
+        assert game['gold_lead_changes'] == 2
+        assert game['gold_share_blue_top'] == 0.3
+
+        short = features.loc[1]
+        assert (short['gold_timeline_minutes'], short['gold_slope'], short['gold_auc']) == (2, -200.0, 0.0)
+        assert np.isnan(short['gold_share_blue_top'])
+        assert gold_timeline_features(gold, {'horizon': 2}).loc[0, 'gold_max_lead_blue'] == 200
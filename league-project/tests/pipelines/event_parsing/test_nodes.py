@@ -0,0 +1,62 @@
+"""
+Tests del pipeline de parseo de eventos.
+"""
+import numpy as np
+import pandas as pd
+
+from league_project.game_keys import build_game_key_index
+from league_project.pipelines.event_parsing.nodes import (
+    parse_gold_timelines,
+    parse_kill_events,
+    parse_structure_events,
+)
+
+
+def _raw_games() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Address': ['g1', 'g2'],
+        'bKills': [
+            "[[10.82, 'C9 Hai', 'TSM Bjergsen', ['TSM Santorin', \"O'Neil\"], 9229, 8469]]",
+            "[]",
+        ],
+        'rKills': ["[]", "[[5.5, 'A', 'B', [], 'TooEarly', 'TooEarly']]"],
+        'bTowers': ["[[27.542, 'MID_LANE', 'BASE_TURRET']]", "[]"],
+        'bInhibs': ["[]", "[[30.1, 'TOP_LANE']]"],
+        'golddiff': ["[0, -14, 65]", "[0, 10]"],
+    })
+
+
+GAME_KEYS = build_game_key_index(pd.Series(['g1', 'g2']))
+
+
+class TestEventParsing:
+    def test_kill_events(self):
+        kills = parse_kill_events(_raw_games(), GAME_KEYS)
+
+        assert kills['game_key'].tolist() == GAME_KEYS['game_key'].tolist()
+        assert kills['Team'].tolist() == ['bKills', 'rKills']
+        assert kills.loc[0, 'Killer'] == 'TSM Bjergsen'
+        assert kills.loc[0, ['Assist_1', 'Assist_2']].tolist() == ['TSM Santorin', "O'Neil"]
+        assert kills['Assist_3'].isna().all()
+        assert np.isnan(kills.loc[1, 'x_pos'])
+
+    def test_kill_events_without_kills(self):
+        raw = _raw_games().assign(bKills="[]", rKills="[]")
+
+        kills = parse_kill_events(raw, GAME_KEYS)
+
+        assert kills.empty
+        assert [f'Assist_{i}' for i in range(1, 5)] == [c for c in kills.columns if c.startswith('Assist')]
+
+    def test_structure_default_type(self):
+        structures = parse_structure_events(_raw_games(), GAME_KEYS)
+
+        assert structures['Type'].tolist() == ['BASE_TURRET', 'INHIBITOR']
+        assert structures['Lane'].tolist() == ['MID_LANE', 'TOP_LANE']
+
+    def test_gold_timelines_padded_with_nan(self):
+        gold = parse_gold_timelines(_raw_games(), GAME_KEYS)
+
+        assert list(gold.columns) == ['game_key', 'Type', 'min_1', 'min_2', 'min_3']
+        assert gold.loc[0, 'min_3'] == 65
+        assert np.isnan(gold.loc[1, 'min_3'])
@@ -0,0 +1,102 @@
+"""
+Tests de los datasets personalizados del proyecto.
+"""
+import pandas as pd
+import pytest
+from kedro.io.core import DatasetError
+
+from league_project.datasets import ChunkedParquetDataset, PickleStateDataset, SharedCSVDataset
+
+
+class TestChunkedParquetDataset:
+    def test_schema_projection_and_filters(self, tmp_path):
+        filepath = str(tmp_path / "matches.parquet")
+        writer = ChunkedParquetDataset(filepath, schema={"year": "int16", "league": "category"})
+        writer.save(pd.DataFrame({
+            "league": ["NALCS", "LCK", "NALCS"],
+            "year": [2016, 2017, 2017],
+            "gamelength": [30, 35, 40],
+        }))
+
+        reader = ChunkedParquetDataset(
+            filepath,
+            load_args={"columns": ["league", "year", "missing"], "filters": [["year", "==", 2017]]},
+        )
+        result = reader.load()
+
+        assert list(result.columns) == ["league", "year"]
+        assert result["year"].dtype == "int16"
+        assert result["league"].dtype == "category"
+        assert result["league"].tolist() == ["LCK", "NALCS"]
+
+    def test_chunks_with_growing_categories(self, tmp_path):
+        dataset = ChunkedParquetDataset(str(tmp_path / "bans.parquet"), schema={"ban_1": "category"})
+        chunks = [
+            pd.DataFrame({"ban_1": [float("nan"), float("nan")]}),
+            pd.DataFrame({"ban_1": [f"champion_{i}" for i in range(300)]}),
+        ]
+
+        dataset.save(iter(chunks))
+
+        assert len(dataset.load()) == 302
+
+    def test_missing_schema_column_raises(self, tmp_path):
+        dataset = ChunkedParquetDataset(str(tmp_path / "x.parquet"), schema={"game_key": "int32"})
+
+        with pytest.raises(DatasetError):
+            dataset.save(pd.DataFrame({"time": [1.0]}))
+
+
+class TestSharedCSVDataset:
+    def test_parses_once_and_persists_cache(self, tmp_path, monkeypatch):
+        csv_path = tmp_path / "matchinfo.csv"
+        pd.DataFrame({"League": ["NALCS", "LCK"], "Year": [2016, 2017]}).to_csv(csv_path, index=False)
+        cache_dir = str(tmp_path / "cache")
+
+        calls = []
+        read_csv = pd.read_csv
+        monkeypatch.setattr(pd, "read_csv", lambda *a, **k: calls.append(1) or read_csv(*a, **k))
+
+        first = SharedCSVDataset(str(csv_path), cache_dir=cache_dir)
+        second = SharedCSVDataset(str(csv_path), cache_dir=cache_dir)
+        loaded = first.load()
+        loaded["extra"] = 1
+        assert "extra" not in second.load().columns
+        assert len(calls) == 1
+
+        first.release()
+        second.release()
+        assert SharedCSVDataset(str(csv_path), cache_dir=cache_dir).load()["Year"].tolist() == [2016, 2017]
+        assert len(calls) == 1
+
+    def test_chunked_load_closes_the_file(self, tmp_path, monkeypatch):
+        csv_path = tmp_path / "kills.csv"
+        pd.DataFrame({"Time": range(5)}).to_csv(csv_path, index=False)
+        dataset = SharedCSVDataset(str(csv_path), load_args={"chunksize": 2})
+
+        opened = []
+        open_file = dataset._fs.open
+        monkeypatch.setattr(dataset._fs, "open", lambda *a, **k: opened.append(open_file(*a, **k)) or opened[-1])
+
+        assert [len(chunk) for chunk in dataset.load()] == [2, 2, 1]
+        partial = dataset.load()
+        next(partial)
+        partial.close()
+        assert len(opened) == 2 and all(f.closed for f in opened)
+
+
+class TestPickleStateDataset:
+    def test_failed_save_keeps_previous_state(self, tmp_path):
+        dataset = PickleStateDataset(str(tmp_path / "state.pkl"))
+        assert dataset.load() == {}
+        dataset.save({"rows": 10})
+
+        class Unpicklable:
+            def __reduce__(self):
+                raise RuntimeError("fallo a mitad de la escritura")
+
+        with pytest.raises(DatasetError):
+            dataset.save({"rows": 11, "broken": Unpicklable()})
+
+        assert dataset.load() == {"rows": 10}
+        assert [p.name for p in tmp_path.iterdir()] == ["state.pkl"]
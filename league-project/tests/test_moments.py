@@ -0,0 +1,54 @@
+"""
+Tests de las estadísticas descriptivas combinables.
+"""
+import numpy as np
+import pandas as pd
+
+from league_project.moments import DescriptiveMoments
+
+
+class TestDescriptiveMoments:
+    def test_merged_chunks_match_pandas(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            'kills': rng.poisson(5, 5000).astype('int16'),
+            'gold': rng.lognormal(9, 0.5, 5000),
+            'constant': np.full(5000, 3.0),
+        })
+        df.loc[rng.random(5000) < 0.1, 'gold'] = np.nan
+
+        summary = DescriptiveMoments(sketch_size=1000)
+        for start in range(0, len(df), 700):
+            summary.merge(DescriptiveMoments(sketch_size=1000).update(df.iloc[start:start + 700]))
+        stats = summary.to_frame()
+
+        assert len(summary) == 5000
+        np.testing.assert_allclose(stats['mean'], df.mean())
+        np.testing.assert_allclose(stats['std'], df.std())
+        np.testing.assert_allclose(stats['skewness'], df.skew(), atol=1e-9)
+        np.testing.assert_allclose(stats['kurtosis'], df.kurt(), atol=1e-9)
+        assert stats['missing_count'].tolist() == df.isna().sum().tolist()
+        assert stats.loc['kills', 'mode'] == df['kills'].mode().iloc[0]
+
+    def test_late_columns_count_as_missing(self):
+        summary = DescriptiveMoments().update(pd.DataFrame({'a': [1.0, 2.0]}))
+        summary.update(pd.DataFrame({'a': [3.0], 'b': [10.0]}))
+
+        stats = summary.to_frame()
+
+        assert stats['count'].tolist() == [3, 1]
+        assert stats['missing_count'].tolist() == [0, 2]
+        assert stats.loc['a', 'max'] == 3.0
+
+    def test_quantiles_exact_in_memory_and_reproducible_from_sketches(self):
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame({'gamelength': rng.normal(40, 15, 20_000)})
+
+        exact = DescriptiveMoments(sketch_size=50).update(df).to_frame(data=df)
+        sketched = [DescriptiveMoments(sketch_size=50).update(df).to_frame() for _ in range(2)]
+
+        np.testing.assert_allclose(
+            exact.loc['gamelength', ['25%', '50%', '75%']], df['gamelength'].quantile([0.25, 0.5, 0.75])
+        )
+        assert exact.loc['gamelength', 'median'] == df['gamelength'].median()
+        pd.testing.assert_frame_equal(sketched[0], sketched[1])
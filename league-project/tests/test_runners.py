@@ -0,0 +1,15 @@
+"""
+Tests de los runners con memoria acotada.
+"""
+from league_project.runners import memory_bounded_workers
+
+
+def test_workers_limited_by_memory_budget(monkeypatch):
+    monkeypatch.setenv("LEAGUE_MEMORY_BUDGET_MB", "3000")
+    monkeypatch.setenv("LEAGUE_WORKER_MEMORY_MB", "1000")
+
+    assert memory_bounded_workers(7) == 3
+    assert memory_bounded_workers(2) == 2
+
+    monkeypatch.setenv("LEAGUE_MEMORY_BUDGET_MB", "500")
+    assert memory_bounded_workers(7) == 1
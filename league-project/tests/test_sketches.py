@@ -0,0 +1,27 @@
+"""
+Tests de los sketches de cuantiles.
+"""
+import numpy as np
+
+from league_project.sketches import QuantileSketch
+
+
+class TestQuantileSketch:
+    def test_exact_while_small(self):
+        values = np.arange(101, dtype=float)
+
+        sketch = QuantileSketch(k=200).update(values)
+
+        assert sketch.quantiles([0.0, 0.25, 0.5, 1.0]).tolist() == [0.0, 25.0, 50.0, 100.0]
+
+    def test_merged_chunks_within_rank_error(self):
+        values = np.random.default_rng(0).lognormal(size=200_000)
+        sketch = QuantileSketch(k=200, seed=0)
+        for i, chunk in enumerate(np.array_split(values, 20)):
+            sketch.merge(QuantileSketch(k=200, seed=i).update(chunk))
+
+        estimates = sketch.quantiles([0.25, 0.5, 0.75])
+        ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+
+        assert sketch.count == len(values)
+        assert np.abs(ranks - [0.25, 0.5, 0.75]).max() < 0.02
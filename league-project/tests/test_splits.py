@@ -0,0 +1,45 @@
+"""
+Tests de la división train/test por índices.
+"""
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from league_project.splits import split_indices, split_targets
+
+
+def _model_table(n=40):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'kill_diff': rng.integers(-10, 10, n),
+        'gamelength': rng.integers(25, 50, n),
+        'bResult': (np.arange(n) % 4 == 0).astype(int),
+        'Year': np.repeat([2016, 2015, 2017, 2016], n // 4),
+        'Season': np.tile(['Summer', 'Spring_Playoffs', 'Spring', 'Summer_Season'], n // 4),
+    })
+
+
+class TestSplitIndices:
+    def test_random_and_stratified_share_one_shuffle_for_all_targets(self):
+        df = _model_table()
+        indices = split_indices(df, test_size=0.25, random_state=42)
+        expected_train, expected_test = train_test_split(df['kill_diff'], test_size=0.25, random_state=42)
+        assert df.index[indices['train']].tolist() == expected_train.index.tolist()
+        assert df.index[indices['test']].tolist() == expected_test.index.tolist()
+
+        y_reg_train, y_reg_test, y_cls_train, y_cls_test = split_targets(df, indices)
+        assert y_reg_train.index.equals(y_cls_train.index) and y_reg_test.index.equals(y_cls_test.index)
+
+        stratified = split_indices(df, test_size=0.2, random_state=1, mode='stratified')
+        assert df['bResult'].iloc[stratified['test']].mean() == df['bResult'].mean()
+
+    def test_temporal_puts_most_recent_games_in_test(self):
+        df = _model_table()
+        indices = split_indices(df, test_size=0.3, mode='temporal')
+        train, test = df.iloc[indices['train']], df.iloc[indices['test']]
+
+        assert len(test) == 12 and sorted(np.concatenate(list(indices.values()))) == list(range(len(df)))
+        assert (test['Year'] == 2017).sum() == 10
+        # Dentro de 2016, Summer_Season y Summer van después de Spring
+        assert set(test.loc[test['Year'] == 2016, 'Season']) <= {'Summer', 'Summer_Season'}
+        assert train['Year'].max() <= 2016